@@ -1,29 +1,223 @@
 """FastAPI application for Issue Positions API."""
-from fastapi import FastAPI, Depends, HTTPException
+import asyncio
+import logging
+import sys
+import time
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Depends, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
-from typing import Optional
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from sqlalchemy import and_, exists, false, or_, select
+from sqlalchemy.orm import load_only
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date, datetime
+from typing import Optional, Sequence
 
 from .models import (
-    get_db,
+    AsyncSessionLocal,
+    async_engine,
+    get_async_db,
     Member,
-    Issue,
     Position,
+    Evidence,
     Bill,
     Vote,
     Statement,
+    StatementIssue,
     DataMetadata,
     Chamber,
     Party,
     VoteChoice,
+    EvidenceType,
+    name_key,
+)
+from .services.cache import (
+    POSITIONS_DATA_TYPES,
+    DefaultJSONResponse,
+    get_data_version,
+    positions_cache,
+    render_json,
+)
+from .services.conditional import conditional_response
+from .services.export import EXPORT_DATASETS, EXPORT_FORMATS, export_query, stream_export
+from .services.metrics import (
+    install_sql_hooks,
+    metrics_registry,
+    server_timing,
+    start_request,
 )
+from .services.pagination import DEFAULT_PAGE_SIZE, clamp_page_size, paginate_statements
+from .services.reference import IssueRef, reference_store
+from .services.search import search_statements
+from .services.snapshot import snapshot_store
+from .services.statement_scores import statement_scores_query
+from .settings import settings
+from .services.fields import (
+    MEMBER_STATEMENT_FIELDS,
+    POSITION_FIELDS,
+    STATEMENT_FIELDS,
+    STATEMENT_MEMBER_FIELDS,
+    parse_fields,
+    parse_text_mode,
+    position_load_options,
+    serialize_position_member,
+    serialize_statement,
+    statement_load_options,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def warm_caches(db: AsyncSession) -> int:
+    """
+    Pre-build the positions payloads of every issue (all members and each
+    chamber, default fields) for the current data version.
+
+    Returns the number of payloads built.
+    """
+    reference = await reference_store.get(db)
+    version = await get_data_version(db, POSITIONS_DATA_TYPES)
+    built = 0
+    for issue in reference.issues:
+        for chamber in (None, Chamber.SENATE, Chamber.HOUSE):
+            payload = await build_positions_payload(db, issue, chamber, POSITION_FIELDS)
+            positions_cache.set((issue.slug, chamber, POSITION_FIELDS), version, render_json(payload))
+            built += 1
+    return built
+
+
+async def load_and_warm(refresh: bool = False):
+    """(Re)load reference data and warm the caches; refresh only on change."""
+    async with AsyncSessionLocal() as db:
+        if refresh:
+            if not await reference_store.refresh_if_changed(db):
+                return
+        else:
+            await reference_store.load(db)
+        if settings.warm_cache:
+            reference_store.warmed_payloads = await warm_caches(db)
+        reference_store.warmed_at = datetime.utcnow()
+
+
+async def poll_reference_data():
+    """Reload and re-warm whenever a refresh records new DataMetadata."""
+    while True:
+        await asyncio.sleep(settings.reference_refresh_seconds)
+        try:
+            await load_and_warm(refresh=True)
+        except Exception:
+            logger.exception("Reference data refresh failed")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load reference data and warm caches before serving requests."""
+    try:
+        await load_and_warm()
+    except Exception:
+        # Keep serving; /api/_ready reports not ready until a refresh works
+        logger.exception("Startup cache warming failed")
+    poller = asyncio.create_task(poll_reference_data())
+    try:
+        yield
+    finally:
+        poller.cancel()
+        try:
+            await poller
+        except asyncio.CancelledError:
+            pass
+
 
 app = FastAPI(
     title="Issue Positions API",
     description="API for congressional position data on policy issues",
     version="0.1.0",
+    default_response_class=DefaultJSONResponse,
+    lifespan=lifespan,
 )
 
+
+install_sql_hooks(async_engine)
+
+
+def route_label(scope: Scope, snapshot: bool) -> str:
+    """Metrics label of a request: its route template."""
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    return "snapshot" if snapshot else "unmatched"
+
+
+class RequestMiddleware:
+    """
+    Snapshot serving and request metrics, as one pure ASGI middleware.
+
+    GET requests for exported URLs are answered from the pre-rendered
+    snapshot when it is enabled and rendered from the current data
+    version. Every request's latency and SQL counts are recorded for
+    /api/_metrics once its last body chunk is sent, so streamed responses
+    (exports) include the queries run while streaming.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = start_request()
+        started = time.perf_counter()
+        status = None
+        recorded = False
+
+        handler = self.app
+        snapshot = None
+        if scope["method"] == "GET":
+            reference = reference_store.data
+            snapshot = snapshot_store.response(Request(scope), reference.version if reference else None)
+            if snapshot is not None:
+                handler = snapshot
+
+        def record(final_status: int):
+            nonlocal recorded
+            if not recorded:
+                recorded = True
+                label = route_label(scope, snapshot is not None)
+                elapsed = time.perf_counter() - started
+                metrics_registry.record(scope["method"], label, final_status, elapsed, stats)
+
+        async def send_and_record(message: Message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if settings.debug:
+                    MutableHeaders(scope=message).append(
+                        "Server-Timing", server_timing(stats, time.perf_counter() - started)
+                    )
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                record(status)
+
+        try:
+            await handler(scope, receive, send_and_record)
+        except Exception:
+            # Unhandled errors become a 500 further out; count them as one
+            record(500)
+            raise
+        if status is not None:
+            # Disconnected before the body was complete
+            record(status)
+
+
+# Registered before CORS so CORS headers still wrap snapshot responses
+app.add_middleware(RequestMiddleware)
+
+
 # CORS for frontend
 app.add_middleware(
     CORSMiddleware,
@@ -35,114 +229,132 @@ app.add_middleware(
 
 
 @app.get("/")
-def root():
+async def root():
     return {"message": "Issue Positions API", "version": "0.1.0"}
 
 
 @app.get("/api/issues")
-def get_issues(db: Session = Depends(get_db)):
+async def get_issues(request: Request, db: AsyncSession = Depends(get_async_db)):
     """Get all available issues."""
-    issues = db.query(Issue).all()
-    return [
-        {
+    async def build(version):
+        issues = (await reference_store.get(db)).issues
+        return [
+            {
+                "id": issue.id,
+                "name": issue.name,
+                "slug": issue.slug,
+                "description": issue.description,
+                "spectrum_left_label": issue.spectrum_left_label,
+                "spectrum_right_label": issue.spectrum_right_label,
+            }
+            for issue in issues
+        ]
+
+    # Issues have no metadata row, so only the content hash validates them
+    return await conditional_response(request, db, (), build)
+
+
+@app.get("/api/issues/{slug}")
+async def get_issue(slug: str, request: Request, db: AsyncSession = Depends(get_async_db)):
+    """Get a specific issue by slug."""
+    async def build(version):
+        issue = await reference_store.issue(db, slug)
+        if not issue:
+            raise HTTPException(status_code=404, detail="Issue not found")
+
+        return {
             "id": issue.id,
             "name": issue.name,
             "slug": issue.slug,
             "description": issue.description,
             "spectrum_left_label": issue.spectrum_left_label,
             "spectrum_right_label": issue.spectrum_right_label,
+            "spectrum_description": issue.spectrum_description,
         }
-        for issue in issues
-    ]
-
 
-@app.get("/api/issues/{slug}")
-def get_issue(slug: str, db: Session = Depends(get_db)):
-    """Get a specific issue by slug."""
-    issue = db.query(Issue).filter(Issue.slug == slug).first()
-    if not issue:
-        raise HTTPException(status_code=404, detail="Issue not found")
-
-    return {
-        "id": issue.id,
-        "name": issue.name,
-        "slug": issue.slug,
-        "description": issue.description,
-        "spectrum_left_label": issue.spectrum_left_label,
-        "spectrum_right_label": issue.spectrum_right_label,
-        "spectrum_description": issue.spectrum_description,
-    }
+    return await conditional_response(request, db, (), build)
 
 
 @app.get("/api/issues/{slug}/positions")
-def get_positions(
+async def get_positions(
     slug: str,
+    request: Request,
     chamber: Optional[str] = None,
-    db: Session = Depends(get_db),
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """Get all member positions for an issue."""
-    issue = db.query(Issue).filter(Issue.slug == slug).first()
-    if not issue:
-        raise HTTPException(status_code=404, detail="Issue not found")
+    """
+    Get all member positions for an issue.
 
-    query = db.query(Position).filter(Position.issue_id == issue.id)
+    `fields` selects a subset of the per-member fields (e.g.
+    `member_id,party,score`); unrequested columns are never loaded.
+    Serialized payloads are cached per (slug, chamber, fields) until the
+    positions or members metadata records a newer refresh.
+    """
+    chamber_value = None
+    if chamber and chamber.lower() in ("senate", "house"):
+        chamber_value = Chamber(chamber.lower())
+    selected = parse_fields(fields, POSITION_FIELDS)
 
-    positions = query.all()
+    async def build(version):
+        cache_key = (slug, chamber_value, selected)
+        body = positions_cache.get(cache_key, version)
+        if body is not None:
+            return body
 
-    result = []
-    for pos in positions:
-        member = db.query(Member).filter(Member.id == pos.member_id).first()
-        if not member:
-            continue
+        issue = await reference_store.issue(db, slug)
+        if not issue:
+            raise HTTPException(status_code=404, detail="Issue not found")
 
-        # Filter by chamber if specified
-        if chamber:
-            if chamber.lower() == "senate" and member.chamber != Chamber.SENATE:
-                continue
-            if chamber.lower() == "house" and member.chamber != Chamber.HOUSE:
-                continue
+        payload = await build_positions_payload(db, issue, chamber_value, selected)
+        return positions_cache.set(cache_key, version, render_json(payload))
 
-        result.append({
-            "member_id": member.id,
-            "name": member.name,
-            "state": member.state,
-            "party": member.party.value,
-            "chamber": member.chamber.value,
-            "photo_url": member.photo_url,
-            "score": pos.score,
-            "confidence": pos.confidence,
-            "evidence_count": pos.evidence_count,
-        })
-
-    # Sort by score
-    result.sort(key=lambda x: x["score"])
-
-    # Find members without positions
-    positioned_ids = {p["member_id"] for p in result}
-
-    # Get all members in the chamber
-    member_query = db.query(Member)
-    if chamber:
-        if chamber.lower() == "senate":
-            member_query = member_query.filter(Member.chamber == Chamber.SENATE)
-        elif chamber.lower() == "house":
-            member_query = member_query.filter(Member.chamber == Chamber.HOUSE)
-
-    all_members = member_query.all()
-    no_data = []
-    for member in all_members:
-        if member.id not in positioned_ids:
-            no_data.append({
-                "member_id": member.id,
-                "name": member.name,
-                "state": member.state,
-                "party": member.party.value,
-                "chamber": member.chamber.value,
-                "photo_url": member.photo_url,
-            })
-
-    # Sort no_data by name
-    no_data.sort(key=lambda x: x["name"])
+    return await conditional_response(request, db, POSITIONS_DATA_TYPES, build)
+
+
+async def build_positions_payload(
+    db: AsyncSession,
+    issue: IssueRef,
+    chamber: Optional[Chamber] = None,
+    fields: Sequence[str] = POSITION_FIELDS,
+) -> dict:
+    """
+    Build the positions response for an issue, optionally for one chamber.
+
+    fields limits the per-member entries (no_data entries carry the
+    member fields among them).
+    """
+    chamber_filter = None
+    if chamber is not None:
+        chamber_filter = Member.chamber == chamber
+
+    # Positions joined to their members in one query, sorted by score
+    # (ties keep row order)
+    load_options = position_load_options(fields)
+    position_query = (
+        select(Position, Member)
+        .join(Member, Member.id == Position.member_id)
+        .where(Position.issue_id == issue.id)
+        .options(*load_options)
+    )
+    if chamber_filter is not None:
+        position_query = position_query.where(chamber_filter)
+    rows = (await db.execute(position_query.order_by(Position.score, Position.id))).all()
+
+    result = [serialize_position_member(member, fields, pos) for pos, member in rows]
+    parties = [member.party.value for _, member in rows]
+
+    # Members in the chamber without a position (anti-join)
+    has_position = exists().where(
+        Position.member_id == Member.id,
+        Position.issue_id == issue.id,
+    )
+    member_query = select(Member).where(~has_position).options(load_options[0])
+    if chamber_filter is not None:
+        member_query = member_query.where(chamber_filter)
+    members = (await db.scalars(member_query.order_by(Member.name, Member.id))).all()
+
+    no_data = [serialize_position_member(member, fields) for member in members]
 
     return {
         "issue": {
@@ -159,178 +371,657 @@ def get_positions(
             "total": len(result),
             "no_data_count": len(no_data),
             "by_party": {
-                "D": len([p for p in result if p["party"] == "D"]),
-                "R": len([p for p in result if p["party"] == "R"]),
-                "I": len([p for p in result if p["party"] == "I"]),
+                "D": parties.count("D"),
+                "R": parties.count("R"),
+                "I": parties.count("I"),
             },
         },
     }
 
 
+MAX_MATRIX_ISSUES = 25
+
+
+@app.get("/api/positions/matrix")
+async def get_positions_matrix(
+    request: Request,
+    issues: str,
+    chamber: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Get scores for several issues side by side, in columnar form.
+
+    `issues` is a comma-separated list of issue slugs. The response has one
+    set of member columns and, per issue, score and confidence arrays
+    parallel to them (null where a member has no position), so any pair of
+    issues can be plotted against each other from a single request.
+    """
+    slugs = list(dict.fromkeys(s.strip() for s in issues.split(",") if s.strip()))
+    if not slugs:
+        raise HTTPException(status_code=400, detail="issues must list at least one slug")
+    if len(slugs) > MAX_MATRIX_ISSUES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_MATRIX_ISSUES} issues per request",
+        )
+
+    chamber_value = None
+    if chamber and chamber.lower() in ("senate", "house"):
+        chamber_value = Chamber(chamber.lower())
+
+    async def build(version):
+        # One entry per set of issues, whatever order they were asked in
+        sorted_slugs = tuple(sorted(slugs))
+        cache_key = ("matrix", sorted_slugs, chamber_value)
+        payload = positions_cache.get(cache_key, version)
+        if payload is None:
+            by_slug = {slug: await reference_store.issue(db, slug) for slug in slugs}
+            missing = [slug for slug, issue in by_slug.items() if issue is None]
+            if missing:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Issue not found: {', '.join(missing)}",
+                )
+
+            payload = await build_positions_matrix(
+                db, [by_slug[slug] for slug in sorted_slugs], chamber_value
+            )
+            positions_cache.set(cache_key, version, payload)
+        return render_json(order_matrix_columns(payload, slugs))
+
+    return await conditional_response(request, db, POSITIONS_DATA_TYPES, build)
+
+
+async def build_positions_matrix(
+    db: AsyncSession,
+    issues: Sequence[IssueRef],
+    chamber: Optional[Chamber] = None,
+) -> dict:
+    """
+    Build the columnar positions matrix for the given issues.
+
+    Members (sorted by name) are left-joined to their positions on any of
+    the issues in one query, then pivoted into per-issue columns.
+    """
+    issue_slugs = {issue.id: issue.slug for issue in issues}
+    query = (
+        select(
+            Member.id,
+            Member.name,
+            Member.state,
+            Member.party,
+            Member.chamber,
+            Position.issue_id,
+            Position.score,
+            Position.confidence,
+        )
+        .outerjoin(
+            Position,
+            (Position.member_id == Member.id) & Position.issue_id.in_(issue_slugs),
+        )
+        .order_by(Member.name, Member.id)
+    )
+    if chamber is not None:
+        query = query.where(Member.chamber == chamber)
+    rows = (await db.execute(query)).all()
+
+    members = {"member_id": [], "name": [], "state": [], "party": [], "chamber": []}
+    scores = {slug: [] for slug in issue_slugs.values()}
+    confidence = {slug: [] for slug in issue_slugs.values()}
+
+    for member_id, name, state, party, member_chamber, issue_id, score, conf in rows:
+        # Rows for the same member are adjacent; start a new column entry
+        # on the first one
+        if not members["member_id"] or members["member_id"][-1] != member_id:
+            members["member_id"].append(member_id)
+            members["name"].append(name)
+            members["state"].append(state)
+            members["party"].append(party.value)
+            members["chamber"].append(member_chamber.value)
+            for slug in issue_slugs.values():
+                scores[slug].append(None)
+                confidence[slug].append(None)
+        if issue_id is not None:
+            slug = issue_slugs[issue_id]
+            scores[slug][-1] = score
+            confidence[slug][-1] = conf
+
+    return {
+        "issues": [
+            {
+                "slug": issue.slug,
+                "name": issue.name,
+                "spectrum_left_label": issue.spectrum_left_label,
+                "spectrum_right_label": issue.spectrum_right_label,
+            }
+            for issue in issues
+        ],
+        "members": members,
+        "scores": scores,
+        "confidence": confidence,
+    }
+
+
+def order_matrix_columns(payload: dict, slugs: Sequence[str]) -> dict:
+    """A matrix payload with its issue columns in the given slug order."""
+    issues = {issue["slug"]: issue for issue in payload["issues"]}
+    return {
+        "issues": [issues[slug] for slug in slugs],
+        "members": payload["members"],
+        "scores": {slug: payload["scores"][slug] for slug in slugs},
+        "confidence": {slug: payload["confidence"][slug] for slug in slugs},
+    }
+
+
+MEMBER_INCLUDES = ("statements", "evidence")
+
+
+async def filter_statements_by_issue(db: AsyncSession, query, slug: str):
+    """Restrict a statement query to one issue through statement_issues."""
+    issue = await reference_store.issue(db, slug)
+    if issue is None:
+        return query.where(false())
+    return (
+        query.join(StatementIssue, StatementIssue.statement_id == Statement.id)
+        .where(StatementIssue.issue_id == issue.id)
+    )
+
+
+def prefix_upper_bound(prefix: str) -> Optional[str]:
+    """
+    The smallest string above every string that starts with prefix, or
+    None if there is none (the prefix is all U+10FFFF).
+    """
+    prefix = prefix.rstrip(chr(sys.maxunicode))
+    if not prefix:
+        return None
+    following = ord(prefix[-1]) + 1
+    if 0xD800 <= following <= 0xDFFF:
+        # Surrogates can't be stored; nothing sorts between them
+        following = 0xE000
+    return prefix[:-1] + chr(following)
+
+
+def name_prefix(key_column, prefix: str):
+    """Condition that a name key column starts with name_key(prefix)."""
+    low = name_key(prefix)
+    high = prefix_upper_bound(low)
+    if high is None:
+        return key_column >= low
+    return and_(key_column >= low, key_column < high)
+
+
+MAX_MEMBER_IDS = 600
+MEMBER_LIST_LIMIT = 100
+MEMBER_CARD_FIELDS = ("id", "name", "state", "party", "chamber", "photo_url")
+
+
+@app.get("/api/members")
+async def get_members(
+    request: Request,
+    ids: Optional[str] = None,
+    state: Optional[str] = None,
+    party: Optional[str] = None,
+    chamber: Optional[str] = None,
+    q: Optional[str] = None,
+    limit: int = MEMBER_LIST_LIMIT,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Look up many members at once as compact cards.
+
+    `ids` is a comma-separated list of bioguide IDs (ids not found or
+    filtered out are listed under `missing`); `state`, `party` and
+    `chamber` filter, and `q` is a case-insensitive prefix of the full or
+    last name. Without `ids`
+    the result is capped at `limit` members, sorted by name.
+    """
+    id_list = []
+    if ids:
+        id_list = list(dict.fromkeys(i.strip() for i in ids.split(",") if i.strip()))
+        if len(id_list) > MAX_MEMBER_IDS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {MAX_MEMBER_IDS} ids per request",
+            )
+    limit = max(1, min(limit, MAX_MEMBER_IDS))
+
+    async def build(version):
+        query = select(Member).options(
+            load_only(*(getattr(Member, field) for field in MEMBER_CARD_FIELDS))
+        )
+        if id_list:
+            query = query.where(Member.id.in_(id_list))
+        if state:
+            query = query.where(Member.state == state.upper())
+        if party and party.upper() in ("D", "R", "I"):
+            query = query.where(Member.party == Party(party.upper()))
+        if chamber and chamber.lower() in ("senate", "house"):
+            query = query.where(Member.chamber == Chamber(chamber.lower()))
+        if q and q.strip():
+            # Range scans on the name_key/last_name_key indexes
+            query = query.where(
+                or_(name_prefix(Member.name_key, q.strip()), name_prefix(Member.last_name_key, q.strip()))
+            )
+        query = query.order_by(Member.name, Member.id)
+        if not id_list:
+            query = query.limit(limit)
+
+        members = (await db.scalars(query)).all()
+        result = {
+            "members": [
+                {
+                    "id": m.id,
+                    "name": m.name,
+                    "state": m.state,
+                    "party": m.party.value,
+                    "chamber": m.chamber.value,
+                    "photo_url": m.photo_url,
+                }
+                for m in members
+            ],
+            "count": len(members),
+        }
+        if id_list:
+            found = {m.id for m in members}
+            result["missing"] = [i for i in id_list if i not in found]
+        return result
+
+    return await conditional_response(request, db, ("members",), build)
+
+
 @app.get("/api/members/{member_id}")
-def get_member(member_id: str, db: Session = Depends(get_db)):
-    """Get detailed member information with positions and evidence."""
-    member = db.query(Member).filter(Member.id == member_id).first()
-    if not member:
-        raise HTTPException(status_code=404, detail="Member not found")
-
-    # Get positions
-    positions = db.query(Position).filter(Position.member_id == member_id).all()
-
-    # Get votes as evidence
-    votes = db.query(Vote).filter(Vote.member_id == member_id).all()
-
-    vote_evidence = []
-    for vote in votes:
-        bill = db.query(Bill).filter(Bill.id == vote.bill_id).first()
-        if bill:
-            vote_evidence.append({
+async def get_member(
+    member_id: str,
+    request: Request,
+    include: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Get detailed member information with positions and evidence.
+
+    `include` is a comma-separated list of extra sections:
+    `statements` adds the first page of the member's statements and
+    `evidence` adds analyzed statement evidence and the per-issue statement
+    scores aggregated from it, so the member panel can load everything in
+    one request with a fixed number of queries.
+    """
+    includes = {part.strip() for part in (include or "").split(",") if part.strip()}
+    unknown = includes.difference(MEMBER_INCLUDES)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown include: {', '.join(sorted(unknown))}",
+        )
+
+    data_types = ["members", "votes", "positions"]
+    if "statements" in includes:
+        data_types.append("statements")
+
+    async def build(version):
+        member = await db.get(Member, member_id)
+        if not member:
+            raise HTTPException(status_code=404, detail="Member not found")
+
+        # Get positions
+        positions = (
+            await db.scalars(
+                select(Position)
+                .where(Position.member_id == member_id)
+                .order_by(Position.id)
+            )
+        ).all()
+
+        # Votes joined to their bills in one query
+        votes = (
+            await db.execute(
+                select(Vote, Bill)
+                .join(Bill, Bill.id == Vote.bill_id)
+                .where(Vote.member_id == member_id)
+                .order_by(Vote.id)
+            )
+        ).all()
+
+        vote_evidence = [
+            {
                 "bill_id": bill.id,
                 "bill_title": bill.short_title or bill.title,
                 "vote": vote.vote.value,
                 "vote_date": vote.vote_date.isoformat() if vote.vote_date else None,
                 "bill_position_indicator": bill.position_indicator,
-            })
+            }
+            for vote, bill in votes
+        ]
 
-    return {
-        "id": member.id,
-        "name": member.name,
-        "first_name": member.first_name,
-        "last_name": member.last_name,
-        "state": member.state,
-        "party": member.party.value,
-        "chamber": member.chamber.value,
-        "photo_url": member.photo_url,
-        "positions": [
-            {
-                "issue_id": pos.issue_id,
-                "score": pos.score,
-                "confidence": pos.confidence,
+        result = {
+            "id": member.id,
+            "name": member.name,
+            "first_name": member.first_name,
+            "last_name": member.last_name,
+            "state": member.state,
+            "party": member.party.value,
+            "chamber": member.chamber.value,
+            "photo_url": member.photo_url,
+            "positions": [
+                {
+                    "issue_id": pos.issue_id,
+                    "score": pos.score,
+                    "confidence": pos.confidence,
+                }
+                for pos in positions
+            ],
+            "evidence": {
+                "votes": vote_evidence,
+            },
+        }
+
+        if "evidence" in includes:
+            evidence = (
+                await db.execute(
+                    select(Evidence, Position.issue_id)
+                    .join(Position, Position.id == Evidence.position_id)
+                    .where(
+                        Position.member_id == member_id,
+                        Evidence.type == EvidenceType.STATEMENT,
+                    )
+                    .order_by(Evidence.source_date.desc(), Evidence.id.desc())
+                )
+            ).all()
+            result["evidence"]["statements"] = [
+                {
+                    "id": ev.id,
+                    "issue_id": issue_id,
+                    "source_url": ev.source_url,
+                    "source_name": ev.source_name,
+                    "source_date": ev.source_date.isoformat() if ev.source_date else None,
+                    "extracted_position": ev.extracted_position,
+                    "extraction_confidence": ev.extraction_confidence,
+                    "extraction_reasoning": ev.extraction_reasoning,
+                    "weight": ev.weight,
+                }
+                for ev, issue_id in evidence
+            ]
+            statement_scores = await db.execute(statement_scores_query(member_ids=[member_id]))
+            result["evidence"]["statement_scores"] = [
+                {
+                    "issue_id": row.issue_id,
+                    "score": row.statement_score,
+                    "confidence": row.statement_confidence,
+                    "statement_count": row.statement_count,
+                }
+                for row in statement_scores
+            ]
+
+        if "statements" in includes:
+            query = select(Statement).where(Statement.member_id == member_id)
+            statements, next_cursor = await paginate_statements(db, query, DEFAULT_PAGE_SIZE)
+            result["statements"] = {
+                "statements": [
+                    serialize_statement(stmt, MEMBER_STATEMENT_FIELDS)
+                    for stmt in statements
+                ],
+                "count": len(statements),
+                "limit": DEFAULT_PAGE_SIZE,
+                "next": next_cursor,
             }
-            for pos in positions
-        ],
-        "evidence": {
-            "votes": vote_evidence,
-        },
-    }
+
+        return result
+
+    return await conditional_response(request, db, data_types, build)
 
 
 @app.get("/api/members/{member_id}/statements")
-def get_member_statements(
+async def get_member_statements(
     member_id: str,
+    request: Request,
     issue: Optional[str] = None,
-    db: Session = Depends(get_db),
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    text: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """Get statements for a specific member, optionally filtered by issue."""
-    member = db.query(Member).filter(Member.id == member_id).first()
-    if not member:
-        raise HTTPException(status_code=404, detail="Member not found")
+    """
+    Get statements for a specific member, optionally filtered by issue.
 
-    query = db.query(Statement).filter(Statement.member_id == member_id)
+    Results are paged newest first; pass the returned `next` cursor to
+    fetch the following page. `fields` selects a subset of statement
+    fields and `text=preview` returns only the start of each text.
+    """
+    limit = clamp_page_size(limit)
+    selected = parse_fields(fields, MEMBER_STATEMENT_FIELDS)
+    text_mode = parse_text_mode(text)
 
-    # Filter by issue if specified
-    if issue:
-        # Use JSON contains check (SQLite syntax)
-        query = query.filter(Statement.issue_tags.contains(issue))
+    async def build(version):
+        member = await db.get(Member, member_id)
+        if not member:
+            raise HTTPException(status_code=404, detail="Member not found")
 
-    # Order by date, most recent first
-    statements = query.order_by(Statement.source_date.desc()).all()
+        query = (
+            select(Statement)
+            .where(Statement.member_id == member_id)
+            .options(*statement_load_options(selected, text_mode))
+        )
 
-    return {
-        "member_id": member_id,
-        "member_name": member.name,
-        "statements": [
-            {
-                "id": stmt.id,
-                "text": stmt.text,
-                "title": stmt.title,
-                "source": stmt.source,
-                "source_url": stmt.source_url,
-                "source_date": stmt.source_date.isoformat() if stmt.source_date else None,
-                "cr_page": stmt.cr_page,
-                "issue_tags": stmt.issue_tags,
-                "analyzed": stmt.analyzed,
-            }
-            for stmt in statements
-        ],
-        "count": len(statements),
-    }
+        # Filter by issue if specified
+        if issue:
+            query = await filter_statements_by_issue(db, query, issue)
+
+        # Most recent first, one page at a time
+        statements, next_cursor = await paginate_statements(db, query, limit, cursor)
+
+        return {
+            "member_id": member_id,
+            "member_name": member.name,
+            "statements": [
+                serialize_statement(stmt, selected, text_mode)
+                for stmt in statements
+            ],
+            "count": len(statements),
+            "limit": limit,
+            "next": next_cursor,
+        }
+
+    return await conditional_response(request, db, ("members", "statements"), build)
 
 
 @app.get("/api/statements")
-def get_statements(
+async def get_statements(
+    request: Request,
+    issue: Optional[str] = None,
+    member_id: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    text: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Get all statements, optionally filtered by issue or member.
+
+    Results are paged newest first; pass the returned `next` cursor to
+    fetch the following page. `fields` selects a subset of statement
+    fields and `text=preview` returns only the start of each text.
+    """
+    limit = clamp_page_size(limit)
+    selected = parse_fields(fields, STATEMENT_FIELDS)
+    text_mode = parse_text_mode(text)
+
+    async def build(version):
+        query = select(Statement).options(*statement_load_options(selected, text_mode))
+
+        if issue:
+            query = await filter_statements_by_issue(db, query, issue)
+
+        if member_id:
+            query = query.where(Statement.member_id == member_id)
+
+        # Most recent first, one page at a time
+        statements, next_cursor = await paginate_statements(db, query, limit, cursor)
+
+        # Member names from the reference data, only if asked for
+        members = {}
+        if any(field in STATEMENT_MEMBER_FIELDS for field in selected):
+            members = await reference_store.members_by_id(
+                db, {stmt.member_id for stmt in statements}
+            )
+
+        result = [
+            serialize_statement(stmt, selected, text_mode, members.get(stmt.member_id))
+            for stmt in statements
+        ]
+
+        return {
+            "statements": result,
+            "count": len(result),
+            "limit": limit,
+            "next": next_cursor,
+        }
+
+    return await conditional_response(request, db, ("statements", "members"), build)
+
+
+@app.get("/api/statements/search")
+async def search_statement_text(
+    q: str,
+    request: Request,
+    member_id: Optional[str] = None,
+    issue: Optional[str] = None,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Full-text search over statement titles and text.
+
+    Results are ranked by BM25 and carry a highlighted snippet, with
+    matched terms wrapped in <mark> tags. Filter by member, issue slug
+    and an inclusive since/until date range.
+    """
+    limit = clamp_page_size(limit)
+
+    async def build(version):
+        issue_id = None
+        if issue:
+            issue_ref = await reference_store.issue(db, issue)
+            if not issue_ref:
+                raise HTTPException(status_code=404, detail="Issue not found")
+            issue_id = issue_ref.id
+
+        results = await search_statements(
+            db,
+            q,
+            limit,
+            member_id=member_id,
+            issue_id=issue_id,
+            since=since,
+            until=until,
+        )
+        return {
+            "query": q,
+            "results": results,
+            "count": len(results),
+            "limit": limit,
+        }
+
+    return await conditional_response(request, db, ("statements", "members"), build)
+
+
+@app.get("/api/export/{dataset}.{fmt}")
+async def export_dataset(
+    dataset: str,
+    fmt: str,
     issue: Optional[str] = None,
     member_id: Optional[str] = None,
-    limit: int = 50,
-    db: Session = Depends(get_db),
+    chamber: Optional[str] = None,
 ):
-    """Get all statements, optionally filtered by issue or member."""
-    query = db.query(Statement)
-
-    if issue:
-        query = query.filter(Statement.issue_tags.contains(issue))
-
-    if member_id:
-        query = query.filter(Statement.member_id == member_id)
-
-    # Order by date, most recent first
-    statements = query.order_by(Statement.source_date.desc()).limit(limit).all()
-
-    result = []
-    for stmt in statements:
-        member = db.query(Member).filter(Member.id == stmt.member_id).first()
-        result.append({
-            "id": stmt.id,
-            "member_id": stmt.member_id,
-            "member_name": member.name if member else "Unknown",
-            "member_party": member.party.value if member else None,
-            "member_state": member.state if member else None,
-            "text": stmt.text,
-            "title": stmt.title,
-            "source": stmt.source,
-            "source_url": stmt.source_url,
-            "source_date": stmt.source_date.isoformat() if stmt.source_date else None,
-            "cr_page": stmt.cr_page,
-            "issue_tags": stmt.issue_tags,
-        })
+    """
+    Stream a full dataset (votes, statements or positions) as NDJSON or CSV.
+
+    Optional filters: `issue` slug, `member_id` and `chamber`. Rows are
+    streamed as they are read, so exports of any size use constant memory.
+    """
+    if dataset not in EXPORT_DATASETS:
+        raise HTTPException(status_code=404, detail="Export not found")
+    if fmt not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Format must be one of: {', '.join(EXPORT_FORMATS)}",
+        )
+
+    chamber_value = None
+    if chamber and chamber.lower() in ("senate", "house"):
+        chamber_value = Chamber(chamber.lower())
+
+    query = export_query(dataset, issue=issue, member_id=member_id, chamber=chamber_value)
+    return StreamingResponse(
+        stream_export(query, fmt),
+        media_type=EXPORT_FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{dataset}.{fmt}"'},
+    )
+
 
+@app.get("/api/_ready", include_in_schema=False)
+async def get_readiness():
+    """Readiness probe: 200 once reference data is loaded and caches are warm."""
+    reference = reference_store.data
+    if reference is None or reference_store.warmed_at is None:
+        return JSONResponse({"status": "warming"}, status_code=503)
     return {
-        "statements": result,
-        "count": len(result),
-        "limit": limit,
+        "status": "ready",
+        "issues": len(reference.issues),
+        "members": len(reference.members),
+        "reference_loaded_at": reference.loaded_at.isoformat(),
+        "warmed_at": reference_store.warmed_at.isoformat(),
+        "warmed_payloads": reference_store.warmed_payloads,
     }
 
 
+@app.get("/api/_metrics", include_in_schema=False)
+async def get_metrics():
+    """Per-route latency and SQL metrics in Prometheus text format."""
+    return PlainTextResponse(
+        metrics_registry.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
 @app.get("/api/metadata")
-def get_metadata(db: Session = Depends(get_db)):
+async def get_metadata(request: Request, db: AsyncSession = Depends(get_async_db)):
     """Get data freshness metadata."""
-    metadata_list = db.query(DataMetadata).all()
-
-    result = {}
-    for m in metadata_list:
-        result[m.data_type] = {
-            "last_updated": m.last_updated.isoformat() if m.last_updated else None,
-            "record_count": m.record_count,
-            "source": m.source,
-            "is_stale": m.is_stale,
-            "age_days": m.age_days,
-        }
+    async def build(version):
+        metadata_list = (await db.scalars(select(DataMetadata))).all()
 
-    # Find the most recent update across all data types
-    if metadata_list:
-        most_recent = max(m.last_updated for m in metadata_list)
-        oldest = min(m.last_updated for m in metadata_list)
-        any_stale = any(m.is_stale for m in metadata_list)
-    else:
-        most_recent = None
-        oldest = None
-        any_stale = True
+        result = {}
+        for m in metadata_list:
+            result[m.data_type] = {
+                "last_updated": m.last_updated.isoformat() if m.last_updated else None,
+                "record_count": m.record_count,
+                "source": m.source,
+                "is_stale": m.is_stale,
+                "age_days": m.age_days,
+            }
 
-    return {
-        "data_types": result,
-        "summary": {
-            "last_updated": most_recent.isoformat() if most_recent else None,
-            "oldest_data": oldest.isoformat() if oldest else None,
-            "any_stale": any_stale,
-        },
-    }
+        # Find the most recent update across all data types
+        if metadata_list:
+            most_recent = max(m.last_updated for m in metadata_list)
+            oldest = min(m.last_updated for m in metadata_list)
+            any_stale = any(m.is_stale for m in metadata_list)
+        else:
+            most_recent = None
+            oldest = None
+            any_stale = True
+
+        return {
+            "data_types": result,
+            "summary": {
+                "last_updated": most_recent.isoformat() if most_recent else None,
+                "oldest_data": oldest.isoformat() if oldest else None,
+                "any_stale": any_stale,
+            },
+        }
+
+    # age_days and is_stale change with the clock, so validate on content only
+    return await conditional_response(request, db, (), build)
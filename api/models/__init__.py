@@ -1,36 +1,65 @@
 """Database models for the Issue Positions API."""
-from .database import Base, engine, SessionLocal, get_db, init_db
+from .database import (
+    Base,
+    engine,
+    async_engine,
+    SessionLocal,
+    AsyncSessionLocal,
+    get_db,
+    get_async_db,
+    init_db,
+)
 from .models import (
     Member,
     Issue,
     Position,
     Evidence,
     Bill,
+    BillIssue,
     Vote,
     Statement,
+    StatementIssue,
     DataMetadata,
+    SchemaMigration,
     Chamber,
     Party,
     VoteChoice,
     EvidenceType,
+    STATEMENT_EVIDENCE,
+    name_key,
 )
+from .issue_tags import sync_issue_tags
+from .upsert import upsert
+from .migrations import run_migrations, pending_migrations
 
 __all__ = [
     # Database
     "Base",
     "engine",
+    "async_engine",
     "SessionLocal",
+    "AsyncSessionLocal",
     "get_db",
+    "get_async_db",
     "init_db",
+    "run_migrations",
+    "pending_migrations",
+    "sync_issue_tags",
+    "upsert",
+    "name_key",
     # Models
     "Member",
     "Issue",
     "Position",
     "Evidence",
     "Bill",
+    "BillIssue",
     "Vote",
     "Statement",
+    "StatementIssue",
     "DataMetadata",
+    "SchemaMigration",
+    "STATEMENT_EVIDENCE",
     # Enums
     "Chamber",
     "Party",
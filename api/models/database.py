@@ -1,21 +1,122 @@
 """Database connection and session management."""
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from pathlib import Path
+from typing import Optional
 
-# Database path
-DATABASE_PATH = Path(__file__).parent.parent.parent / "data" / "issue_positions.db"
-DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
+from ..settings import PROJECT_ROOT, settings
 
-# Create engine
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False},  # Needed for SQLite
-    echo=False,
+# Drivers used when DATABASE_URL names only the backend. psycopg (3)
+# provides both the sync and the async PostgreSQL driver.
+SYNC_DRIVERS = {
+    "postgresql": "postgresql+psycopg",
+}
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+psycopg",
+}
+
+
+def _sqlite_path(url) -> Optional[Path]:
+    """Absolute path of a SQLite database file (relative to the project root)."""
+    if not url.database or url.database == ":memory:":
+        return None
+    path = Path(url.database)
+    return path if path.is_absolute() else (PROJECT_ROOT / path).resolve()
+
+
+def _async_url(url) -> str:
+    """Derive the API's async URL from the sync DATABASE_URL."""
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {backend}; set ASYNC_DATABASE_URL")
+    if backend == "sqlite" and DATABASE_PATH is not None:
+        # The API opens the file read-only, so it can never take the write lock
+        return f"sqlite+aiosqlite:///file:{DATABASE_PATH}?mode=ro&uri=true"
+    return url.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
+_url = make_url(settings.database_url)
+if _url.drivername in SYNC_DRIVERS:
+    _url = _url.set(drivername=SYNC_DRIVERS[_url.drivername])
+IS_SQLITE = _url.get_backend_name() == "sqlite"
+DATABASE_PATH = _sqlite_path(_url) if IS_SQLITE else None
+DATABASE_URL = (
+    f"sqlite:///{DATABASE_PATH}" if DATABASE_PATH
+    else _url.render_as_string(hide_password=False)
 )
+ASYNC_DATABASE_URL = settings.async_database_url or _async_url(_url)
+
+# Per-connection SQLite settings. WAL lets the API keep reading while a
+# refresh writes; synchronous=NORMAL is durable enough in WAL mode.
+SQLITE_PRAGMAS = {
+    "synchronous": "NORMAL",
+    "cache_size": -64000,       # ~64 MB page cache (negative = KiB)
+    "mmap_size": 268435456,     # Map up to 256 MB of the file
+    "busy_timeout": 5000,       # Wait up to 5 s for a lock instead of failing
+    "temp_store": "MEMORY",
+}
+
+
+def _set_pragmas(dbapi_connection, journal_mode=None):
+    cursor = dbapi_connection.cursor()
+    try:
+        if journal_mode:
+            cursor.execute(f"PRAGMA journal_mode={journal_mode}")
+        for name, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def _engine_options(read_only: bool = False) -> dict:
+    """Keyword arguments for create_engine/create_async_engine."""
+    options = {"echo": settings.db_echo}
+    if IS_SQLITE:
+        if not read_only:
+            options["connect_args"] = {"check_same_thread": False}  # Needed for SQLite
+        return options
 
-# Session factory
+    # Server databases: a bounded, self-healing connection pool per process
+    options.update(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        pool_recycle=settings.db_pool_recycle,
+    )
+    if read_only and ASYNC_DATABASE_URL.startswith("postgresql+psycopg"):
+        # Same guarantee as mode=ro on SQLite: API sessions can't write
+        options["connect_args"] = {"options": "-c default_transaction_read_only=on"}
+    return options
+
+
+# Writer engine (used by the scripts). journal_mode=WAL is persistent, so
+# setting it here also applies to the read-only API connections.
+engine = create_engine(DATABASE_URL, **_engine_options())
+
+# Read-only async engine (used by the API)
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **_engine_options(read_only=True))
+
+if IS_SQLITE:
+    @event.listens_for(engine, "connect")
+    def _configure_writer(dbapi_connection, connection_record):
+        _set_pragmas(dbapi_connection, journal_mode="WAL")
+
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def _configure_reader(dbapi_connection, connection_record):
+        _set_pragmas(dbapi_connection)
+
+
+# Session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 # Base class for models
 Base = declarative_base()
@@ -30,13 +131,23 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """Dependency for FastAPI to get async database sessions."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def init_db():
     """Initialize the database, creating all tables."""
     # Import all models to ensure they're registered
     from . import models  # noqa: F401
 
     # Ensure data directory exists
-    DATABASE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    if DATABASE_PATH is not None:
+        DATABASE_PATH.parent.mkdir(parents=True, exist_ok=True)
 
-    # Create all tables
+    # Create all tables, then record (or apply) schema migrations
     Base.metadata.create_all(bind=engine)
+
+    from .migrations import run_migrations
+    run_migrations(engine)
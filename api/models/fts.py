@@ -0,0 +1,60 @@
+"""
+SQLite FTS5 full-text index over statement titles and text.
+
+The index is an external-content FTS5 table: it stores only the token
+index and reads title/text back from the statements table, so it adds
+little to the file size. Triggers keep it in sync on every write.
+"""
+from sqlalchemy import Column, Integer, MetaData, Table, Text, text
+from sqlalchemy.engine import Connection
+
+# Kept out of Base.metadata: create_all can't create virtual tables, so
+# the migration owns the DDL and this table object is only for queries.
+statements_fts = Table(
+    "statements_fts",
+    MetaData(),
+    Column("rowid", Integer, primary_key=True),
+    Column("title", Text),
+    Column("text", Text),
+)
+
+FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS statements_fts USING fts5(
+        title,
+        text,
+        content='statements',
+        content_rowid='id',
+        tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS statements_fts_insert AFTER INSERT ON statements BEGIN
+        INSERT INTO statements_fts(rowid, title, text)
+        VALUES (new.id, new.title, new.text);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS statements_fts_delete AFTER DELETE ON statements BEGIN
+        INSERT INTO statements_fts(statements_fts, rowid, title, text)
+        VALUES ('delete', old.id, old.title, old.text);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS statements_fts_update AFTER UPDATE OF title, text ON statements BEGIN
+        INSERT INTO statements_fts(statements_fts, rowid, title, text)
+        VALUES ('delete', old.id, old.title, old.text);
+        INSERT INTO statements_fts(rowid, title, text)
+        VALUES (new.id, new.title, new.text);
+    END
+    """,
+]
+
+
+def create_statement_fts(conn: Connection):
+    """Create the FTS5 table and triggers, then index existing statements."""
+    if conn.dialect.name != "sqlite":
+        return
+    for statement in FTS_DDL:
+        conn.execute(text(statement))
+    conn.execute(text("INSERT INTO statements_fts(statements_fts) VALUES ('rebuild')"))
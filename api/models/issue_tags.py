@@ -0,0 +1,50 @@
+"""Keep the issue-tag junction tables in sync with the JSON tag columns."""
+from sqlalchemy import delete, insert, select
+
+from .models import Bill, BillIssue, Issue, Statement, StatementIssue
+
+# (tagged model, junction model, junction column holding the entity id)
+TAGGED_MODELS = (
+    (Bill, BillIssue, BillIssue.bill_id),
+    (Statement, StatementIssue, StatementIssue.statement_id),
+)
+
+
+def sync_issue_tags(bind) -> int:
+    """
+    Rebuild bill_issues and statement_issues from the issue_tags columns.
+
+    The collectors and seeders write issue slugs into the JSON columns;
+    this maps them to issue ids and inserts/deletes junction rows so the
+    two agree. Slugs without an Issue row are ignored until the issue is
+    created. bind can be a Session or a Connection; the caller commits.
+
+    Returns the number of junction rows added or removed.
+    """
+    slug_ids = dict(bind.execute(select(Issue.slug, Issue.id)).all())
+    changed = 0
+
+    for model, link, entity_column in TAGGED_MODELS:
+        wanted = set()
+        for entity_id, tags in bind.execute(select(model.id, model.issue_tags)):
+            for slug in tags or []:
+                if slug in slug_ids:
+                    wanted.add((entity_id, slug_ids[slug]))
+
+        existing = set(bind.execute(select(entity_column, link.issue_id)).all())
+
+        to_add = wanted - existing
+        if to_add:
+            bind.execute(
+                insert(link),
+                [{entity_column.key: entity_id, "issue_id": issue_id} for entity_id, issue_id in to_add],
+            )
+
+        for entity_id, issue_id in existing - wanted:
+            bind.execute(
+                delete(link).where(entity_column == entity_id, link.issue_id == issue_id)
+            )
+
+        changed += len(to_add) + len(existing - wanted)
+
+    return changed
@@ -0,0 +1,240 @@
+"""
+Schema migrations for existing database files.
+
+New databases get the full schema from Base.metadata.create_all. Changes
+that create_all cannot apply to a database that already exists (new
+columns, indexes, constraints, derived tables) are registered here as
+numbered migrations and recorded in the schema_migrations table once
+applied.
+"""
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+from sqlalchemy import and_, bindparam, column, delete, func, inspect, select, table, update
+from sqlalchemy.schema import CreateIndex
+from sqlalchemy.engine import Connection, Engine
+
+from .database import engine as default_engine
+from .fts import create_statement_fts
+from .issue_tags import sync_issue_tags
+from .models import (
+    Bill,
+    BillIssue,
+    Evidence,
+    EvidenceType,
+    Member,
+    Position,
+    SchemaMigration,
+    Statement,
+    StatementIssue,
+    Vote,
+    name_key,
+)
+
+# (version, name, function) in the order they must run
+MIGRATIONS: List[Tuple[int, str, Callable[[Connection], None]]] = []
+
+
+def migration(version: int, name: str):
+    """Register a migration function under a version number."""
+    def register(func: Callable[[Connection], None]):
+        MIGRATIONS.append((version, name, func))
+        MIGRATIONS.sort(key=lambda m: m[0])
+        return func
+    return register
+
+
+def _create_indexes(conn: Connection, table, names: List[str]):
+    """Create the named indexes of a table if they don't exist yet."""
+    # IF NOT EXISTS rather than checkfirst: reflection can't see
+    # expression indexes on SQLite
+    for index in table.indexes:
+        if index.name in names:
+            conn.execute(CreateIndex(index, if_not_exists=True))
+
+
+def _drop_duplicates(conn: Connection, model, key: List[str], references: List[Tuple[str, str]] = ()):
+    """
+    Delete all but the newest (highest id) row per key, ahead of a unique
+    index on it. references lists (table, column) pairs pointing at the
+    model's id; they are moved to the kept row first.
+    """
+    source = model.__table__
+    key_columns = [source.c[name] for name in key]
+    newest = (
+        select(*key_columns, func.max(source.c.id).label("keep_id"))
+        .where(*(c.isnot(None) for c in key_columns))
+        .group_by(*key_columns)
+        .having(func.count() > 1)
+        .subquery()
+    )
+    duplicates = conn.execute(
+        select(source.c.id.label("old_id"), newest.c.keep_id)
+        .join(newest, and_(*(source.c[name] == newest.c[name] for name in key)))
+        .where(source.c.id != newest.c.keep_id)
+    ).mappings().all()
+    if not duplicates:
+        return
+
+    # Bare table()/column() so no onupdate columns (which may not exist
+    # yet on an old database) are added to the UPDATE
+    for table_name, column_name in references:
+        referencing = table(table_name, column(column_name))
+        conn.execute(
+            update(referencing)
+            .where(referencing.c[column_name] == bindparam("old_id"))
+            .values({column_name: bindparam("keep_id")}),
+            [dict(row) for row in duplicates],
+        )
+    conn.execute(
+        delete(source).where(source.c.id == bindparam("old_id")),
+        [{"old_id": row["old_id"]} for row in duplicates],
+    )
+
+
+@migration(1, "hot_path_indexes")
+def add_hot_path_indexes(conn: Connection):
+    """Indexes and unique keys for the columns the API and scoring filter on."""
+    # Older databases may hold duplicate votes or positions; keep the newest
+    _drop_duplicates(conn, Vote, ["member_id", "bill_id", "roll_call_id"], [("evidence", "vote_id")])
+    _drop_duplicates(conn, Position, ["member_id", "issue_id"], [("evidence", "position_id")])
+    _create_indexes(conn, Vote.__table__, ["uq_votes_member_bill_roll_call", "ix_votes_bill_id"])
+    _create_indexes(conn, Position.__table__, ["uq_positions_member_issue", "ix_positions_issue_score"])
+    _create_indexes(conn, Statement.__table__, ["ix_statements_member_date", "ix_statements_date_id"])
+    _create_indexes(conn, Evidence.__table__, ["ix_evidence_position_id"])
+
+
+@migration(2, "issue_tag_junction_tables")
+def add_issue_tag_junction_tables(conn: Connection):
+    """Normalized bill/statement issue tags, backfilled from the JSON columns."""
+    BillIssue.__table__.create(conn, checkfirst=True)
+    StatementIssue.__table__.create(conn, checkfirst=True)
+    _create_indexes(conn, BillIssue.__table__, ["ix_bill_issues_issue_bill"])
+    _create_indexes(conn, StatementIssue.__table__, ["ix_statement_issues_issue_statement"])
+    sync_issue_tags(conn)
+
+
+@migration(3, "statement_fts")
+def add_statement_fts(conn: Connection):
+    """FTS5 index over statement title/text, kept in sync by triggers."""
+    create_statement_fts(conn)
+
+
+@migration(4, "member_name_indexes")
+def add_member_name_indexes(conn: Connection):
+    """Lower-case name indexes for member prefix search (replaced by migration 7)."""
+    conn.exec_driver_sql("CREATE INDEX IF NOT EXISTS ix_members_name_lower ON members (lower(name))")
+    conn.exec_driver_sql("CREATE INDEX IF NOT EXISTS ix_members_last_name_lower ON members (lower(last_name))")
+
+
+@migration(5, "change_tracking_columns")
+def add_change_tracking_columns(conn: Connection):
+    """updated_at on bills, votes and evidence, for incremental rescoring."""
+    for model in (Bill, Vote, Evidence):
+        table = model.__table__
+        existing = {column["name"] for column in inspect(conn).get_columns(table.name)}
+        if "updated_at" not in existing:
+            column_type = table.c.updated_at.type.compile(dialect=conn.dialect)
+            conn.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN updated_at {column_type}")
+            # Existing rows count as unchanged since they were created
+            conn.execute(update(table).values(updated_at=table.c.created_at))
+    _create_indexes(conn, Vote.__table__, ["ix_votes_updated_at"])
+    _create_indexes(conn, Evidence.__table__, ["ix_evidence_updated_at"])
+
+
+@migration(6, "statement_evidence_key")
+def add_statement_evidence_key(conn: Connection):
+    """Unique key on statement evidence so analyses can be upserted."""
+    keyed = (
+        Evidence.type == EvidenceType.STATEMENT,
+        Evidence.source_url.isnot(None),
+        Evidence.source_date.isnot(None),
+    )
+    # Keep the oldest of any duplicates, the one analyze_statements.py updated
+    first = (
+        select(func.min(Evidence.id))
+        .where(*keyed)
+        .group_by(Evidence.position_id, Evidence.source_url, Evidence.source_date)
+    )
+    conn.execute(delete(Evidence).where(*keyed, Evidence.id.not_in(first)))
+    _create_indexes(conn, Evidence.__table__, ["uq_evidence_position_statement"])
+
+
+@migration(7, "member_name_keys")
+def add_member_name_keys(conn: Connection):
+    """
+    Python-folded name keys for member prefix search, replacing the
+    lower() indexes: SQLite's lower() only folds ASCII.
+    """
+    members = Member.__table__
+    existing = {column["name"] for column in inspect(conn).get_columns(members.name)}
+    for name in ("name_key", "last_name_key"):
+        if name not in existing:
+            column_type = members.c[name].type.compile(dialect=conn.dialect)
+            conn.exec_driver_sql(f"ALTER TABLE members ADD COLUMN {name} {column_type}")
+
+    rows = conn.execute(select(members.c.id, members.c.name, members.c.last_name)).all()
+    if rows:
+        # Bare table()/column() so updated_at isn't bumped
+        keyed = table("members", column("id"), column("name_key"), column("last_name_key"))
+        conn.execute(
+            update(keyed)
+            .where(keyed.c.id == bindparam("member_id"))
+            .values(name_key=bindparam("new_name_key"), last_name_key=bindparam("new_last_name_key")),
+            [
+                {"member_id": id, "new_name_key": name_key(name), "new_last_name_key": name_key(last_name)}
+                for id, name, last_name in rows
+            ],
+        )
+
+    conn.exec_driver_sql("DROP INDEX IF EXISTS ix_members_name_lower")
+    conn.exec_driver_sql("DROP INDEX IF EXISTS ix_members_last_name_lower")
+    _create_indexes(conn, members, ["ix_members_name_key", "ix_members_last_name_key"])
+
+
+def applied_versions(conn: Connection) -> set:
+    """Return the migration versions already recorded in the database."""
+    if not inspect(conn).has_table(SchemaMigration.__tablename__):
+        return set()
+    return set(conn.execute(select(SchemaMigration.version)).scalars())
+
+
+def pending_migrations(bind: Engine = default_engine) -> List[Tuple[int, str]]:
+    """List migrations that have not been applied yet, without writing anything."""
+    database = bind.url.database
+    if bind.dialect.name == "sqlite" and database and database != ":memory:" and not Path(database).exists():
+        # Connecting would create the file; nothing has been applied to it
+        return [(version, name) for version, name, _ in MIGRATIONS]
+    with bind.connect() as conn:
+        applied = applied_versions(conn)
+    return [(version, name) for version, name, _ in MIGRATIONS if version not in applied]
+
+
+def run_migrations(bind: Engine = default_engine) -> List[Tuple[int, str]]:
+    """
+    Apply every pending migration, each in its own transaction.
+
+    Returns the (version, name) pairs that were applied. A migration that
+    fails is rolled back and stops the run, leaving later ones pending.
+    """
+    applied_now = []
+    with bind.begin() as conn:
+        SchemaMigration.__table__.create(conn, checkfirst=True)
+        applied = applied_versions(conn)
+
+    for version, name, apply in MIGRATIONS:
+        if version in applied:
+            continue
+        with bind.begin() as conn:
+            apply(conn)
+            conn.execute(
+                SchemaMigration.__table__.insert().values(
+                    version=version,
+                    name=name,
+                    applied_at=datetime.utcnow(),
+                )
+            )
+        applied_now.append((version, name))
+
+    return applied_now
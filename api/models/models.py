@@ -1,5 +1,8 @@
 """SQLAlchemy models for the Issue Positions database."""
+import unicodedata
 from datetime import datetime
+from typing import Optional
+
 from sqlalchemy import (
     Column,
     String,
@@ -10,8 +13,10 @@ from sqlalchemy import (
     ForeignKey,
     Enum,
     JSON,
+    Index,
+    text,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import query_expression, relationship
 import enum
 
 from .database import Base
@@ -45,6 +50,27 @@ class EvidenceType(enum.Enum):
     RATING = "rating"
 
 
+def name_key(value: Optional[str]) -> Optional[str]:
+    """
+    Search key of a name: NFKC-normalized and case-folded in Python, so
+    matching doesn't depend on what the database's lower() folds.
+    """
+    if value is None:
+        return None
+    return unicodedata.normalize("NFKC", value).casefold()
+
+
+def _name_key_default(column: str):
+    """Column default deriving a name key from another inserted column."""
+    def default(context):
+        return name_key(context.get_current_parameters().get(column))
+    return default
+
+
+# Keys are compared by code point; Postgres' default collation wouldn't
+NameKey = String(255).with_variant(String(255, collation="C"), "postgresql")
+
+
 class Member(Base):
     """
     Congressional members (Senators and Representatives).
@@ -64,6 +90,12 @@ class Member(Base):
     current_term_start = Column(DateTime)
     photo_url = Column(String(500))
 
+    # name_key(name) and name_key(last_name), for prefix search
+    # (GET /api/members?q=). Filled in on insert; writers that update
+    # names set them too
+    name_key = Column(NameKey, default=_name_key_default("name"), index=True)
+    last_name_key = Column(NameKey, default=_name_key_default("last_name"), index=True)
+
     # Metadata
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -117,6 +149,12 @@ class Position(Base):
     Score range: -1.0 (left of spectrum) to +1.0 (right of spectrum)
     """
     __tablename__ = "positions"
+    __table_args__ = (
+        # One position per member per issue
+        Index("uq_positions_member_issue", "member_id", "issue_id", unique=True),
+        # Issue spectrum, already in score order
+        Index("ix_positions_issue_score", "issue_id", "score"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     member_id = Column(String(7), ForeignKey("members.id"), nullable=False)
@@ -148,6 +186,11 @@ class Position(Base):
         return f"<Position {self.member_id} on {self.issue_id}: {self.score:.2f}>"
 
 
+# Predicate of the partial unique key on statement evidence; ON CONFLICT
+# targets must repeat it verbatim
+STATEMENT_EVIDENCE = text("type = 'STATEMENT'")
+
+
 class Evidence(Base):
     """
     Supporting evidence for a member's position.
@@ -156,6 +199,19 @@ class Evidence(Base):
     Each piece of evidence contributes to the overall position score.
     """
     __tablename__ = "evidence"
+    __table_args__ = (
+        Index("ix_evidence_position_id", "position_id"),
+        # One evidence row per analyzed statement source for a position
+        Index(
+            "uq_evidence_position_statement",
+            "position_id", "source_url", "source_date",
+            unique=True,
+            sqlite_where=STATEMENT_EVIDENCE,
+            postgresql_where=STATEMENT_EVIDENCE,
+        ),
+        # Incremental rescoring looks for evidence changed since a position was scored
+        Index("ix_evidence_updated_at", "updated_at"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     position_id = Column(Integer, ForeignKey("positions.id"), nullable=False)
@@ -180,6 +236,7 @@ class Evidence(Base):
 
     # Metadata
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
     position = relationship("Position", back_populates="evidence")
@@ -218,6 +275,7 @@ class Bill(Base):
     introduced_date = Column(DateTime)
     latest_action_date = Column(DateTime)
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
     votes = relationship("Vote", back_populates="bill", cascade="all, delete-orphan")
@@ -226,6 +284,25 @@ class Bill(Base):
         return f"<Bill {self.id}: {self.short_title or self.title[:50]}>"
 
 
+class BillIssue(Base):
+    """
+    Issue tags for bills, normalized out of Bill.issue_tags.
+
+    Kept in sync with the JSON column by api.models.issue_tags so that
+    issue filters are exact-match index lookups.
+    """
+    __tablename__ = "bill_issues"
+    __table_args__ = (
+        Index("ix_bill_issues_issue_bill", "issue_id", "bill_id"),
+    )
+
+    bill_id = Column(String(50), ForeignKey("bills.id", ondelete="CASCADE"), primary_key=True)
+    issue_id = Column(Integer, ForeignKey("issues.id", ondelete="CASCADE"), primary_key=True)
+
+    def __repr__(self):
+        return f"<BillIssue {self.bill_id} -> {self.issue_id}>"
+
+
 class Vote(Base):
     """
     Individual member votes on bills.
@@ -234,6 +311,13 @@ class Vote(Base):
     used as evidence for positions on related issues.
     """
     __tablename__ = "votes"
+    __table_args__ = (
+        # One vote per member per roll call on a bill
+        Index("uq_votes_member_bill_roll_call", "member_id", "bill_id", "roll_call_id", unique=True),
+        Index("ix_votes_bill_id", "bill_id"),
+        # Incremental rescoring looks for votes changed since a position was scored
+        Index("ix_votes_updated_at", "updated_at"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     member_id = Column(String(7), ForeignKey("members.id"), nullable=False)
@@ -249,6 +333,7 @@ class Vote(Base):
 
     # Metadata
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
     member = relationship("Member", back_populates="votes")
@@ -267,6 +352,10 @@ class Statement(Base):
     relevant statements become Evidence records linked to Positions.
     """
     __tablename__ = "statements"
+    __table_args__ = (
+        Index("ix_statements_member_date", "member_id", "source_date"),
+        Index("ix_statements_date_id", "source_date", "id"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     member_id = Column(String(7), ForeignKey("members.id"), nullable=False)
@@ -275,6 +364,10 @@ class Statement(Base):
     text = Column(Text, nullable=False, doc="Full text of the statement")
     title = Column(String(500), doc="Title or topic if available")
 
+    # Leading slice of text, populated only by queries that ask for it
+    # with with_expression() (list views in preview mode)
+    text_preview = query_expression()
+
     # Source information
     source = Column(String(50), default="congressional_record",
                     doc="Source: 'congressional_record', 'press_release', etc.")
@@ -304,6 +397,42 @@ class Statement(Base):
         return f"<Statement {self.id} by {self.member_id}: {preview}>"
 
 
+class StatementIssue(Base):
+    """
+    Issue tags for statements, normalized out of Statement.issue_tags.
+
+    Kept in sync with the JSON column by api.models.issue_tags so that
+    issue filters are exact-match index lookups.
+    """
+    __tablename__ = "statement_issues"
+    __table_args__ = (
+        Index("ix_statement_issues_issue_statement", "issue_id", "statement_id"),
+    )
+
+    statement_id = Column(Integer, ForeignKey("statements.id", ondelete="CASCADE"), primary_key=True)
+    issue_id = Column(Integer, ForeignKey("issues.id", ondelete="CASCADE"), primary_key=True)
+
+    def __repr__(self):
+        return f"<StatementIssue {self.statement_id} -> {self.issue_id}>"
+
+
+class SchemaMigration(Base):
+    """
+    Migrations applied to this database file.
+
+    Written by api.models.migrations so that schema changes can be added
+    to existing databases in place.
+    """
+    __tablename__ = "schema_migrations"
+
+    version = Column(Integer, primary_key=True, autoincrement=False)
+    name = Column(String(100), nullable=False)
+    applied_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<SchemaMigration {self.version}: {self.name}>"
+
+
 class DataMetadata(Base):
     """
     Tracks when different data types were last updated.
@@ -0,0 +1,82 @@
+"""Dialect-specific INSERT ... ON CONFLICT DO UPDATE for the write paths."""
+from typing import Iterable, Mapping, Optional, Sequence
+
+from sqlalchemy import func, or_
+from sqlalchemy.dialects import postgresql, sqlite
+
+# Dialects with an insert() that supports on_conflict_do_update
+DIALECT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+def upsert(
+    db,
+    model,
+    rows: Sequence[Mapping],
+    index_elements: Iterable[str],
+    update_columns: Optional[Iterable[str]] = None,
+    keep_existing_on_null: bool = False,
+    skip_unchanged: bool = False,
+    index_where=None,
+):
+    """
+    Insert rows, updating the existing row on a unique-key conflict.
+
+    index_elements names the unique key (primary key or unique
+    constraint); index_where is the predicate of a partial unique index.
+    update_columns defaults to every other column present in the rows.
+    With keep_existing_on_null, a None in the new row keeps the stored
+    value. With skip_unchanged, existing rows whose update columns already
+    hold the new values are not updated, so their onupdate timestamps
+    (also when given in update_columns) stay put. Works with a Session or a Connection; the caller commits.
+    Returns the number of rows inserted or changed.
+    """
+    if not rows:
+        return 0
+    dialect = db.get_bind().dialect.name if hasattr(db, "get_bind") else db.dialect.name
+    if dialect not in DIALECT_INSERTS:
+        raise NotImplementedError(f"Upserts are not supported on {dialect}")
+
+    table = model.__table__
+    index_elements = list(index_elements)
+    if update_columns is None:
+        update_columns = [key for key in rows[0] if key not in index_elements]
+
+    stmt = DIALECT_INSERTS[dialect](table)
+    set_ = {}
+    for column in update_columns:
+        new_value = stmt.excluded[column]
+        if keep_existing_on_null:
+            new_value = func.coalesce(new_value, table.c[column])
+        set_[column] = new_value
+
+    changed = None
+    if set_ and skip_unchanged:
+        # onupdate columns (timestamps) differ on every run; compare the data
+        compared = [column for column in set_ if table.c[column].onupdate is None]
+        if compared:
+            changed = or_(*(table.c[column].is_distinct_from(set_[column]) for column in compared))
+
+    # Core upserts skip Column(onupdate=...), so apply those explicitly
+    if set_:
+        for column in table.columns:
+            if column.onupdate is not None and column.name not in set_:
+                default = column.onupdate
+                set_[column.name] = default.arg(None) if default.is_callable else default.arg
+
+    if set_:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=index_elements, index_where=index_where, set_=set_, where=changed
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=index_elements, index_where=index_where)
+
+    rows = [dict(row) for row in rows]
+    if dialect == "postgresql":
+        # psycopg reports no rowcount for executemany; RETURNING yields
+        # exactly the rows that were inserted or updated
+        stmt = stmt.returning(*table.primary_key.columns)
+        return len(db.execute(stmt, rows).all())
+    return db.execute(stmt, rows).rowcount
@@ -0,0 +1,118 @@
+"""In-process response caching keyed on data freshness metadata."""
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable, Optional, Tuple
+
+from fastapi.responses import JSONResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import DataMetadata
+from ..settings import settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - falls back to the stdlib encoder
+    orjson = None
+
+
+async def get_data_version(db: AsyncSession, data_types: Iterable[str]) -> Tuple:
+    """
+    Return a version token for the given data types.
+
+    The token is built from the DataMetadata.last_updated values, so it
+    changes whenever one of the scripts records a refresh. Data types
+    without a metadata row contribute None.
+    """
+    data_types = tuple(data_types)
+    result = await db.execute(
+        select(DataMetadata.data_type, DataMetadata.last_updated)
+        .where(DataMetadata.data_type.in_(data_types))
+    )
+    rows = dict(result.all())
+    return tuple(rows.get(data_type) for data_type in data_types)
+
+
+def render_json(content: Any) -> bytes:
+    """
+    Serialize content to compact UTF-8 JSON.
+
+    Uses orjson when it is installed (several times faster on the large
+    positions payloads), otherwise matches FastAPI's default JSONResponse.
+    """
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class DefaultJSONResponse(JSONResponse):
+    """
+    Response class for anything not rendered through render_json.
+
+    Encodes with orjson like fastapi's ORJSONResponse, which is deprecated
+    and warns on every response; falls back to the stdlib encoder.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        return super().render(content)
+
+
+class ResponseCache:
+    """
+    Thread-safe store of serialized response bodies.
+
+    Each entry remembers the data version it was built from; a lookup
+    with a different version is a miss, so entries invalidate themselves
+    as soon as the underlying data is refreshed. When max_entries is set
+    the least recently used entries are evicted first.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self._entries = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, version: Tuple) -> Optional[Any]:
+        """Return the cached value for key if it was built from version."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is None or entry[0] != version:
+            return None
+        return entry[1]
+
+    def set(self, key: Hashable, version: Tuple, value: Any) -> Any:
+        """Store a value for key at the given version and return it."""
+        with self._lock:
+            self._entries[key] = (version, value)
+            self._entries.move_to_end(key)
+            if self._max_entries is not None:
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+        return value
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self):
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Positions change only when calculate_scores.py runs; member fields
+# (names, photos) are embedded in the payload, so both are tracked.
+POSITIONS_DATA_TYPES = ("positions", "members")
+
+positions_cache = ResponseCache(max_entries=settings.positions_cache_entries)
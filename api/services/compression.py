@@ -0,0 +1,73 @@
+"""Negotiated gzip/brotli compression for JSON response bodies."""
+import gzip
+from typing import Optional
+
+from .cache import ResponseCache
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+# Bodies smaller than this are sent as-is; compression would not pay off
+MIN_COMPRESS_SIZE = 1024
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+# Compressed bodies per (ETag, encoding). The ETag already identifies
+# the exact body, so entries never go stale.
+compressed_cache = ResponseCache(max_entries=1024)
+
+
+def supported_encodings() -> tuple:
+    """Encodings this server can produce, in order of preference."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick a content coding from an Accept-Encoding header.
+
+    Returns the supported coding with the highest non-zero q-value (ties
+    go to the server's preference), or None to send the body uncompressed.
+    """
+    if not accept_encoding:
+        return None
+
+    accepted = {}
+    for part in accept_encoding.split(","):
+        coding, *params = part.split(";")
+        coding = coding.strip().lower()
+        q = 1.0
+        for param in params:
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding:
+            accepted[coding] = q
+
+    best, best_q = None, 0.0
+    for encoding in supported_encodings():
+        q = accepted.get(encoding, accepted.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress a body with the given content coding."""
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def compressed_body(body: bytes, encoding: str, etag: str) -> bytes:
+    """Compress a body, reusing the cached result for the same ETag."""
+    cached = compressed_cache.get((etag, encoding), ())
+    if cached is not None:
+        return cached
+    return compressed_cache.set((etag, encoding), (), compress(body, encoding))
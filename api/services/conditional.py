@@ -0,0 +1,154 @@
+"""HTTP validators (ETag / Last-Modified) and conditional 304 responses."""
+import hashlib
+import inspect
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Callable, Iterable, Optional, Tuple
+
+from fastapi import Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .cache import ResponseCache, get_data_version, render_json
+from .compression import MIN_COMPRESS_SIZE, choose_encoding, compressed_body
+
+# ETags (and body sizes) already computed per URL and data version. A
+# repeat request whose If-None-Match matches is answered without
+# building the payload.
+etag_cache = ResponseCache(max_entries=4096)
+
+CONTENT_CODINGS = ("gzip", "br")
+
+
+def make_etag(version: Tuple, body: bytes) -> str:
+    """Build a strong ETag from the data version and a hash of the body."""
+    digest = hashlib.sha256(repr(version).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(body)
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def encoded_etag(etag: str, encoding: Optional[str]) -> str:
+    """ETag of a compressed variant: the identity ETag with a coding suffix."""
+    if encoding is None:
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag (weak comparison).
+
+    Compressed variants of the same body count as a match.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        for coding in CONTENT_CODINGS:
+            suffix = f'-{coding}"'
+            if candidate.endswith(suffix):
+                candidate = candidate[:-len(suffix)] + '"'
+        if candidate == etag:
+            return True
+    return False
+
+
+def not_modified_since(if_modified_since: Optional[str], last_modified: Optional[datetime]) -> bool:
+    """Check an If-Modified-Since header against a naive UTC timestamp."""
+    if not if_modified_since or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    modified = last_modified.replace(microsecond=0, tzinfo=timezone.utc)
+    return modified <= since
+
+
+def http_date(value: datetime) -> str:
+    """Format a naive UTC timestamp as an HTTP date."""
+    return format_datetime(value.replace(tzinfo=timezone.utc), usegmt=True)
+
+
+def validator_headers(etag: Optional[str], last_modified: Optional[datetime]) -> dict:
+    """Headers sent on both 200 and 304 responses."""
+    headers = {"Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if etag is not None:
+        headers["ETag"] = etag
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+async def conditional_response(
+    request: Request,
+    db: AsyncSession,
+    data_types: Iterable[str],
+    build: Callable[[Tuple], Any],
+) -> Response:
+    """
+    Serve a JSON payload with validators, answering 304 when possible.
+
+    data_types names the DataMetadata rows the payload depends on. When
+    every one of them has a metadata row and this URL was already served
+    at that version, the version is enough to answer If-None-Match and
+    If-Modified-Since without calling build. Otherwise the payload is
+    built (so missing resources still 404) and its ETag is compared,
+    which still saves the transfer.
+
+    build receives the data version and returns (or, when it is a
+    coroutine function, resolves to) either a dict/list or an already
+    serialized body. Bodies of MIN_COMPRESS_SIZE bytes or more are sent
+    gzip- or brotli-compressed when the client accepts it.
+    """
+    data_types = tuple(data_types)
+    version = await get_data_version(db, data_types) if data_types else ()
+    versioned = bool(version) and all(v is not None for v in version)
+    last_modified = max(version) if versioned else None
+
+    if_none_match = request.headers.get("if-none-match")
+    accept_encoding = request.headers.get("accept-encoding")
+    key = (request.url.path, request.url.query)
+
+    if versioned:
+        known_etag, known_size = etag_cache.get(key, version) or (None, 0)
+        if known_etag is not None:
+            encoding = choose_encoding(accept_encoding) if known_size >= MIN_COMPRESS_SIZE else None
+            known_etag = encoded_etag(known_etag, encoding)
+        if if_none_match:
+            if known_etag is not None and etag_matches(if_none_match, known_etag):
+                return Response(
+                    status_code=304,
+                    headers=validator_headers(known_etag, last_modified),
+                )
+        elif known_etag is not None and not_modified_since(
+            request.headers.get("if-modified-since"), last_modified
+        ):
+            return Response(
+                status_code=304,
+                headers=validator_headers(known_etag, last_modified),
+            )
+
+    content = build(version)
+    if inspect.isawaitable(content):
+        content = await content
+    body = content if isinstance(content, bytes) else render_json(content)
+    etag = make_etag(version, body)
+    if versioned:
+        etag_cache.set(key, version, (etag, len(body)))
+
+    encoding = choose_encoding(accept_encoding) if len(body) >= MIN_COMPRESS_SIZE else None
+    headers = validator_headers(encoded_etag(etag, encoding), last_modified)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    if encoding is not None:
+        body = compressed_body(body, encoding, etag)
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,168 @@
+"""Streaming bulk exports of votes, statements and positions."""
+import csv
+import enum
+import io
+from datetime import datetime
+from typing import AsyncIterator, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import Select, select
+
+from ..models import (
+    AsyncSessionLocal,
+    Bill,
+    BillIssue,
+    Chamber,
+    Issue,
+    Member,
+    Position,
+    Statement,
+    StatementIssue,
+    Vote,
+)
+from .cache import render_json
+
+EXPORT_DATASETS = ("votes", "statements", "positions")
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+# Rows fetched per round trip; also the rows per streamed chunk
+EXPORT_BATCH_SIZE = 1000
+
+
+def export_query(
+    dataset: str,
+    issue: Optional[str] = None,
+    member_id: Optional[str] = None,
+    chamber: Optional[Chamber] = None,
+) -> Select:
+    """Build the column query for an export, with optional filters."""
+    if dataset == "votes":
+        query = select(
+            Vote.id,
+            Vote.member_id,
+            Vote.bill_id,
+            Bill.congress,
+            Vote.roll_call_id,
+            Vote.session,
+            Vote.vote_date,
+            Vote.vote,
+        ).join(Bill, Bill.id == Vote.bill_id)
+        if issue:
+            query = query.where(
+                Vote.bill_id.in_(
+                    select(BillIssue.bill_id)
+                    .join(Issue, Issue.id == BillIssue.issue_id)
+                    .where(Issue.slug == issue)
+                )
+            )
+        if member_id:
+            query = query.where(Vote.member_id == member_id)
+        if chamber is not None:
+            query = query.where(
+                Vote.member_id.in_(select(Member.id).where(Member.chamber == chamber))
+            )
+        return query.order_by(Vote.id)
+
+    if dataset == "statements":
+        query = select(
+            Statement.id,
+            Statement.member_id,
+            Statement.source_date,
+            Statement.title,
+            Statement.source,
+            Statement.source_url,
+            Statement.cr_page,
+            Statement.congress,
+            Statement.issue_tags,
+            Statement.text,
+        )
+        if issue:
+            query = query.where(
+                Statement.id.in_(
+                    select(StatementIssue.statement_id)
+                    .join(Issue, Issue.id == StatementIssue.issue_id)
+                    .where(Issue.slug == issue)
+                )
+            )
+        if member_id:
+            query = query.where(Statement.member_id == member_id)
+        if chamber is not None:
+            query = query.where(
+                Statement.member_id.in_(select(Member.id).where(Member.chamber == chamber))
+            )
+        return query.order_by(Statement.id)
+
+    query = (
+        select(
+            Position.member_id,
+            Member.name,
+            Member.party,
+            Member.state,
+            Member.chamber,
+            Issue.slug.label("issue"),
+            Position.score,
+            Position.confidence,
+            Position.vote_score,
+            Position.statement_score,
+            Position.evidence_count,
+            Position.last_updated,
+        )
+        .join(Member, Member.id == Position.member_id)
+        .join(Issue, Issue.id == Position.issue_id)
+    )
+    if issue:
+        query = query.where(Issue.slug == issue)
+    if member_id:
+        query = query.where(Position.member_id == member_id)
+    if chamber is not None:
+        query = query.where(Member.chamber == chamber)
+    return query.order_by(Position.id)
+
+
+def _plain(value, fmt: str):
+    """Convert a column value to its JSON/CSV representation."""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, list) and fmt == "csv":
+        return ";".join(str(item) for item in value)
+    return value
+
+
+async def stream_export(query: Select, fmt: str) -> AsyncIterator[bytes]:
+    """
+    Stream an export query as NDJSON or CSV.
+
+    Rows come from a server-side cursor EXPORT_BATCH_SIZE at a time, so
+    memory use does not depend on the export size. The stream has its own
+    session: it outlives the request's dependency-scoped one.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unknown export format: {fmt}")
+
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        columns = list(result.keys())
+
+        if fmt == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(columns)
+            async for rows in result.partitions():
+                for row in rows:
+                    writer.writerow([_plain(value, fmt) for value in row])
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+            if buffer.tell():
+                yield buffer.getvalue().encode("utf-8")
+        else:
+            async for rows in result.partitions():
+                yield b"".join(
+                    render_json({c: _plain(v, fmt) for c, v in zip(columns, row)}) + b"\n"
+                    for row in rows
+                )
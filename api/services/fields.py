@@ -0,0 +1,150 @@
+"""Sparse fieldsets and text preview mode for list responses."""
+from typing import List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import func
+from sqlalchemy.orm import load_only, with_expression
+
+from ..models import Member, Position, Statement
+
+TEXT_MODES = ("full", "preview")
+PREVIEW_CHARS = 300
+
+# Output fields of each list, in response order
+MEMBER_STATEMENT_FIELDS = (
+    "id", "text", "title", "source", "source_url", "source_date",
+    "cr_page", "issue_tags", "analyzed",
+)
+STATEMENT_FIELDS = (
+    "id", "member_id", "member_name", "member_party", "member_state",
+    "text", "title", "source", "source_url", "source_date", "cr_page", "issue_tags",
+)
+POSITION_FIELDS = (
+    "member_id", "name", "state", "party", "chamber", "photo_url",
+    "score", "confidence", "evidence_count",
+)
+
+# Fields served from the statement's member rather than the statement
+STATEMENT_MEMBER_FIELDS = ("member_name", "member_party", "member_state")
+
+# Position-list fields read from Member (output name -> attribute name)
+POSITION_MEMBER_ATTRS = {
+    "member_id": "id",
+    "name": "name",
+    "state": "state",
+    "party": "party",
+    "chamber": "chamber",
+    "photo_url": "photo_url",
+}
+
+
+def parse_fields(fields: Optional[str], allowed: Sequence[str]) -> Tuple[str, ...]:
+    """
+    Parse a comma-separated `fields` parameter against the allowed fields.
+
+    Returns the selected fields in response order; all of them when the
+    parameter is missing. Unknown names are a 400.
+    """
+    if not fields:
+        return tuple(allowed)
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = requested.difference(allowed)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+        )
+    return tuple(field for field in allowed if field in requested)
+
+
+def parse_text_mode(text: Optional[str]) -> str:
+    """Validate the `text` parameter (defaults to full text)."""
+    mode = text or "full"
+    if mode not in TEXT_MODES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"text must be one of: {', '.join(TEXT_MODES)}",
+        )
+    return mode
+
+
+def statement_load_options(selected: Sequence[str], text_mode: str) -> List:
+    """
+    Loader options that read only the selected statement columns.
+
+    id, member_id and source_date are always loaded: they key the cursor
+    and the member lookup. In preview mode the text column is deferred and
+    only its first PREVIEW_CHARS characters are selected.
+    """
+    attrs = ["id", "member_id", "source_date"]
+    for field in selected:
+        if field in STATEMENT_MEMBER_FIELDS or field in attrs:
+            continue
+        if field == "text" and text_mode == "preview":
+            continue
+        attrs.append(field)
+
+    options = [load_only(*(getattr(Statement, attr) for attr in attrs))]
+    if "text" in selected and text_mode == "preview":
+        options.append(
+            with_expression(
+                Statement.text_preview,
+                func.substr(Statement.text, 1, PREVIEW_CHARS + 1),
+            )
+        )
+    return options
+
+
+def serialize_statement(
+    stmt: Statement,
+    selected: Sequence[str],
+    text_mode: str = "full",
+    member: Optional[Member] = None,
+) -> dict:
+    """Serialize only the selected fields of a statement."""
+    result = {}
+    for field in selected:
+        if field == "text":
+            if text_mode == "preview":
+                preview = stmt.text_preview
+                if preview is not None and len(preview) > PREVIEW_CHARS:
+                    preview = preview[:PREVIEW_CHARS] + "..."
+                result["text"] = preview
+            else:
+                result["text"] = stmt.text
+        elif field == "source_date":
+            result["source_date"] = stmt.source_date.isoformat() if stmt.source_date else None
+        elif field == "member_name":
+            result["member_name"] = member.name if member else "Unknown"
+        elif field == "member_party":
+            result["member_party"] = member.party.value if member else None
+        elif field == "member_state":
+            result["member_state"] = member.state if member else None
+        else:
+            result[field] = getattr(stmt, field)
+    return result
+
+
+def position_load_options(selected: Sequence[str]) -> List:
+    """Loader options that read only the selected member/position columns."""
+    # party is always needed for the stats block
+    member_attrs = {"id", "party"}
+    member_attrs.update(POSITION_MEMBER_ATTRS[f] for f in selected if f in POSITION_MEMBER_ATTRS)
+    position_attrs = {"id"}
+    position_attrs.update(f for f in selected if f not in POSITION_MEMBER_ATTRS)
+    return [
+        load_only(*(getattr(Member, attr) for attr in sorted(member_attrs))),
+        load_only(*(getattr(Position, attr) for attr in sorted(position_attrs))),
+    ]
+
+
+def serialize_position_member(member: Member, selected: Sequence[str], position: Optional[Position] = None) -> dict:
+    """Serialize the selected fields of a position row (or a no-data member)."""
+    result = {}
+    for field in selected:
+        if field in POSITION_MEMBER_ATTRS:
+            value = getattr(member, POSITION_MEMBER_ATTRS[field])
+            result[field] = value.value if field in ("party", "chamber") else value
+        elif position is not None:
+            result[field] = getattr(position, field)
+    return result
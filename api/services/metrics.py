@@ -0,0 +1,184 @@
+"""
+Per-request latency and SQL metrics, exposed in Prometheus text format.
+
+The ASGI middleware in api.main opens a RequestStats for each request;
+SQLAlchemy cursor events add every statement (and its time) to the stats
+of the request that ran it. Totals are kept per route template, so a
+route whose queries-per-request climbs with the result size stands out
+in the queries histogram and max gauge.
+"""
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import event
+
+# Histogram bucket upper bounds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100, 250, 1000)
+
+
+class RequestStats:
+    """SQL activity of a single request."""
+
+    __slots__ = ("queries", "sql_seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.sql_seconds = 0.0
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def start_request() -> RequestStats:
+    """Begin collecting SQL stats for the current request."""
+    stats = RequestStats()
+    _current.set(stats)
+    return stats
+
+
+def install_sql_hooks(engine):
+    """Count statements and SQL time on an engine (sync or async)."""
+    sync_engine = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_start"].pop()
+        stats = _current.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.sql_seconds += time.perf_counter() - started
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus layout."""
+
+    __slots__ = ("buckets", "counts", "total", "count")
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+        self.total += value
+        self.count += 1
+
+
+class RouteMetrics:
+    """Aggregated metrics of one (method, route) pair."""
+
+    __slots__ = ("latency", "queries", "sql_seconds", "max_queries", "errors")
+
+    def __init__(self):
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.queries = Histogram(QUERY_BUCKETS)
+        self.sql_seconds = 0.0
+        self.max_queries = 0
+        self.errors = 0
+
+
+class MetricsRegistry:
+    """Thread-safe store of per-route metrics."""
+
+    def __init__(self):
+        self._routes: Dict[Tuple[str, str], RouteMetrics] = {}
+        self._lock = threading.Lock()
+
+    def record(self, method: str, route: str, status: int, seconds: float, stats: RequestStats):
+        """Add one finished request."""
+        with self._lock:
+            metrics = self._routes.get((method, route))
+            if metrics is None:
+                metrics = self._routes[(method, route)] = RouteMetrics()
+            metrics.latency.observe(seconds)
+            metrics.queries.observe(stats.queries)
+            metrics.sql_seconds += stats.sql_seconds
+            metrics.max_queries = max(metrics.max_queries, stats.queries)
+            if status >= 500:
+                metrics.errors += 1
+
+    def clear(self):
+        with self._lock:
+            self._routes.clear()
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        with self._lock:
+            routes = sorted(self._routes.items())
+
+        lines = []
+
+        def histogram(name, help_text, attr):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for (method, route), metrics in routes:
+                hist = getattr(metrics, attr)
+                labels = f'method="{method}",route="{_escape(route)}"'
+                for bound, count in zip(hist.buckets, hist.counts):
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {hist.count}')
+                lines.append(f"{name}_sum{{{labels}}} {hist.total}")
+                lines.append(f"{name}_count{{{labels}}} {hist.count}")
+
+        def scalar(name, metric_type, help_text, value_of):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for (method, route), metrics in routes:
+                labels = f'method="{method}",route="{_escape(route)}"'
+                lines.append(f"{name}{{{labels}}} {value_of(metrics)}")
+
+        histogram(
+            "api_request_duration_seconds",
+            "Request latency by route.",
+            "latency",
+        )
+        histogram(
+            "api_sql_queries_per_request",
+            "SQL statements executed per request.",
+            "queries",
+        )
+        scalar(
+            "api_sql_queries_max",
+            "gauge",
+            "Most SQL statements seen in a single request.",
+            lambda m: m.max_queries,
+        )
+        scalar(
+            "api_sql_duration_seconds_total",
+            "counter",
+            "Time spent executing SQL.",
+            lambda m: m.sql_seconds,
+        )
+        scalar(
+            "api_request_errors_total",
+            "counter",
+            "Requests that ended in a 5xx response.",
+            lambda m: m.errors,
+        )
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def server_timing(stats: RequestStats, seconds: float) -> str:
+    """Server-Timing header value: SQL so far and the time elapsed."""
+    return (
+        f'db;dur={stats.sql_seconds * 1000:.1f};desc="{stats.queries} queries", '
+        f"total;dur={seconds * 1000:.1f}"
+    )
+
+
+metrics_registry = MetricsRegistry()
@@ -0,0 +1,73 @@
+"""Keyset (cursor) pagination for statement listings."""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import Statement
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def clamp_page_size(limit: Optional[int]) -> int:
+    """Apply the default and the server-side maximum to a requested size."""
+    if limit is None:
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def encode_cursor(statement: Statement) -> str:
+    """Encode the (source_date, id) key of a statement as an opaque cursor."""
+    key = [statement.source_date.isoformat(), statement.id]
+    raw = json.dumps(key, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor produced by encode_cursor, or raise a 400."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        source_date, statement_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(source_date), int(statement_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+async def paginate_statements(
+    db: AsyncSession,
+    query: Select,
+    limit: int,
+    cursor: Optional[str] = None,
+) -> Tuple[List, Optional[str]]:
+    """
+    Return one page of a statement query, newest first, and the next cursor.
+
+    Rows are ordered by (source_date, id) descending and the cursor seeks
+    past the last row seen, so every page costs the same index range scan
+    no matter how deep it is. The next cursor is None on the last page.
+    """
+    if cursor:
+        source_date, statement_id = decode_cursor(cursor)
+        # A row-value comparison, unlike the equivalent OR, is planned as
+        # a range seek on the (source_date, id) index
+        query = query.where(
+            tuple_(Statement.source_date, Statement.id) < tuple_(source_date, statement_id)
+        )
+
+    result = await db.scalars(
+        query.order_by(Statement.source_date.desc(), Statement.id.desc())
+        .limit(limit + 1)
+    )
+    rows = result.all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1])
+    return rows, next_cursor
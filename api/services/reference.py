@@ -0,0 +1,159 @@
+"""
+In-memory reference data: issues and member cards.
+
+Issues and members change only when a script refreshes the data, so the
+API keeps read-only copies of them instead of looking an issue up by slug
+(or a member by id) on every request. The app lifespan loads them at
+startup and polls for DataMetadata changes; lookups that miss fall back
+to reloading, so a new issue or member is never reported as not found.
+"""
+import asyncio
+from datetime import datetime
+from types import MappingProxyType
+from typing import Iterable, Mapping, NamedTuple, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..models import Chamber, DataMetadata, Issue, Member, Party
+
+
+class IssueRef(NamedTuple):
+    """Immutable copy of an issue row."""
+    id: int
+    name: str
+    slug: str
+    description: Optional[str]
+    spectrum_left_label: Optional[str]
+    spectrum_right_label: Optional[str]
+    spectrum_description: Optional[str]
+
+
+class MemberRef(NamedTuple):
+    """Immutable member card."""
+    id: str
+    name: str
+    state: str
+    party: Party
+    chamber: Chamber
+    photo_url: Optional[str]
+
+
+class ReferenceData:
+    """One consistent, read-only set of reference data."""
+
+    __slots__ = ("version", "issues", "issues_by_slug", "members", "loaded_at")
+
+    def __init__(self, version: Tuple, issues: Iterable[IssueRef], members: Iterable[MemberRef]):
+        self.version = version
+        self.issues: Tuple[IssueRef, ...] = tuple(issues)
+        self.issues_by_slug: Mapping[str, IssueRef] = MappingProxyType(
+            {issue.slug: issue for issue in self.issues}
+        )
+        self.members: Mapping[str, MemberRef] = MappingProxyType(
+            {member.id: member for member in members}
+        )
+        self.loaded_at = datetime.utcnow()
+
+
+# What reference_version() reads: every metadata row and the issues table
+VERSION_METADATA_QUERY = (
+    select(DataMetadata.data_type, DataMetadata.last_updated).order_by(DataMetadata.data_type)
+)
+VERSION_ISSUES_QUERY = select(func.count(Issue.id), func.max(Issue.updated_at))
+
+
+async def reference_version(db: AsyncSession) -> Tuple:
+    """Version token covering every data type and the issues table."""
+    metadata = (await db.execute(VERSION_METADATA_QUERY)).all()
+    issues = (await db.execute(VERSION_ISSUES_QUERY)).one()
+    return (tuple(tuple(row) for row in metadata), tuple(issues))
+
+
+def reference_version_sync(db: Session) -> Tuple:
+    """reference_version() on a sync session, for the scripts."""
+    metadata = db.execute(VERSION_METADATA_QUERY).all()
+    issues = db.execute(VERSION_ISSUES_QUERY).one()
+    return (tuple(tuple(row) for row in metadata), tuple(issues))
+
+
+class ReferenceStore:
+    """
+    Holds the current ReferenceData and replaces it when the data changes.
+
+    Readers get the ReferenceData object itself; a refresh swaps in a new
+    one instead of mutating it.
+    """
+
+    def __init__(self):
+        self.data: Optional[ReferenceData] = None
+        self.warmed_at: Optional[datetime] = None
+        self.warmed_payloads = 0
+        self._lock = asyncio.Lock()
+
+    async def load(self, db: AsyncSession) -> ReferenceData:
+        """Read issues and members and make them current."""
+        version = await reference_version(db)
+        issues = (await db.execute(
+            select(
+                Issue.id,
+                Issue.name,
+                Issue.slug,
+                Issue.description,
+                Issue.spectrum_left_label,
+                Issue.spectrum_right_label,
+                Issue.spectrum_description,
+            ).order_by(Issue.id)
+        )).all()
+        members = (await db.execute(
+            select(
+                Member.id,
+                Member.name,
+                Member.state,
+                Member.party,
+                Member.chamber,
+                Member.photo_url,
+            )
+        )).all()
+        self.data = ReferenceData(
+            version,
+            (IssueRef(*row) for row in issues),
+            (MemberRef(*row) for row in members),
+        )
+        return self.data
+
+    async def get(self, db: AsyncSession) -> ReferenceData:
+        """Return the current data, loading it on first use."""
+        if self.data is None:
+            async with self._lock:
+                if self.data is None:
+                    await self.load(db)
+        return self.data
+
+    async def refresh_if_changed(self, db: AsyncSession) -> bool:
+        """Reload if the data version moved; True when it did."""
+        async with self._lock:
+            if self.data is not None and await reference_version(db) == self.data.version:
+                return False
+            await self.load(db)
+            return True
+
+    async def issue(self, db: AsyncSession, slug: str) -> Optional[IssueRef]:
+        """Look up an issue by slug, reloading once on a miss."""
+        data = await self.get(db)
+        issue = data.issues_by_slug.get(slug)
+        if issue is None and await self.refresh_if_changed(db):
+            issue = self.data.issues_by_slug.get(slug)
+        return issue
+
+    async def members_by_id(self, db: AsyncSession, member_ids: Iterable[str]) -> Mapping[str, MemberRef]:
+        """Member cards for the given ids, reloading once if any is missing."""
+        member_ids = set(member_ids)
+        data = await self.get(db)
+        if not member_ids.issubset(data.members) and await self.refresh_if_changed(db):
+            data = self.data
+        return {member_id: data.members[member_id] for member_id in member_ids if member_id in data.members}
+
+
+reference_store = ReferenceStore()
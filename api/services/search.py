@@ -0,0 +1,113 @@
+"""Full-text statement search backed by the statements_fts index."""
+import html
+from datetime import date, datetime, time, timedelta
+from typing import List, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import func, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import Member, Statement, StatementIssue
+from ..models.fts import statements_fts
+
+# Control characters mark matches inside snippet(); the snippet is
+# HTML-escaped afterwards and the markers become <mark> tags.
+MATCH_START = "\x02"
+MATCH_END = "\x03"
+SNIPPET_TOKENS = 24
+
+
+def build_match_query(q: str) -> str:
+    """
+    Turn free text into an FTS5 MATCH expression.
+
+    Every whitespace-separated term is quoted, so punctuation and FTS5
+    operators in user input can't cause syntax errors; terms are ANDed.
+    A trailing * keeps prefix matching (e.g. `tarif*`).
+    """
+    terms = []
+    for term in q.split():
+        prefix = term.endswith("*")
+        term = term.rstrip("*")
+        if not term:
+            continue
+        quoted = '"' + term.replace('"', '""') + '"'
+        terms.append(quoted + ("*" if prefix else ""))
+    if not terms:
+        raise HTTPException(status_code=400, detail="Search query is empty")
+    return " ".join(terms)
+
+
+def highlight(snippet: Optional[str]) -> Optional[str]:
+    """Escape a raw snippet and wrap matched terms in <mark> tags."""
+    if snippet is None:
+        return None
+    escaped = html.escape(snippet, quote=False)
+    return escaped.replace(MATCH_START, "<mark>").replace(MATCH_END, "</mark>")
+
+
+async def search_statements(
+    db: AsyncSession,
+    q: str,
+    limit: int,
+    member_id: Optional[str] = None,
+    issue_id: Optional[int] = None,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+) -> List[dict]:
+    """Return statements matching q, best BM25 rank first."""
+    if db.bind.dialect.name != "sqlite":
+        raise HTTPException(status_code=501, detail="Search requires the SQLite FTS5 index")
+
+    rank = func.bm25(literal_column("statements_fts")).label("rank")
+    snippet = func.snippet(
+        literal_column("statements_fts"),
+        -1,
+        MATCH_START,
+        MATCH_END,
+        "…",
+        SNIPPET_TOKENS,
+    ).label("snippet")
+
+    query = (
+        select(Statement, Member, rank, snippet)
+        .select_from(statements_fts)
+        .join(Statement, Statement.id == statements_fts.c.rowid)
+        .outerjoin(Member, Member.id == Statement.member_id)
+        .where(literal_column("statements_fts").op("MATCH")(build_match_query(q)))
+    )
+
+    if member_id:
+        query = query.where(Statement.member_id == member_id)
+    if issue_id is not None:
+        query = (
+            query.join(StatementIssue, StatementIssue.statement_id == Statement.id)
+            .where(StatementIssue.issue_id == issue_id)
+        )
+    if since:
+        query = query.where(Statement.source_date >= datetime.combine(since, time.min))
+    if until:
+        query = query.where(
+            Statement.source_date < datetime.combine(until + timedelta(days=1), time.min)
+        )
+
+    rows = (await db.execute(query.order_by(rank, Statement.id).limit(limit))).all()
+
+    return [
+        {
+            "id": stmt.id,
+            "member_id": stmt.member_id,
+            "member_name": member.name if member else "Unknown",
+            "member_party": member.party.value if member else None,
+            "member_state": member.state if member else None,
+            "title": stmt.title,
+            "snippet": highlight(row_snippet),
+            "source": stmt.source,
+            "source_url": stmt.source_url,
+            "source_date": stmt.source_date.isoformat() if stmt.source_date else None,
+            "cr_page": stmt.cr_page,
+            "issue_tags": stmt.issue_tags,
+            "rank": row_rank,
+        }
+        for stmt, member, row_rank, row_snippet in rows
+    ]
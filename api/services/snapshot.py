@@ -0,0 +1,164 @@
+"""
+Pre-rendered API snapshots in data/processed.
+
+scripts/export_snapshot.py renders the read endpoints into a versioned
+directory under data/processed/snapshots and then atomically repoints the
+data/processed/current symlink at it. Each file is stored as plain JSON
+plus .gz (and .br when brotli is installed) siblings, with the ETags in
+manifest.json, so the tree can be put on static hosting as-is or served
+by the API without touching the database.
+
+The manifest also records the data version the snapshot was rendered
+from. The API serves a snapshot only while that matches the version the
+reference store last polled, so data refreshed since the export (e.g.
+by a standalone calculate_scores.py run) is answered live.
+"""
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Optional, Tuple
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from .compression import choose_encoding
+from .conditional import encoded_etag, etag_matches
+
+PROCESSED_DIR = Path(__file__).resolve().parents[2] / "data" / "processed"
+SNAPSHOTS_DIR = PROCESSED_DIR / "snapshots"
+CURRENT_LINK = PROCESSED_DIR / "current"
+MANIFEST_NAME = "manifest.json"
+
+# File suffix per content coding
+ENCODING_SUFFIXES = {"gzip": ".gz", "br": ".br"}
+
+CHAMBERS = ("senate", "house")
+
+# Exported for static hosting, but the API always answers these live:
+# metadata ages move with the clock
+LIVE_PATHS = ("/api/metadata",)
+
+_ISSUE_RE = re.compile(r"^/api/issues/([a-z0-9-]+)$")
+_POSITIONS_RE = re.compile(r"^/api/issues/([a-z0-9-]+)/positions$")
+_MEMBER_RE = re.compile(r"^/api/members/([A-Za-z0-9]+)$")
+
+
+def version_token(version: Tuple) -> str:
+    """Text form of a reference_version() tuple, as stored in manifests."""
+    return repr(version)
+
+
+def snapshot_file(path: str, query: str = "") -> Optional[str]:
+    """
+    Map a request path and query string to its snapshot file.
+
+    Returns the file path relative to the snapshot directory, or None for
+    URLs that are not exported (any other query parameters included).
+    """
+    if path == "/api/issues" and not query:
+        return "api/issues.json"
+    if path == "/api/metadata" and not query:
+        return "api/metadata.json"
+
+    match = _POSITIONS_RE.match(path)
+    if match:
+        if not query:
+            return f"api/issues/{match.group(1)}/positions.json"
+        chamber = query[len("chamber="):] if query.startswith("chamber=") else None
+        if chamber in CHAMBERS:
+            return f"api/issues/{match.group(1)}/positions.{chamber}.json"
+        return None
+
+    if query:
+        return None
+    match = _ISSUE_RE.match(path)
+    if match:
+        return f"api/issues/{match.group(1)}.json"
+    match = _MEMBER_RE.match(path)
+    if match:
+        return f"api/members/{match.group(1)}.json"
+    return None
+
+
+class SnapshotStore:
+    """
+    Read access to the current snapshot.
+
+    The current symlink is resolved on every lookup, so a new export is
+    picked up without restarting the API; the manifest of the current
+    directory is cached. Serving is off unless SERVE_SNAPSHOT=1 is set.
+    """
+
+    def __init__(self, link: Path = CURRENT_LINK, enabled: bool = False):
+        self.link = link
+        self.enabled = enabled
+        self._manifests = {}
+        self._lock = threading.Lock()
+
+    def current(self) -> Optional[Tuple[Path, dict]]:
+        """Return the current snapshot directory and its manifest, if any."""
+        try:
+            directory = self.link.resolve(strict=True)
+        except (FileNotFoundError, RuntimeError):
+            return None
+
+        with self._lock:
+            manifest = self._manifests.get(directory)
+        if manifest is None:
+            try:
+                manifest = json.loads((directory / MANIFEST_NAME).read_text())
+            except (OSError, ValueError):
+                return None
+            with self._lock:
+                self._manifests = {directory: manifest}
+        return directory, manifest
+
+    def response(self, request: Request, data_version: Optional[Tuple]) -> Optional[Response]:
+        """
+        Answer a GET request from the snapshot, or None to fall through.
+
+        data_version is the current reference_version(); a snapshot
+        rendered from any other version is not served.
+        """
+        if not self.enabled or data_version is None or request.url.path in LIVE_PATHS:
+            return None
+        name = snapshot_file(request.url.path, request.url.query)
+        if name is None:
+            return None
+        current = self.current()
+        if current is None:
+            return None
+        directory, manifest = current
+        if manifest.get("data_version") != version_token(data_version):
+            return None
+        entry = manifest["files"].get(name)
+        if entry is None:
+            return None
+
+        encoding = choose_encoding(request.headers.get("accept-encoding"))
+        if encoding not in entry.get("encodings", ()):
+            encoding = None
+        etag = entry["etag"]
+        headers = {
+            "Cache-Control": "no-cache",
+            "Vary": "Accept-Encoding",
+            "ETag": encoded_etag(etag, encoding),
+        }
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+
+        file_path = directory / (name + ENCODING_SUFFIXES.get(encoding, ""))
+        try:
+            body = file_path.read_bytes()
+        except OSError:
+            return None
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+        return Response(content=body, media_type="application/json", headers=headers)
+
+
+snapshot_store = SnapshotStore(
+    enabled=os.getenv("SERVE_SNAPSHOT", "").lower() in ("1", "true", "yes"),
+)
@@ -0,0 +1,64 @@
+"""
+Statement scores aggregated in SQL.
+
+A member's statement score on an issue is the mean extracted position of
+their analyzed statement evidence, weighted by extraction confidence.
+statement_scores_query() computes it, with its confidence and statement
+count, for every (member, issue) pair in one GROUP BY, so the scoring
+scripts and the API never load the individual evidence rows.
+"""
+from typing import Iterable, Optional
+
+from sqlalchemy import Float, Select, case, cast, func, select
+
+from ..models import Chamber, Evidence, EvidenceType, Member, Position
+
+# Statements needed for full confidence in a statement score
+MAX_STATEMENTS_FOR_FULL_CONFIDENCE = 3
+# Weight of a statement extracted without a confidence
+DEFAULT_STATEMENT_WEIGHT = 0.5
+
+
+def statement_scores_query(
+    issue_ids: Optional[Iterable[int]] = None,
+    member_ids: Optional[Iterable[str]] = None,
+    chamber: Optional[Chamber] = None,
+) -> Select:
+    """
+    Build the statement score aggregation, optionally filtered.
+
+    Selects member_id, issue_id, statement_score (clamped to -1..1),
+    statement_confidence and statement_count, one row per pair that has
+    analyzed statements. Runs on sync and async sessions alike.
+    """
+    weight = func.coalesce(func.nullif(Evidence.extraction_confidence, 0.0), DEFAULT_STATEMENT_WEIGHT)
+    total_weight = func.sum(weight)
+    mean = func.sum(Evidence.extracted_position * weight) / total_weight
+    count = func.count(Evidence.id)
+
+    query = (
+        select(
+            Position.member_id,
+            Position.issue_id,
+            case((mean > 1.0, 1.0), (mean < -1.0, -1.0), else_=mean).label("statement_score"),
+            case(
+                (count >= MAX_STATEMENTS_FOR_FULL_CONFIDENCE, 1.0),
+                else_=cast(count, Float) / float(MAX_STATEMENTS_FOR_FULL_CONFIDENCE),
+            ).label("statement_confidence"),
+            count.label("statement_count"),
+        )
+        .join(Position, Position.id == Evidence.position_id)
+        .where(
+            Evidence.type == EvidenceType.STATEMENT,
+            Evidence.extracted_position.isnot(None),
+        )
+        .group_by(Position.member_id, Position.issue_id)
+        .having(total_weight != 0)
+    )
+    if issue_ids is not None:
+        query = query.where(Position.issue_id.in_(list(issue_ids)))
+    if member_ids is not None:
+        query = query.where(Position.member_id.in_(list(member_ids)))
+    if chamber is not None:
+        query = query.where(Position.member_id.in_(select(Member.id).where(Member.chamber == chamber)))
+    return query
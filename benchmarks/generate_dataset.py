@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Generate a synthetic Congress-scale database for benchmarking.
+
+This script:
+1. Creates a fresh database (default benchmarks/data/synthetic.db)
+2. Fills it with 535 members, 20 issues, several Congresses of roll
+   calls with a vote per member, scored positions with evidence, and
+   tens of thousands of statements
+3. Records data metadata so the API's caches and ETags behave as in
+   production
+
+Data is random but reproducible for a given --seed.
+
+Usage:
+    python benchmarks/generate_dataset.py
+    python benchmarks/generate_dataset.py --congresses 2 --statements 10000
+    python benchmarks/generate_dataset.py --db /tmp/bench.db --seed 7
+"""
+import sys
+import os
+import random
+import argparse
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+DEFAULT_DB = project_root / "benchmarks" / "data" / "synthetic.db"
+
+SENATE_SIZE = 100
+HOUSE_SIZE = 435
+STATES = [
+    "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA", "HI", "ID", "IL",
+    "IN", "IA", "KS", "KY", "LA", "ME", "MD", "MA", "MI", "MN", "MS", "MO", "MT",
+    "NE", "NV", "NH", "NJ", "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI",
+    "SC", "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY",
+]
+FIRST_NAMES = [
+    "James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda",
+    "David", "Elizabeth", "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica",
+    "Thomas", "Sarah", "Charles", "Karen", "Maria", "Daniel", "Nancy", "Mark",
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+    "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson",
+    "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson",
+    "White", "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson",
+]
+ISSUE_TOPICS = [
+    ("Trade Policy", "Free Trade", "Protectionist"),
+    ("Immigration", "Open", "Restrictive"),
+    ("Energy", "Renewables", "Fossil Fuels"),
+    ("Healthcare", "Public", "Private"),
+    ("Defense Spending", "Reduce", "Expand"),
+    ("Tax Policy", "Progressive", "Flat"),
+    ("Gun Policy", "Regulate", "Deregulate"),
+    ("Climate", "Act Now", "Wait"),
+    ("Education", "Federal", "Local"),
+    ("Labor", "Pro-Union", "Pro-Employer"),
+    ("Housing", "Subsidize", "Market"),
+    ("Agriculture", "Subsidize", "Market"),
+    ("Technology", "Regulate", "Deregulate"),
+    ("Privacy", "Protect", "Permit"),
+    ("Criminal Justice", "Reform", "Enforce"),
+    ("Foreign Aid", "Expand", "Cut"),
+    ("Infrastructure", "Federal", "Private"),
+    ("Social Security", "Expand", "Reform"),
+    ("Financial Regulation", "Strict", "Light"),
+    ("Drug Policy", "Decriminalize", "Enforce"),
+]
+STATEMENT_WORDS = (
+    "tariff trade tax border energy climate jobs wages union health insurance "
+    "medicare school housing rent farm crop privacy data police court budget "
+    "deficit defense ally aid bank market regulation workers families rural "
+    "manufacturing china mexico canada steel oil gas solar wind bill senate house"
+).split()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generate a synthetic benchmark database")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB, help="Database file to create")
+    parser.add_argument("--congresses", type=int, default=3, help="Congresses of roll calls")
+    parser.add_argument("--roll-calls", type=int, default=150,
+                        help="Roll calls per chamber per Congress")
+    parser.add_argument("--statements", type=int, default=40000, help="Statements to create")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    return parser.parse_args()
+
+
+def chunked(rows, size=5000):
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def main():
+    args = parse_args()
+    args.db.parent.mkdir(parents=True, exist_ok=True)
+    for suffix in ("", "-wal", "-shm"):
+        path = Path(str(args.db) + suffix)
+        if path.exists():
+            path.unlink()
+
+    # Point the models at the synthetic file before they are imported
+    os.environ["DATABASE_URL"] = f"sqlite:///{args.db.resolve()}"
+    from api.models import (
+        engine,
+        init_db,
+        sync_issue_tags,
+        Member,
+        Issue,
+        Bill,
+        Vote,
+        Position,
+        Evidence,
+        Statement,
+        DataMetadata,
+        Chamber,
+        Party,
+        VoteChoice,
+        EvidenceType,
+    )
+
+    rng = random.Random(args.seed)
+    started = time.perf_counter()
+    print(f"Creating {args.db}...")
+    init_db()
+
+    # Members: ideology per issue drives votes, positions and statements
+    members = []
+    ideology = {}
+    for chamber, size, prefix in ((Chamber.SENATE, SENATE_SIZE, "S"), (Chamber.HOUSE, HOUSE_SIZE, "H")):
+        for i in range(size):
+            party = rng.choices(
+                [Party.DEMOCRAT, Party.REPUBLICAN, Party.INDEPENDENT], [0.48, 0.49, 0.03]
+            )[0]
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            member_id = f"{prefix}{i:06d}"
+            lean = {Party.DEMOCRAT: -0.4, Party.REPUBLICAN: 0.4}.get(party, 0.0)
+            ideology[member_id] = [
+                max(-1.0, min(1.0, rng.gauss(lean * rng.choice((1, -1, 1)), 0.35)))
+                for _ in ISSUE_TOPICS
+            ]
+            members.append({
+                "id": member_id,
+                "name": f"{first} {last}",
+                "first_name": first,
+                "last_name": last,
+                "state": STATES[i % len(STATES)] if chamber == Chamber.SENATE else rng.choice(STATES),
+                "party": party,
+                "chamber": chamber,
+                "current_term_start": datetime(2025, 1, 3),
+                "photo_url": f"https://example.org/photos/{member_id}.jpg",
+            })
+    by_chamber = {
+        chamber: [m["id"] for m in members if m["chamber"] == chamber]
+        for chamber in (Chamber.SENATE, Chamber.HOUSE)
+    }
+
+    issues = [
+        {
+            "id": i + 1,
+            "name": name,
+            "slug": name.lower().replace(" ", "-"),
+            "description": f"Positions on {name.lower()}.",
+            "spectrum_left_label": left,
+            "spectrum_right_label": right,
+            "spectrum_description": f"From {left} (-1.0) to {right} (+1.0).",
+        }
+        for i, (name, left, right) in enumerate(ISSUE_TOPICS)
+    ]
+
+    # Bills and roll-call votes
+    bills, votes = [], []
+    vote_ids = {}
+    choices = [VoteChoice.YES, VoteChoice.NO]
+    for c in range(args.congresses):
+        congress = 119 - c
+        start = datetime(2025 - 2 * c, 1, 3)
+        for chamber, bill_type in ((Chamber.SENATE, "s"), (Chamber.HOUSE, "hr")):
+            for n in range(args.roll_calls):
+                issue_index = rng.randrange(len(issues))
+                indicator = rng.choice((-1.0, 1.0)) * rng.uniform(0.5, 1.0)
+                bill_id = f"{bill_type}{n + 1}-{congress}"
+                vote_date = start + timedelta(days=rng.randrange(700))
+                bills.append({
+                    "id": bill_id,
+                    "congress": congress,
+                    "bill_type": bill_type,
+                    "bill_number": n + 1,
+                    "title": f"A bill concerning {issues[issue_index]['name'].lower()} ({n + 1})",
+                    "short_title": f"{issues[issue_index]['name']} Act {n + 1}",
+                    "issue_tags": [issues[issue_index]["slug"]],
+                    "position_indicator": indicator,
+                    "introduced_date": vote_date - timedelta(days=30),
+                    "latest_action_date": vote_date,
+                })
+                for member_id in by_chamber[chamber]:
+                    lean = ideology[member_id][issue_index] * indicator
+                    if rng.random() < 0.03:
+                        choice = VoteChoice.NOT_VOTING
+                    else:
+                        choice = choices[0] if rng.random() < 0.5 + lean / 2 else choices[1]
+                    vote_id = len(votes) + 1
+                    vote_ids.setdefault((member_id, issue_index), []).append(vote_id)
+                    votes.append({
+                        "id": vote_id,
+                        "member_id": member_id,
+                        "bill_id": bill_id,
+                        "vote": choice,
+                        "vote_date": vote_date,
+                        "roll_call_id": f"{congress}-{bill_type}-{n + 1}",
+                        "session": 1 + (vote_date.year % 2 == 0),
+                    })
+
+    # Statements tagged with one or two issues
+    statements = []
+    for i in range(args.statements):
+        member_id = rng.choice(members)["id"]
+        tagged = rng.sample(range(len(issues)), rng.choice((1, 1, 2)))
+        words = rng.choices(STATEMENT_WORDS, k=rng.randrange(60, 400))
+        statements.append({
+            "id": i + 1,
+            "member_id": member_id,
+            "title": f"{issues[tagged[0]]['name']}: remarks {i + 1}",
+            "text": " ".join(words),
+            "source": "congressional_record",
+            "source_url": f"https://example.org/record/{i + 1}",
+            "source_date": datetime(2021, 1, 3) + timedelta(minutes=rng.randrange(60 * 24 * 1800)),
+            "cr_page": f"S{rng.randrange(1, 9000)}",
+            "congress": 119,
+            "issue_tags": [issues[t]["slug"] for t in tagged],
+            "analyzed": 1,
+        })
+
+    # Positions for ~90% of member/issue pairs, with vote evidence
+    positions, evidence = [], []
+    for member in members:
+        for issue_index, issue in enumerate(issues):
+            if rng.random() > 0.9:
+                continue
+            position_id = len(positions) + 1
+            linked = vote_ids.get((member["id"], issue_index), [])[:5]
+            positions.append({
+                "id": position_id,
+                "member_id": member["id"],
+                "issue_id": issue["id"],
+                "score": ideology[member["id"]][issue_index],
+                "confidence": rng.uniform(0.2, 1.0),
+                "vote_score": ideology[member["id"]][issue_index],
+                "evidence_count": len(linked),
+            })
+            for vote_id in linked:
+                evidence.append({
+                    "position_id": position_id,
+                    "type": EvidenceType.VOTE,
+                    "source_name": "Roll call",
+                    "vote_id": vote_id,
+                    "extracted_position": rng.uniform(-1.0, 1.0),
+                    "weight": 1.0,
+                })
+
+    now = datetime.utcnow()
+    counts = {
+        "members": len(members),
+        "votes": len(votes),
+        "statements": len(statements),
+        "positions": len(positions),
+    }
+    metadata = [
+        {"data_type": data_type, "last_updated": now, "record_count": count, "source": "synthetic"}
+        for data_type, count in counts.items()
+    ]
+
+    with engine.begin() as conn:
+        for model, rows in (
+            (Member, members),
+            (Issue, issues),
+            (Bill, bills),
+            (Vote, votes),
+            (Statement, statements),
+            (Position, positions),
+            (Evidence, evidence),
+            (DataMetadata, metadata),
+        ):
+            for chunk in chunked(rows):
+                conn.execute(model.__table__.insert(), chunk)
+            print(f"  {model.__tablename__:12} {len(rows):>8,}")
+        sync_issue_tags(conn)
+
+    print(f"Done in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Load-test the API against a benchmark database.
+
+This script:
+1. Points the API at a database built by generate_dataset.py
+2. Drives each endpoint with concurrent clients, either in-process
+   (ASGI transport, no network) or through a local uvicorn server
+3. Reports p50/p95/p99 latency and throughput per endpoint
+4. Saves the results as JSON (tagged with the git commit) and can
+   compare them against an earlier run
+
+Usage:
+    python benchmarks/load_test.py
+    python benchmarks/load_test.py --server --concurrency 32 --requests 500
+    python benchmarks/load_test.py --compare benchmarks/results/<earlier>.json
+"""
+import sys
+import os
+import json
+import random
+import asyncio
+import argparse
+import subprocess
+import time
+from datetime import datetime
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import httpx
+
+DEFAULT_DB = project_root / "benchmarks" / "data" / "synthetic.db"
+RESULTS_DIR = project_root / "benchmarks" / "results"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Load-test the Issue Positions API")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB, help="Benchmark database")
+    parser.add_argument("--server", action="store_true",
+                        help="Run through a local uvicorn server instead of in-process")
+    parser.add_argument("--port", type=int, default=8765, help="Port for --server")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers for --server")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent clients")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per endpoint")
+    parser.add_argument("--endpoint", action="append",
+                        help="Only run these endpoints (repeatable)")
+    parser.add_argument("--output", type=Path, help="Results file (default: benchmarks/results/)")
+    parser.add_argument("--compare", type=Path, help="Earlier results file to compare against")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for request parameters")
+    return parser.parse_args()
+
+
+def load_targets(db_path: Path) -> dict:
+    """Read the ids the request generators sample from."""
+    import sqlite3
+
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        return {
+            "slugs": [row[0] for row in conn.execute("SELECT slug FROM issues")],
+            "members": [row[0] for row in conn.execute("SELECT id FROM members")],
+        }
+    finally:
+        conn.close()
+
+
+def build_endpoints(targets: dict) -> dict:
+    """Endpoint name -> function returning a request URL."""
+    slugs, members = targets["slugs"], targets["members"]
+    return {
+        "issues": lambda rng: "/api/issues",
+        "positions": lambda rng: f"/api/issues/{rng.choice(slugs)}/positions",
+        "positions_house": lambda rng: f"/api/issues/{rng.choice(slugs)}/positions?chamber=house",
+        "positions_matrix": lambda rng: "/api/positions/matrix?issues=" + ",".join(rng.sample(slugs, 2)),
+        "member": lambda rng: f"/api/members/{rng.choice(members)}",
+        "member_full": lambda rng: f"/api/members/{rng.choice(members)}?include=statements,evidence",
+        "member_statements": lambda rng: f"/api/members/{rng.choice(members)}/statements",
+        "statements": lambda rng: "/api/statements",
+        "statements_preview": lambda rng: f"/api/statements?text=preview&issue={rng.choice(slugs)}",
+        "search": lambda rng: "/api/statements/search?q=" + rng.choice(["tariff", "energy jobs", "farm*"]),
+        "metadata": lambda rng: "/api/metadata",
+    }
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def run_endpoint(client, make_url, total: int, concurrency: int, rng) -> dict:
+    """Send `total` requests from `concurrency` clients and summarize them."""
+    urls = [make_url(rng) for _ in range(total)]
+    latencies = []
+    errors = 0
+    queue = asyncio.Queue()
+    for url in urls:
+        queue.put_nowait(url)
+
+    async def worker():
+        nonlocal errors
+        while True:
+            try:
+                url = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            started = time.perf_counter()
+            response = await client.get(url)
+            await response.aread()
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": total,
+        "errors": errors,
+        "throughput_rps": round(total / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+        "max_ms": round(latencies[-1] * 1000, 2),
+    }
+
+
+def start_server(args):
+    """Start uvicorn on the benchmark database and wait until it answers."""
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "api.main:app",
+            "--port", str(args.port),
+            "--workers", str(args.workers),
+            "--log-level", "warning",
+        ],
+        cwd=project_root,
+        env=dict(os.environ),
+    )
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with status {process.returncode}")
+        try:
+            httpx.get(f"http://127.0.0.1:{args.port}/", timeout=1.0)
+            return process
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("uvicorn did not start")
+
+
+async def run(args, endpoints) -> dict:
+    limits = httpx.Limits(max_connections=args.concurrency)
+    if args.server:
+        client = httpx.AsyncClient(base_url=f"http://127.0.0.1:{args.port}", limits=limits, timeout=60)
+    else:
+        from api.main import app
+        transport = httpx.ASGITransport(app=app)
+        client = httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60)
+
+    rng = random.Random(args.seed)
+    results = {}
+    async with client:
+        for name, make_url in endpoints.items():
+            results[name] = await run_endpoint(client, make_url, args.requests, args.concurrency, rng)
+            r = results[name]
+            print(
+                f"  {name:20} {r['throughput_rps']:>8.1f} req/s  "
+                f"p50 {r['p50_ms']:>8.2f}  p95 {r['p95_ms']:>8.2f}  p99 {r['p99_ms']:>8.2f} ms"
+                + (f"  ({r['errors']} errors)" if r["errors"] else "")
+            )
+    return results
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=project_root, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def print_comparison(results: dict, earlier_path: Path):
+    earlier = json.loads(earlier_path.read_text())
+    print()
+    print(f"Compared with {earlier_path.name} (commit {earlier.get('commit')}):")
+    for name, r in results.items():
+        before = earlier["results"].get(name)
+        if not before:
+            continue
+        print(
+            f"  {name:20} p50 {before['p50_ms']:>8.2f} -> {r['p50_ms']:>8.2f} ms  "
+            f"p99 {before['p99_ms']:>8.2f} -> {r['p99_ms']:>8.2f} ms  "
+            f"{before['throughput_rps']:>8.1f} -> {r['throughput_rps']:>8.1f} req/s"
+        )
+
+
+def main():
+    args = parse_args()
+    if not args.db.exists():
+        print(f"ERROR: {args.db} not found. Run benchmarks/generate_dataset.py first.")
+        sys.exit(1)
+
+    # Must be set before api.models is imported (here or in the server)
+    os.environ["DATABASE_URL"] = f"sqlite:///{args.db.resolve()}"
+
+    endpoints = build_endpoints(load_targets(args.db))
+    if args.endpoint:
+        unknown = set(args.endpoint) - set(endpoints)
+        if unknown:
+            print(f"ERROR: unknown endpoints: {', '.join(sorted(unknown))}")
+            sys.exit(1)
+        endpoints = {name: endpoints[name] for name in args.endpoint}
+
+    mode = f"uvicorn ({args.workers} workers)" if args.server else "in-process"
+    print("=" * 70)
+    print(f"LOAD TEST - {mode}, concurrency {args.concurrency}, {args.requests} requests/endpoint")
+    print("=" * 70)
+
+    server = start_server(args) if args.server else None
+    try:
+        results = asyncio.run(run(args, endpoints))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.utcnow().isoformat(),
+        "mode": mode,
+        "concurrency": args.concurrency,
+        "requests_per_endpoint": args.requests,
+        "database": str(args.db),
+        "results": results,
+    }
+    output = args.output or RESULTS_DIR / f"{datetime.utcnow():%Y%m%dT%H%M%S}-{report['commit']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"\nResults saved to {output}")
+
+    if args.compare:
+        print_comparison(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
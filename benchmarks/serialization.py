@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark JSON encoding and compression of the large API payloads.
+
+This script:
+1. Fetches the positions and statements payloads from the local database
+2. Optionally scales the positions list up to House size (--scale)
+3. Times FastAPI's default encoder against orjson
+4. Reports the bytes sent raw, gzip- and brotli-compressed
+
+Usage:
+    python benchmarks/serialization.py
+    python benchmarks/serialization.py --issue trade-policy --scale 535
+    python benchmarks/serialization.py --runs 200
+"""
+import sys
+import json
+import gzip
+import argparse
+import timeit
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.services.compression import BROTLI_QUALITY, GZIP_LEVEL
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def fastapi_default(content) -> bytes:
+    """The encoding path of FastAPI's default JSONResponse."""
+    return json.dumps(
+        jsonable_encoder(content),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def scale_positions(payload: dict, size: int) -> dict:
+    """Repeat the position rows until the payload lists `size` members."""
+    rows = payload["positions"]
+    if not rows:
+        return payload
+    scaled = [dict(rows[i % len(rows)], member_id=f"X{i:06d}") for i in range(size)]
+    return dict(payload, positions=scaled)
+
+
+def bench(name: str, payload, runs: int):
+    """Print encode times and body sizes for one payload."""
+    print(f"\n{name}")
+    print("-" * 60)
+
+    encoders = [("json (FastAPI default)", fastapi_default)]
+    if orjson is not None:
+        encoders.append(("orjson", orjson.dumps))
+
+    body = fastapi_default(payload)
+    for label, encode in encoders:
+        seconds = timeit.timeit(lambda: encode(payload), number=runs) / runs
+        print(f"  encode {label:<24} {seconds * 1000:8.3f} ms")
+
+    print(f"  bytes  {'raw':<24} {len(body):8d}")
+    gzipped = gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    print(f"  bytes  {'gzip':<24} {len(gzipped):8d}")
+    if brotli is not None:
+        compressed = brotli.compress(body, quality=BROTLI_QUALITY)
+        print(f"  bytes  {'br':<24} {len(compressed):8d}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON encoding and compression")
+    parser.add_argument("--issue", default="trade-policy", help="Issue slug")
+    parser.add_argument("--scale", type=int, default=0, help="Scale positions to this many members")
+    parser.add_argument("--runs", type=int, default=50, help="Encode runs per measurement")
+    args = parser.parse_args()
+
+    client = TestClient(app)
+    headers = {"Accept-Encoding": "identity"}
+
+    response = client.get(f"/api/issues/{args.issue}/positions", headers=headers)
+    if response.status_code != 200:
+        print(f"Could not load positions for {args.issue}: {response.status_code}")
+        sys.exit(1)
+    positions = response.json()
+    if args.scale:
+        positions = scale_positions(positions, args.scale)
+
+    statements = client.get("/api/statements?limit=200", headers=headers).json()
+
+    print("=" * 60)
+    print("Serialization benchmark")
+    print("=" * 60)
+    bench(f"/api/issues/{args.issue}/positions", positions, args.runs)
+    bench("/api/statements?limit=200", statements, args.runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -32,23 +32,21 @@ function MemberPanel({ member, onClose }) {
 
   useEffect(() => {
     setLoading(true)
-    fetch(`/api/members/${member.member_id}`)
+    setStatementsLoading(true)
+
+    // Votes and statements in one request
+    fetch(`/api/members/${member.member_id}?include=statements`)
       .then(res => res.json())
       .then(data => {
         setDetails(data)
+        setStatements(data.statements)
         setLoading(false)
+        setStatementsLoading(false)
       })
-      .catch(() => setLoading(false))
-
-    // Fetch statements
-    setStatementsLoading(true)
-    fetch(`/api/members/${member.member_id}/statements`)
-      .then(res => res.json())
-      .then(data => {
-        setStatements(data)
+      .catch(() => {
+        setLoading(false)
         setStatementsLoading(false)
       })
-      .catch(() => setStatementsLoading(false))
   }, [member.member_id])
 
   return (
@@ -27,19 +27,27 @@ sys.path.insert(0, str(project_root))
 from dotenv import load_dotenv
 load_dotenv(project_root / ".env")
 
+from sqlalchemy import select
+
 from api.models import (
     SessionLocal,
     Statement,
+    StatementIssue,
     Member,
     Issue,
     Position,
     Evidence,
     EvidenceType,
+    STATEMENT_EVIDENCE,
+    upsert,
 )
 
 # Check for API key
 ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
 
+# Analyses written (and committed) together
+EVIDENCE_BATCH_SIZE = 25
+
 # The prompt template for position extraction
 ANALYSIS_PROMPT = """You are an expert at analyzing political statements to determine positions on trade policy.
 
@@ -166,44 +174,68 @@ def store_analysis(db, statement: Statement, analysis: dict):
     return analysis
 
 
-def create_evidence_record(
-    db,
-    statement: Statement,
-    analysis: dict,
-    position: Position,
-) -> Evidence:
-    """Create an Evidence record linking the statement to a position."""
-
-    # Check if evidence already exists for this statement
-    existing = db.query(Evidence).filter(
-        Evidence.position_id == position.id,
-        Evidence.type == EvidenceType.STATEMENT,
-        Evidence.source_url == statement.source_url,
-        Evidence.source_date == statement.source_date,
-    ).first()
-
-    if existing:
-        # Update existing
-        existing.extracted_position = analysis["score"]
-        existing.extraction_confidence = analysis["confidence"]
-        existing.extraction_reasoning = analysis["reasoning"]
-        return existing
-
-    evidence = Evidence(
-        position_id=position.id,
-        type=EvidenceType.STATEMENT,
-        source_url=statement.source_url,
-        source_name="Congressional Record",
-        source_date=statement.source_date,
-        raw_text=statement.text[:1000],  # Store first 1000 chars
-        extracted_position=analysis["score"],
-        extraction_confidence=analysis["confidence"],
-        extraction_reasoning=analysis["reasoning"],
-        weight=1.0,
-    )
+def store_evidence(db, issue: Issue, analyzed: list):
+    """
+    Write Evidence records for a batch of (statement, analysis) pairs.
 
-    db.add(evidence)
-    return evidence
+    Members without a position on the issue get a placeholder one first
+    (recalculated by calculate_scores.py). Evidence is upserted on its
+    (position, source_url, source_date) key; a re-analysis with the same
+    result leaves the existing row and its updated_at alone.
+    """
+    if not analyzed:
+        return
+
+    member_ids = sorted({statement.member_id for statement, _ in analyzed})
+    upsert(
+        db,
+        Position,
+        [
+            {
+                "member_id": member_id,
+                "issue_id": issue.id,
+                "score": 0.0,  # Will be recalculated
+                "confidence": 0.0,
+                "evidence_count": 0,
+            }
+            for member_id in member_ids
+        ],
+        index_elements=["member_id", "issue_id"],
+        update_columns=[],
+    )
+    position_ids = dict(db.execute(
+        select(Position.member_id, Position.id).where(
+            Position.issue_id == issue.id,
+            Position.member_id.in_(member_ids),
+        )
+    ).all())
+
+    # Keyed like the table, so a source analyzed twice keeps the later result
+    rows = {}
+    for statement, analysis in analyzed:
+        row = {
+            "position_id": position_ids[statement.member_id],
+            "type": EvidenceType.STATEMENT,
+            "source_url": statement.source_url,
+            "source_name": "Congressional Record",
+            "source_date": statement.source_date,
+            "raw_text": statement.text[:1000],  # Store first 1000 chars
+            "extracted_position": analysis["score"],
+            "extraction_confidence": analysis["confidence"],
+            "extraction_reasoning": analysis["reasoning"],
+            "weight": 1.0,
+        }
+        rows[(row["position_id"], row["source_url"], row["source_date"])] = row
+
+    upsert(
+        db,
+        Evidence,
+        list(rows.values()),
+        index_elements=["position_id", "source_url", "source_date"],
+        index_where=STATEMENT_EVIDENCE,
+        update_columns=["extracted_position", "extraction_confidence", "extraction_reasoning"],
+        skip_unchanged=True,
+    )
 
 
 def analyze_statements(limit: int = 10, reanalyze: bool = False):
@@ -219,8 +251,10 @@ def analyze_statements(limit: int = 10, reanalyze: bool = False):
             return
 
         # Get statements to analyze
-        query = db.query(Statement).filter(
-            Statement.issue_tags.contains("trade-policy")
+        query = db.query(Statement).join(
+            StatementIssue, StatementIssue.statement_id == Statement.id
+        ).filter(
+            StatementIssue.issue_id == issue.id
         )
 
         if not reanalyze:
@@ -237,56 +271,54 @@ def analyze_statements(limit: int = 10, reanalyze: bool = False):
 
         analyzed_count = 0
         error_count = 0
-
-        for i, statement in enumerate(statements):
-            member = db.query(Member).filter(Member.id == statement.member_id).first()
-            if not member:
-                print(f"[{i+1}/{len(statements)}] Skipping: Member not found")
-                continue
-
-            print(f"[{i+1}/{len(statements)}] {member.name} ({member.party.value}-{member.state})")
-            print(f"    Statement: {statement.text[:60]}...")
-
-            # Analyze with Claude
-            analysis = analyze_statement(client, statement, member)
-
-            if analysis is None:
-                error_count += 1
-                continue
-
-            print(f"    Score: {analysis['score']:+.2f} (confidence: {analysis['confidence']:.2f})")
-            print(f"    Reasoning: {analysis['reasoning'][:80]}...")
-
-            # Update statement record
-            statement.analyzed = 1
-            statement.analysis_date = datetime.utcnow()
-
-            # Get or create position for this member
-            position = db.query(Position).filter(
-                Position.member_id == member.id,
-                Position.issue_id == issue.id,
-            ).first()
-
-            if not position:
-                # Create a new position record
-                position = Position(
-                    member_id=member.id,
-                    issue_id=issue.id,
-                    score=0.0,  # Will be recalculated
-                    confidence=0.0,
-                    evidence_count=0,
-                )
-                db.add(position)
-                db.commit()
-
-            # Create evidence record
-            create_evidence_record(db, statement, analysis, position)
-
-            analyzed_count += 1
+        pending = []
+
+        members = {
+            member.id: member
+            for member in db.query(Member).filter(
+                Member.id.in_({statement.member_id for statement in statements})
+            )
+        }
+
+        try:
+            for i, statement in enumerate(statements):
+                member = members.get(statement.member_id)
+                if not member:
+                    print(f"[{i+1}/{len(statements)}] Skipping: Member not found")
+                    continue
+
+                print(f"[{i+1}/{len(statements)}] {member.name} ({member.party.value}-{member.state})")
+                print(f"    Statement: {statement.text[:60]}...")
+
+                # Analyze with Claude
+                analysis = analyze_statement(client, statement, member)
+
+                if analysis is None:
+                    error_count += 1
+                    continue
+
+                print(f"    Score: {analysis['score']:+.2f} (confidence: {analysis['confidence']:.2f})")
+                print(f"    Reasoning: {analysis['reasoning'][:80]}...")
+
+                # Update statement record
+                statement.analyzed = 1
+                statement.analysis_date = datetime.utcnow()
+
+                # Evidence is written in batches, committed with the statements
+                pending.append((statement, analysis))
+                analyzed_count += 1
+                if len(pending) >= EVIDENCE_BATCH_SIZE:
+                    store_evidence(db, issue, pending)
+                    db.commit()
+                    pending = []
+
+                print()
+        finally:
+            # Flush the last batch even when a later statement raised, so
+            # analyses already paid for aren't lost
+            store_evidence(db, issue, pending)
             db.commit()
 
-            print()
-
         print("=" * 60)
         print(f"Analysis complete!")
         print(f"Statements analyzed: {analyzed_count}")
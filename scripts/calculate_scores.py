@@ -1,25 +1,42 @@
 #!/usr/bin/env python3
 """
-Calculate position scores for all members on trade policy.
+Calculate position scores for all members on every issue.
 
-For each senator, calculates a position score from -1.0 (free trade)
-to +1.0 (protectionist) based on their voting record.
+For each member of both chambers, calculates a position score on each
+issue from -1.0 to +1.0 based on their voting record and analyzed
+statements. Issues are scored in parallel worker processes and stored
+in one transaction. --incremental rescores only the positions whose
+votes, bills or statement evidence changed since they were last scored.
+A published API snapshot (see export_snapshot.py) is re-exported.
 
 Usage:
     python scripts/calculate_scores.py
+    python scripts/calculate_scores.py --issue trade-policy --chamber senate
+    python scripts/calculate_scores.py --workers 1
+    python scripts/calculate_scores.py --incremental
 """
 import sys
+import os
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import and_, case, func, or_, select, union
 
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from api.models import (
+    engine,
     SessionLocal,
     Member,
     Bill,
+    BillIssue,
     Vote,
     Position,
     Issue,
@@ -28,7 +45,9 @@ from api.models import (
     VoteChoice,
     Chamber,
     Party,
+    upsert,
 )
+from api.services.statement_scores import statement_scores_query
 from scripts.utils.metadata import update_metadata
 
 # Weights for combining different evidence types
@@ -36,6 +55,17 @@ VOTE_WEIGHT = 0.6      # Votes are strongest signal (actions)
 STATEMENT_WEIGHT = 0.4  # Statements are secondary (words)
 # RATING_WEIGHT = 0.15  # Future: interest group ratings
 
+# Votes needed for full confidence in a vote score
+MAX_VOTES_FOR_FULL_CONFIDENCE = 5
+
+# Columns identifying one scored position (the positions unique key)
+SCORE_KEY = ["member_id", "issue_id"]
+# Stored values of a position, compared before an update
+POSITION_VALUES = ["score", "confidence", "vote_score", "statement_score", "evidence_count"]
+
+# Rows per INSERT ... ON CONFLICT statement when storing positions
+POSITION_BATCH_SIZE = 5000
+
 
 def calculate_vote_score(vote: Vote, bill: Bill) -> Optional[float]:
     """
@@ -66,48 +96,14 @@ def calculate_statement_score(db, member: Member, issue: Issue) -> dict:
         - confidence: float from 0.0 to 1.0
         - statement_count: number of statements used
     """
-    # Get position for this member/issue to find evidence
-    position = db.query(Position).filter(
-        Position.member_id == member.id,
-        Position.issue_id == issue.id,
-    ).first()
-
-    if not position:
-        return {"score": None, "confidence": 0, "statement_count": 0}
-
-    # Get statement evidence
-    evidence_records = db.query(Evidence).filter(
-        Evidence.position_id == position.id,
-        Evidence.type == EvidenceType.STATEMENT,
-        Evidence.extracted_position.isnot(None),
-    ).all()
-
-    if not evidence_records:
+    row = db.execute(statement_scores_query(issue_ids=[issue.id], member_ids=[member.id])).first()
+    if row is None:
         return {"score": None, "confidence": 0, "statement_count": 0}
 
-    # Calculate weighted average (weight by extraction confidence)
-    total_weight = 0
-    weighted_sum = 0
-
-    for ev in evidence_records:
-        weight = ev.extraction_confidence or 0.5
-        weighted_sum += ev.extracted_position * weight
-        total_weight += weight
-
-    if total_weight == 0:
-        return {"score": None, "confidence": 0, "statement_count": 0}
-
-    score = weighted_sum / total_weight
-    score = max(-1.0, min(1.0, score))
-
-    # Confidence based on number of statements
-    max_statements_for_full_confidence = 3
-    confidence = min(1.0, len(evidence_records) / max_statements_for_full_confidence)
-
     return {
-        "score": score,
-        "confidence": confidence,
-        "statement_count": len(evidence_records),
+        "score": row.statement_score,
+        "confidence": row.statement_confidence,
+        "statement_count": row.statement_count,
     }
 
 
@@ -116,6 +112,8 @@ def calculate_member_position(db, member: Member, issue_slug: str = "trade-polic
     Calculate a member's position score on an issue.
 
     Combines vote scores and statement scores using weighted average.
+    calculate_positions() scores whole chambers the same way; this
+    per-member version also returns the individual vote contributions.
 
     Returns dict with:
         - score: float from -1.0 to +1.0
@@ -131,9 +129,13 @@ def calculate_member_position(db, member: Member, issue_slug: str = "trade-polic
 
     # === VOTE SCORE ===
     # Get all bills tagged with this issue
-    bills = db.query(Bill).filter(
-        Bill.issue_tags.contains([issue_slug])
-    ).all()
+    bills = []
+    if issue:
+        bills = db.query(Bill).join(
+            BillIssue, BillIssue.bill_id == Bill.id
+        ).filter(
+            BillIssue.issue_id == issue.id
+        ).all()
 
     vote_score = None
     vote_confidence = 0
@@ -148,7 +150,7 @@ def calculate_member_position(db, member: Member, issue_slug: str = "trade-polic
         votes = db.query(Vote).filter(
             Vote.member_id == member.id,
             Vote.bill_id.in_(bill_ids)
-        ).all()
+        ).order_by(Vote.id).all()
 
         # Calculate score contributions
         contributions = []
@@ -174,8 +176,7 @@ def calculate_member_position(db, member: Member, issue_slug: str = "trade-polic
             vote_score = sum(contributions) / len(contributions)
             vote_score = max(-1.0, min(1.0, vote_score))
             vote_count = len(contributions)
-            max_votes_for_full_confidence = 5
-            vote_confidence = min(1.0, vote_count / max_votes_for_full_confidence)
+            vote_confidence = min(1.0, vote_count / MAX_VOTES_FOR_FULL_CONFIDENCE)
 
     # === STATEMENT SCORE ===
     statement_data = {"score": None, "confidence": 0, "statement_count": 0}
@@ -233,86 +234,422 @@ def calculate_member_position(db, member: Member, issue_slug: str = "trade-polic
     }
 
 
-def store_position(db, member: Member, issue: Issue, position_data: dict):
-    """Store or update a position in the database."""
-    if position_data["score"] is None:
-        return None
-
-    # Check for existing position
-    existing = db.query(Position).filter(
-        Position.member_id == member.id,
-        Position.issue_id == issue.id,
-    ).first()
-
-    evidence_count = position_data["vote_count"] + position_data.get("statement_count", 0)
-
-    if existing:
-        existing.score = position_data["score"]
-        existing.confidence = position_data["confidence"]
-        existing.vote_score = position_data.get("vote_score")
-        existing.statement_score = position_data.get("statement_score")
-        existing.evidence_count = evidence_count
-        existing.last_updated = datetime.utcnow()
-        return existing
-    else:
-        position = Position(
-            member_id=member.id,
-            issue_id=issue.id,
-            score=position_data["score"],
-            confidence=position_data["confidence"],
-            vote_score=position_data.get("vote_score"),
-            statement_score=position_data.get("statement_score"),
-            evidence_count=evidence_count,
+def load_scoring_data(
+    db,
+    issue_ids: Iterable[int],
+    chamber: Optional[Chamber] = None,
+    member_ids: Optional[Iterable[str]] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Load everything needed to score the given issues (optionally only for
+    some members), one query each for votes and statement scores.
+
+    Returns (votes, statements):
+        - votes: member_id, issue_id, contribution (one row per counted vote,
+          in id order, the order calculate_member_position() reads them)
+        - statements: member_id, issue_id, statement_score,
+          statement_confidence, statement_count (one row per pair, already
+          aggregated in SQL by statement_scores_query())
+    """
+    issue_ids = list(issue_ids)
+
+    # Same contribution as calculate_vote_score(); NULL when the vote doesn't count
+    contribution = case(
+        (Vote.vote == VoteChoice.YES, Bill.position_indicator),
+        (Vote.vote == VoteChoice.NO, -Bill.position_indicator),
+    )
+    votes = (
+        select(Vote.member_id, BillIssue.issue_id, contribution.label("contribution"))
+        .join(BillIssue, BillIssue.bill_id == Vote.bill_id)
+        .join(Bill, Bill.id == Vote.bill_id)
+        .where(BillIssue.issue_id.in_(issue_ids), contribution.isnot(None))
+        .order_by(Vote.id)
+    )
+    if chamber is not None:
+        votes = votes.where(Vote.member_id.in_(select(Member.id).where(Member.chamber == chamber)))
+    if member_ids is not None:
+        member_ids = list(member_ids)
+        votes = votes.where(Vote.member_id.in_(member_ids))
+    statements = statement_scores_query(issue_ids, member_ids, chamber)
+
+    return (
+        pd.DataFrame(db.execute(votes).all(), columns=SCORE_KEY + ["contribution"]),
+        pd.DataFrame(
+            db.execute(statements).all(),
+            columns=SCORE_KEY + ["statement_score", "statement_confidence", "statement_count"],
+        ),
+    )
+
+
+def score_positions(votes: pd.DataFrame, statements: pd.DataFrame) -> pd.DataFrame:
+    """
+    Score every (member, issue) pair in the loaded data at once.
+
+    Applies the same rules as calculate_member_position(), with identical
+    results: np.bincount adds each pair's votes in row order, exactly like
+    the per-member loop, and statement scores come from the same SQL
+    aggregation calculate_statement_score() uses. Returns one row per pair that has a score,
+    indexed by (member_id, issue_id), with score, confidence, vote_score,
+    statement_score, vote_count and statement_count columns.
+    """
+    pairs = pd.MultiIndex.from_frame(
+        pd.concat([votes[SCORE_KEY], statements[SCORE_KEY]])
+        .drop_duplicates()
+        .sort_values(SCORE_KEY)
+    )
+    n = len(pairs)
+
+    def group_codes(frame):
+        return pairs.get_indexer(pd.MultiIndex.from_frame(frame[SCORE_KEY]))
+
+    # Votes: mean contribution, clamped
+    codes = group_codes(votes)
+    vote_count = np.bincount(codes, minlength=n)
+    vote_sum = np.bincount(codes, weights=votes["contribution"].to_numpy(float), minlength=n)
+    has_votes = vote_count > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        vote_score = np.where(has_votes, np.clip(vote_sum / vote_count, -1.0, 1.0), np.nan)
+    vote_confidence = np.minimum(1.0, vote_count / MAX_VOTES_FOR_FULL_CONFIDENCE)
+
+    # Statements: already one row per pair, so just align them
+    codes = group_codes(statements)
+    has_statements = np.zeros(n, dtype=bool)
+    has_statements[codes] = True
+    statement_score = np.full(n, np.nan)
+    statement_score[codes] = statements["statement_score"].to_numpy(float)
+    statement_confidence = np.zeros(n)
+    statement_confidence[codes] = statements["statement_confidence"].to_numpy(float)
+    statement_count = np.zeros(n, dtype=np.int64)
+    statement_count[codes] = statements["statement_count"].to_numpy(np.int64)
+
+    # Combined: weighted average of whichever scores exist
+    both = has_votes & has_statements
+    total = VOTE_WEIGHT + STATEMENT_WEIGHT
+    score = np.select(
+        [both, has_votes, has_statements],
+        [
+            (vote_score * VOTE_WEIGHT + statement_score * STATEMENT_WEIGHT) / total,
+            vote_score,
+            statement_score,
+        ],
+        np.nan,
+    )
+    confidence = np.select(
+        [both, has_votes, has_statements],
+        [
+            (vote_confidence * VOTE_WEIGHT + statement_confidence * STATEMENT_WEIGHT) / total,
+            vote_confidence * 0.8,
+            statement_confidence * 0.6,
+        ],
+        0.0,
+    )
+
+    scores = pd.DataFrame(
+        {
+            "score": np.clip(score, -1.0, 1.0),
+            "confidence": confidence,
+            "vote_score": vote_score,
+            "statement_score": statement_score,
+            "vote_count": vote_count,
+            "statement_count": statement_count,
+        },
+        index=pairs,
+    )
+    return scores[has_votes | has_statements]
+
+
+def calculate_positions(
+    db,
+    issue_ids: Iterable[int],
+    chamber: Optional[Chamber] = None,
+    member_ids: Optional[Iterable[str]] = None,
+) -> pd.DataFrame:
+    """Score every member of a chamber (or both, or the given members) on the given issues."""
+    return score_positions(*load_scoring_data(db, issue_ids, chamber, member_ids))
+
+
+def find_dirty_pairs(db, issue_ids: Iterable[int], chamber: Optional[Chamber] = None) -> pd.MultiIndex:
+    """
+    Find the (member_id, issue_id) pairs whose inputs changed after their
+    position was last updated:
+        - a vote on a bill tagged with the issue was added or changed
+        - one of those bills changed (e.g. a new position_indicator)
+        - statement evidence for the position was added or changed
+    Pairs with a counted vote but no position yet are dirty as well.
+    Deleted votes or evidence and re-tagged bills are not detected; a
+    full recompute picks those up (refresh_data.py runs one once the
+    positions are older than its staleness threshold).
+    """
+    issue_ids = list(issue_ids)
+
+    # No change older than the oldest position can make a scored pair
+    # dirty, so the updated_at indexes only need to be read from there on.
+    # Unscored pairs are dirty however old their votes are.
+    since = db.execute(
+        select(func.min(Position.last_updated)).where(Position.issue_id.in_(issue_ids))
+    ).scalar() or datetime.min
+
+    position = and_(Position.member_id == Vote.member_id, Position.issue_id == BillIssue.issue_id)
+    unscored = and_(
+        Position.id.is_(None),
+        Vote.vote.in_([VoteChoice.YES, VoteChoice.NO]),
+        Bill.position_indicator.isnot(None),
+    )
+    changed_votes = (
+        select(Vote.member_id, BillIssue.issue_id)
+        .join(BillIssue, BillIssue.bill_id == Vote.bill_id)
+        .join(Bill, Bill.id == Vote.bill_id)
+        .outerjoin(Position, position)
+        .where(
+            BillIssue.issue_id.in_(issue_ids),
+            or_(unscored, and_(Vote.updated_at > since, Vote.updated_at > Position.last_updated)),
+        )
+    )
+    changed_bills = (
+        select(Vote.member_id, BillIssue.issue_id)
+        .select_from(Bill)
+        .join(BillIssue, BillIssue.bill_id == Bill.id)
+        .join(Vote, Vote.bill_id == Bill.id)
+        .outerjoin(Position, position)
+        .where(
+            BillIssue.issue_id.in_(issue_ids),
+            or_(unscored, and_(Bill.updated_at > since, Bill.updated_at > Position.last_updated)),
         )
-        db.add(position)
-        return position
+    )
+    changed_evidence = (
+        select(Position.member_id, Position.issue_id)
+        .join(Evidence, Evidence.position_id == Position.id)
+        .where(
+            Position.issue_id.in_(issue_ids),
+            Evidence.type == EvidenceType.STATEMENT,
+            Evidence.updated_at > Position.last_updated,
+        )
+    )
+    if chamber is not None:
+        chamber_members = select(Member.id).where(Member.chamber == chamber)
+        changed_votes = changed_votes.where(Vote.member_id.in_(chamber_members))
+        changed_bills = changed_bills.where(Vote.member_id.in_(chamber_members))
+        changed_evidence = changed_evidence.where(Position.member_id.in_(chamber_members))
+
+    rows = db.execute(union(changed_votes, changed_bills, changed_evidence)).all()
+    return pd.MultiIndex.from_tuples([tuple(row) for row in rows], names=SCORE_KEY)
+
+
+def score_dirty_pairs(db, dirty: pd.MultiIndex) -> pd.DataFrame:
+    """Rescore only the given (member_id, issue_id) pairs, one issue at a time."""
+    frames = []
+    for issue_id, pairs in dirty.to_frame(index=False).groupby("issue_id"):
+        frames.append(calculate_positions(db, [issue_id], member_ids=pairs["member_id"]))
+    scores = pd.concat(frames)
+    return scores[scores.index.isin(dirty)]
+
+
+def position_records(scores: pd.DataFrame) -> list:
+    """Scored rows as dicts of plain Python values, None for missing scores."""
+    records = scores.reset_index().astype(object)
+    return records.where(records.notna(), None).to_dict("records")
+
+
+def store_positions(
+    db,
+    positions: list,
+    rescored: bool = False,
+    scored_at: Optional[datetime] = None,
+) -> int:
+    """
+    Upsert scored positions (position_records() dicts) with batched
+    INSERT ... ON CONFLICT on the (member_id, issue_id) key.
+
+    Existing positions whose values didn't change are left alone, so
+    their last_updated stays put. With rescored (incremental runs) they
+    are updated anyway, marking the rescored pairs as up to date.
+    Written rows get scored_at (when the scoring snapshot was taken) as
+    their last_updated, so votes or evidence changed while the run was
+    scoring are still newer and show up as dirty on the next run.
+    Returns the number of rows inserted or changed.
+    """
+    if scored_at is None:
+        scored_at = datetime.utcnow()
+    rows = [
+        {
+            "member_id": position["member_id"],
+            "issue_id": position["issue_id"],
+            "score": position["score"],
+            "confidence": position["confidence"],
+            "vote_score": position["vote_score"],
+            "statement_score": position["statement_score"],
+            "evidence_count": position["vote_count"] + position["statement_count"],
+            "last_updated": scored_at,
+        }
+        for position in positions
+        if position["score"] is not None
+    ]
+    written = 0
+    for start in range(0, len(rows), POSITION_BATCH_SIZE):
+        written += upsert(
+            db,
+            Position,
+            rows[start:start + POSITION_BATCH_SIZE],
+            index_elements=SCORE_KEY,
+            update_columns=POSITION_VALUES + ["last_updated"],
+            skip_unchanged=not rescored,
+        )
+    return written
 
 
-def calculate_all_positions():
-    """Calculate positions for all senators on trade policy."""
+def snapshot_session():
+    """A session whose reads all see one consistent snapshot of the database."""
     db = SessionLocal()
+    if engine.dialect.name == "sqlite":
+        # pysqlite doesn't begin a transaction for SELECTs; start one so
+        # the votes and evidence queries read the same database state
+        db.connection().exec_driver_sql("BEGIN")
+    else:
+        db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+    return db
 
-    try:
-        # Get the trade policy issue
-        issue = db.query(Issue).filter(Issue.slug == "trade-policy").first()
-        if not issue:
-            print("ERROR: Trade policy issue not found. Run init_db.py first.")
-            return
 
-        # Get all senators
-        senators = db.query(Member).filter(
-            Member.chamber == Chamber.SENATE
-        ).all()
+def _init_worker():
+    """Give a worker process its own connections instead of the parent's."""
+    engine.dispose(close=False)
 
-        print(f"Calculating positions for {len(senators)} senators...")
-        print()
 
-        positions_calculated = 0
-        positions_skipped = 0
+def score_issue(issue_id: int, chamber: Optional[Chamber] = None) -> pd.DataFrame:
+    """Score one issue from its own snapshot (run in a worker process)."""
+    db = snapshot_session()
+    try:
+        return calculate_positions(db, [issue_id], chamber)
+    finally:
+        db.close()
 
-        for member in senators:
-            position_data = calculate_member_position(db, member, "trade-policy")
 
-            if position_data["score"] is not None:
-                store_position(db, member, issue, position_data)
-                positions_calculated += 1
-            else:
-                positions_skipped += 1
+def score_issues(issue_ids: list, chamber: Optional[Chamber] = None, workers: int = 1) -> pd.DataFrame:
+    """
+    Score several issues, fanning them out across a process pool.
 
+    With one worker everything is scored in-process from a single
+    snapshot; otherwise each issue is scored in a worker process that
+    reads its own snapshot.
+    """
+    if workers <= 1 or len(issue_ids) <= 1:
+        db = snapshot_session()
+        try:
+            return calculate_positions(db, issue_ids, chamber)
+        finally:
+            db.close()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        frames = list(pool.map(score_issue, issue_ids, [chamber] * len(issue_ids)))
+    return pd.concat(frames)
+
+
+def calculate_all_positions(
+    issue_slugs: Optional[Iterable[str]] = None,
+    chamber: Optional[Chamber] = None,
+    workers: Optional[int] = None,
+    incremental: bool = False,
+):
+    """
+    Calculate positions for every issue (or the given ones) in both
+    chambers (or the given one), then store them in one transaction.
+
+    With incremental, only the member/issue pairs whose votes, bills or
+    statement evidence changed since they were last scored are
+    recalculated (see find_dirty_pairs).
+    """
+    db = SessionLocal()
+
+    try:
+        query = db.query(Issue).order_by(Issue.id)
+        if issue_slugs:
+            issue_slugs = list(issue_slugs)
+            query = query.filter(Issue.slug.in_(issue_slugs))
+        issues = query.all()
+        if not issues:
+            print("ERROR: No issues found. Run init_db.py first.")
+            return
+        if issue_slugs:
+            missing = set(issue_slugs) - {issue.slug for issue in issues}
+            if missing:
+                print(f"WARNING: Unknown issues skipped: {', '.join(sorted(missing))}")
+
+        member_query = db.query(Member)
+        if chamber is not None:
+            member_query = member_query.filter(Member.chamber == chamber)
+        members = {member.id: member for member in member_query}
+
+        issue_ids = [issue.id for issue in issues]
+        started = time.perf_counter()
+
+        # Taken before any snapshot starts: changes committed after this
+        # may not have been read, so positions must not look newer
+        scored_at = datetime.utcnow()
+
+        if incremental:
+            print(f"Finding changed positions for {len(members)} members on {len(issues)} issues...")
+            snapshot = snapshot_session()
+            try:
+                dirty = find_dirty_pairs(snapshot, issue_ids, chamber)
+                print(f"Dirty member/issue pairs: {len(dirty)}")
+                if dirty.empty:
+                    # Still recorded below, so the positions aren't left stale
+                    print("Positions are up to date.")
+                    scores = None
+                else:
+                    scores = score_dirty_pairs(snapshot, dirty)
+            finally:
+                snapshot.close()
+            print()
+        else:
+            if workers is None:
+                workers = os.cpu_count() or 1
+            workers = max(1, min(workers, len(issues)))
+
+            print(f"Calculating positions for {len(members)} members on {len(issues)} issues "
+                  f"({workers} worker{'s' if workers != 1 else ''})...")
+            print()
+            scores = score_issues(issue_ids, chamber, workers)
+
+        elapsed = time.perf_counter() - started
+
+        # Write everything in one transaction, in member order per issue
+        records = position_records(scores) if scores is not None else []
+        by_pair = {(row["member_id"], row["issue_id"]): row for row in records}
+        ordered = []
+        for issue in issues:
+            stored = 0
+            for member_id in members:
+                position_data = by_pair.get((member_id, issue.id))
+                if position_data is not None:
+                    ordered.append(position_data)
+                    stored += 1
+            if stored or not incremental:
+                print(f"  {issue.slug:30} {stored:>6} positions")
+        positions_calculated = len(by_pair)
+
+        written = store_positions(db, ordered, rescored=incremental, scored_at=scored_at)
         db.commit()
 
-        print(f"Positions calculated: {positions_calculated}")
-        print(f"Skipped (no votes): {positions_skipped}")
+        print()
+        print(f"Positions calculated: {positions_calculated} (scored in {elapsed:.2f}s)")
+        print(f"Positions written: {written} ({positions_calculated - written} unchanged)")
+        # The whole table, also when only some issues or a chamber were scored
+        record_count = db.query(Position).count()
+        if incremental:
+            notes = f"Incremental: {positions_calculated} positions rescored"
+        else:
+            print(f"Skipped (no evidence): {len(members) * len(issues) - positions_calculated}")
+            notes = f"{positions_calculated} positions on {len(issues)} issues"
 
         # Update metadata
         update_metadata(
             db,
             data_type="positions",
-            record_count=positions_calculated,
+            record_count=record_count,
             source="calculated",
-            notes=f"Trade policy positions for {positions_calculated} senators"
+            notes=notes,
         )
-        print(f"Updated metadata: {positions_calculated} positions")
+        print(f"Updated metadata: {record_count} positions")
 
     finally:
         db.close()
@@ -327,8 +664,11 @@ def display_spectrum():
         if not issue:
             return
 
-        positions = db.query(Position).filter(
-            Position.issue_id == issue.id
+        positions = db.query(Position).join(
+            Member, Member.id == Position.member_id
+        ).filter(
+            Position.issue_id == issue.id,
+            Member.chamber == Chamber.SENATE,
         ).order_by(Position.score).all()
 
         if not positions:
@@ -436,15 +776,42 @@ def display_spectrum():
         db.close()
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Calculate member position scores")
+    parser.add_argument("--issue", action="append", metavar="SLUG",
+                        help="Only score this issue (repeatable; default: all issues)")
+    parser.add_argument("--chamber", choices=[c.value for c in Chamber],
+                        help="Only score this chamber (default: both)")
+    parser.add_argument("--workers", type=int,
+                        help="Worker processes (default: one per CPU, at most one per issue)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only rescore positions whose votes or evidence changed")
+    return parser.parse_args()
+
+
 def main():
+    args = parse_args()
+
     print("=" * 70)
-    print("POSITION SCORING - Trade Policy")
+    print("POSITION SCORING")
     print("=" * 70)
     print()
 
-    calculate_all_positions()
+    calculate_all_positions(
+        issue_slugs=args.issue,
+        chamber=Chamber(args.chamber) if args.chamber else None,
+        workers=args.workers,
+        incremental=args.incremental,
+    )
     display_spectrum()
 
+    # A published snapshot would otherwise keep the old positions (the API
+    # answers live until it is replaced)
+    from scripts.export_snapshot import export_snapshot, snapshot_is_current, snapshot_published
+    if snapshot_published() and not snapshot_is_current():
+        print()
+        print(f"Exported snapshot {export_snapshot().name}")
+
 
 if __name__ == "__main__":
     main()
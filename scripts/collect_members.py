@@ -23,7 +23,9 @@ sys.path.insert(0, str(project_root))
 import httpx
 from dotenv import load_dotenv
 
-from api.models import SessionLocal, Member, Chamber, Party
+from sqlalchemy import select
+
+from api.models import SessionLocal, Member, Chamber, Party, name_key, upsert
 from scripts.utils.metadata import update_metadata
 
 # Load environment variables
@@ -125,8 +127,7 @@ def populate_members(members_data: list[dict], api_key: str):
     db = SessionLocal()
 
     try:
-        added = 0
-        updated = 0
+        records = []
 
         with httpx.Client(timeout=30.0) as client:
             for i, member in enumerate(members_data):
@@ -159,11 +160,14 @@ def populate_members(members_data: list[dict], api_key: str):
                 state = latest_term.get("stateCode") or member.get("state")
 
                 # Build member record
+                name = details.get("directOrderName") or member.get("name")
                 member_record = {
                     "id": bioguide_id,
-                    "name": details.get("directOrderName") or member.get("name"),
+                    "name": name,
                     "first_name": details.get("firstName"),
                     "last_name": details.get("lastName"),
+                    "name_key": name_key(name),
+                    "last_name_key": name_key(details.get("lastName")),
                     "state": state,
                     "party": parse_party(details.get("partyName") or member.get("partyName", "")),
                     "chamber": Chamber.SENATE,
@@ -171,18 +175,15 @@ def populate_members(members_data: list[dict], api_key: str):
                     "photo_url": details.get("depiction", {}).get("imageUrl"),
                 }
 
-                # Check if member exists
-                existing = db.query(Member).filter(Member.id == bioguide_id).first()
-                if existing:
-                    # Update existing
-                    for key, value in member_record.items():
-                        if key != "id" and value is not None:
-                            setattr(existing, key, value)
-                    updated += 1
-                else:
-                    # Create new
-                    db.add(Member(**member_record))
-                    added += 1
+                records.append(member_record)
+
+            # Insert new members and update existing ones, keeping stored
+            # values the API didn't return
+            ids = [record["id"] for record in records]
+            existing_ids = set(db.scalars(select(Member.id).where(Member.id.in_(ids))))
+            upsert(db, Member, records, index_elements=["id"], keep_existing_on_null=True)
+            added = len(records) - len(existing_ids)
+            updated = len(existing_ids)
 
             db.commit()
             print(f"\nComplete: {added} added, {updated} updated")
@@ -39,6 +39,7 @@ from api.models import (
     Member,
     Statement,
     Chamber,
+    sync_issue_tags,
 )
 from scripts.utils.metadata import update_metadata
 
@@ -395,6 +396,10 @@ def collect_statements(
 
                     time.sleep(0.5)  # Rate limiting
 
+        # Link new statements to issues for the tag filters
+        sync_issue_tags(db)
+        db.commit()
+
         print(f"\n{'='*60}")
         print(f"Collection complete!")
         print(f"Days processed: {days_processed}")
@@ -35,6 +35,7 @@ from api.models import (
     Vote,
     Member,
     VoteChoice,
+    sync_issue_tags,
 )
 from scripts.utils.metadata import update_metadata
 
@@ -440,6 +441,10 @@ def collect_votes(congress: int = 118, limit: int = 50):
 
                 time.sleep(1)  # Rate limiting
 
+            # Link new bills to issues for the tag filters
+            sync_issue_tags(db)
+            db.commit()
+
             print(f"\n{'='*60}")
             print(f"Collection complete!")
             print(f"Bills stored: {bills_stored}")
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Export pre-rendered API responses to data/processed.
+
+This script:
+1. Renders every issue, positions (all/senate/house), member detail and
+   metadata response through the API
+2. Writes each as JSON plus precompressed .gz/.br files into a new
+   versioned directory under data/processed/snapshots
+3. Atomically repoints data/processed/current at the new directory and
+   prunes old versions and leftovers of failed exports
+
+Run it after calculate_scores.py (refresh_data.py and calculate_scores.py
+do so automatically once a snapshot has been published).
+Serve the result with SERVE_SNAPSHOT=1 or copy data/processed/current to
+static hosting.
+
+Usage:
+    python scripts/export_snapshot.py              # Export a new snapshot
+    python scripts/export_snapshot.py --keep 5     # Keep 5 old versions
+    python scripts/export_snapshot.py --if-changed # Only if the data changed
+"""
+import sys
+import gzip
+import json
+import os
+import shutil
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from api.main import app
+from api.models import SessionLocal, Issue, Member
+from api.services.compression import BROTLI_QUALITY, GZIP_LEVEL
+from api.services.reference import reference_version_sync
+from api.services.snapshot import (
+    CHAMBERS,
+    CURRENT_LINK,
+    MANIFEST_NAME,
+    SNAPSHOTS_DIR,
+    SnapshotStore,
+    snapshot_file,
+    snapshot_store,
+    version_token,
+)
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def snapshot_urls() -> list:
+    """List the API URLs that make up a snapshot."""
+    db = SessionLocal()
+    try:
+        slugs = db.scalars(select(Issue.slug).order_by(Issue.slug)).all()
+        member_ids = db.scalars(select(Member.id).order_by(Member.id)).all()
+    finally:
+        db.close()
+
+    urls = ["/api/issues", "/api/metadata"]
+    for slug in slugs:
+        urls.append(f"/api/issues/{slug}")
+        urls.append(f"/api/issues/{slug}/positions")
+        urls.extend(f"/api/issues/{slug}/positions?chamber={chamber}" for chamber in CHAMBERS)
+    urls.extend(f"/api/members/{member_id}" for member_id in member_ids)
+    return urls
+
+
+def data_version() -> str:
+    """The current data version, as recorded in manifests."""
+    db = SessionLocal()
+    try:
+        return version_token(reference_version_sync(db))
+    finally:
+        db.close()
+
+
+def snapshot_is_current() -> bool:
+    """True when the published snapshot was rendered from the current data."""
+    current = SnapshotStore(CURRENT_LINK).current()
+    return current is not None and current[1].get("data_version") == data_version()
+
+
+def snapshot_published() -> bool:
+    """True once any snapshot has been exported."""
+    return CURRENT_LINK.is_symlink()
+
+
+def write_file(path: Path, body: bytes) -> list:
+    """Write a body and its precompressed variants; return their encodings."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(body)
+    Path(str(path) + ".gz").write_bytes(gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0))
+    encodings = ["gzip"]
+    if brotli is not None:
+        Path(str(path) + ".br").write_bytes(brotli.compress(body, quality=BROTLI_QUALITY))
+        encodings.append("br")
+    return encodings
+
+
+def swap_current(target: Path):
+    """Point the current symlink at target in one atomic rename."""
+    temp_link = CURRENT_LINK.with_name(CURRENT_LINK.name + ".tmp")
+    if temp_link.is_symlink() or temp_link.exists():
+        temp_link.unlink()
+    temp_link.symlink_to(target.relative_to(CURRENT_LINK.parent), target_is_directory=True)
+    os.replace(temp_link, CURRENT_LINK)
+
+
+def prune_snapshots(keep: int):
+    """
+    Delete all but the newest `keep` old snapshots (never the current one)
+    and the staging directories left behind by failed exports.
+    """
+    current = CURRENT_LINK.resolve() if CURRENT_LINK.exists() else None
+    directories = [p for p in SNAPSHOTS_DIR.iterdir() if p.is_dir()]
+    versions = sorted((p for p in directories if not p.name.endswith(".tmp")), reverse=True)
+    old = [p for p in versions if p.resolve() != current]
+    leftovers = [p for p in directories if p.name.endswith(".tmp")]
+    for path in old[keep:] + leftovers:
+        shutil.rmtree(path)
+
+
+def export_snapshot(keep: int = 2) -> Path:
+    """
+    Render and publish a new snapshot.
+
+    Returns the new snapshot directory. Readers keep seeing the previous
+    snapshot until the final symlink swap.
+    """
+    version = datetime.utcnow().strftime("%Y%m%dT%H%M%S%fZ")
+    staging = SNAPSHOTS_DIR / f"{version}.tmp"
+    final = SNAPSHOTS_DIR / version
+    staging.mkdir(parents=True)
+    # Read before rendering: data changed meanwhile makes the snapshot stale
+    rendered_version = data_version()
+
+    # Render from the database, not from the snapshot being replaced
+    serving = snapshot_store.enabled
+    snapshot_store.enabled = False
+    try:
+        client = TestClient(app)
+        files = {}
+        for url in snapshot_urls():
+            path, _, query = url.partition("?")
+            response = client.get(url, headers={"Accept-Encoding": "identity"})
+            if response.status_code != 200:
+                raise RuntimeError(f"{url} returned {response.status_code}")
+            name = snapshot_file(path, query)
+            encodings = write_file(staging / name, response.content)
+            files[name] = {"etag": response.headers["etag"], "encodings": encodings}
+    except Exception:
+        shutil.rmtree(staging)
+        raise
+    finally:
+        snapshot_store.enabled = serving
+
+    manifest = {
+        "version": version,
+        "data_version": rendered_version,
+        "created_at": datetime.utcnow().isoformat(),
+        "files": files,
+    }
+    (staging / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, sort_keys=True))
+
+    os.replace(staging, final)
+    swap_current(final)
+    prune_snapshots(keep)
+    return final
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export pre-rendered API responses")
+    parser.add_argument(
+        "--keep",
+        type=int,
+        default=2,
+        help="Old snapshot versions to keep besides the current one (default: 2)"
+    )
+    parser.add_argument(
+        "--if-changed",
+        action="store_true",
+        help="Skip the export when the current snapshot has the latest data"
+    )
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("SNAPSHOT EXPORT")
+    print("=" * 60)
+
+    if args.if_changed and snapshot_is_current():
+        print(f"Current snapshot is up to date: {CURRENT_LINK.resolve().name}")
+        return
+
+    final = export_snapshot(keep=args.keep)
+    manifest = json.loads((final / MANIFEST_NAME).read_text())
+    print(f"Exported {len(manifest['files'])} responses to {final}")
+    print(f"Current snapshot: {CURRENT_LINK} -> {final.name}")
+
+
+if __name__ == "__main__":
+    main()
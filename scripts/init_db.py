@@ -22,6 +22,8 @@ from api.models import (
     engine,
     SessionLocal,
     Issue,
+    run_migrations,
+    sync_issue_tags,
 )
 
 
@@ -29,7 +31,8 @@ def create_tables():
     """Create all database tables."""
     print("Creating database tables...")
     Base.metadata.create_all(bind=engine)
-    print("Tables created successfully.")
+    applied = run_migrations(engine)
+    print(f"Tables created successfully ({len(applied)} migrations recorded).")
 
 
 def seed_trade_policy_issue(db):
@@ -88,6 +91,10 @@ def seed_trade_policy_issue(db):
     db.add(trade_policy)
     db.commit()
     db.refresh(trade_policy)
+
+    # Link any bills/statements already tagged with this issue
+    sync_issue_tags(db)
+    db.commit()
     print(f"Created issue: {trade_policy.name} (id={trade_policy.id})")
     return trade_policy
 
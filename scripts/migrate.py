@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Apply pending schema migrations to an existing database.
+
+This script:
+1. Records which migrations the database file has already received
+2. Applies any pending ones in place (indexes, constraints, new tables)
+
+The query plans of the hot API/scoring queries are checked by
+tests/test_query_plans.py.
+
+Usage:
+    python scripts/migrate.py              # Apply pending migrations
+    python scripts/migrate.py --status     # List pending migrations only
+"""
+import sys
+import argparse
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from api.models import engine, run_migrations, pending_migrations
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Apply pending schema migrations to the database"
+    )
+    parser.add_argument(
+        "--status", "-s",
+        action="store_true",
+        help="Just list pending migrations, don't apply them"
+    )
+
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Schema Migrations")
+    print("=" * 60)
+    print(f"Database: {engine.url}")
+    print()
+
+    if args.status:
+        pending = pending_migrations(engine)
+        if not pending:
+            print("Database is up to date.")
+        for version, name in pending:
+            print(f"  pending: {version:03d} {name}")
+    else:
+        applied = run_migrations(engine)
+        if not applied:
+            print("Database is up to date.")
+        for version, name in applied:
+            print(f"  applied: {version:03d} {name}")
+
+
+if __name__ == "__main__":
+    main()
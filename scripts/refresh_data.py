@@ -21,7 +21,7 @@ from datetime import datetime, timedelta
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from api.models import SessionLocal, DataMetadata, Member, Vote, Position, Statement
+from api.models import SessionLocal, DataMetadata, Member, Vote, Position, Statement, run_migrations
 from scripts.utils.metadata import get_all_metadata, is_stale, format_age, update_metadata
 
 
@@ -140,15 +140,15 @@ def refresh_votes(db, use_api: bool = False):
         return False
 
 
-def refresh_positions(db):
-    """Recalculate all positions."""
+def refresh_positions(db, incremental: bool = True):
+    """Recalculate positions (only the changed ones unless incremental is False)."""
     print("\n" + "=" * 50)
     print("RECALCULATING POSITIONS")
     print("=" * 50)
 
     from scripts.calculate_scores import calculate_all_positions
     try:
-        calculate_all_positions()
+        calculate_all_positions(incremental=incremental)
         return True
     except Exception as e:
         print(f"Position calculation failed: {e}")
@@ -183,8 +183,31 @@ def refresh_statements(db, use_api: bool = False):
         return False
 
 
+def export_snapshot_files():
+    """Export a new static API snapshot, unless the current one is up to date."""
+    print("\n" + "=" * 50)
+    print("EXPORTING SNAPSHOT")
+    print("=" * 50)
+
+    from scripts.export_snapshot import export_snapshot, snapshot_is_current
+    try:
+        if snapshot_is_current():
+            print("Snapshot is up to date; nothing was refreshed")
+            return True
+        final = export_snapshot()
+        print(f"Exported snapshot {final.name}")
+        return True
+    except Exception as e:
+        print(f"Snapshot export failed: {e}")
+        return False
+
+
 def check_and_refresh(max_age_days: int = 30, force: bool = False, use_api: bool = False):
     """Check all data types and refresh if stale."""
+    # Bring older database files up to the current schema first
+    for version, name in run_migrations():
+        print(f"Applied migration {version:03d} {name}")
+
     db = SessionLocal()
 
     try:
@@ -229,11 +252,17 @@ def check_and_refresh(max_age_days: int = 30, force: bool = False, use_api: bool
             if not refresh_statements(db, use_api):
                 success = False
 
-        # Always recalculate positions if members or votes changed
+        # Always recalculate positions if members or votes changed. Positions
+        # that are themselves stale get a full recompute, which also picks
+        # up deleted votes and evidence that incremental runs can't see.
         if needs_refresh["members"] or needs_refresh["votes"] or needs_refresh["positions"]:
-            if not refresh_positions(db):
+            if not refresh_positions(db, incremental=not needs_refresh["positions"]):
                 success = False
 
+        # Publish the pre-rendered responses if a refresh changed the data
+        if not export_snapshot_files():
+            success = False
+
         print("\n" + "=" * 70)
         if success:
             print("REFRESH COMPLETE")
@@ -17,7 +17,9 @@ from datetime import datetime
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from api.models import SessionLocal, Member, Chamber, Party
+from sqlalchemy import select
+
+from api.models import SessionLocal, Member, Chamber, Party, name_key, upsert
 from scripts.utils.metadata import update_metadata
 
 
@@ -54,8 +56,7 @@ def seed_members(data: dict):
     term_start = datetime(2025, 1, 3)  # 119th Congress start date
 
     try:
-        added = 0
-        updated = 0
+        records = []
 
         for member_data in data["members"]:
             bioguide_id = member_data["id"]
@@ -76,6 +77,8 @@ def seed_members(data: dict):
                 "name": full_name,
                 "first_name": first_name,
                 "last_name": last_name,
+                "name_key": name_key(full_name),
+                "last_name_key": name_key(last_name),
                 "state": member_data["state"],
                 "party": parse_party(member_data["party"]),
                 "chamber": Chamber.SENATE,
@@ -83,16 +86,14 @@ def seed_members(data: dict):
                 "photo_url": photo_url,
             }
 
-            # Check if member exists
-            existing = db.query(Member).filter(Member.id == bioguide_id).first()
-            if existing:
-                for key, value in member_record.items():
-                    if key != "id":
-                        setattr(existing, key, value)
-                updated += 1
-            else:
-                db.add(Member(**member_record))
-                added += 1
+            records.append(member_record)
+
+        # Insert new members and update existing ones in one statement
+        ids = [record["id"] for record in records]
+        existing_ids = set(db.scalars(select(Member.id).where(Member.id.in_(ids))))
+        upsert(db, Member, records, index_elements=["id"])
+        added = len(records) - len(existing_ids)
+        updated = len(existing_ids)
 
         db.commit()
         print(f"Seeding complete: {added} added, {updated} updated")
@@ -17,7 +17,7 @@ from datetime import datetime
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from api.models import SessionLocal, Statement, Member
+from api.models import SessionLocal, Statement, Member, sync_issue_tags
 from scripts.utils.metadata import update_metadata
 
 SEED_FILE = project_root / "data" / "seed" / "statements.json"
@@ -90,6 +90,10 @@ def seed_statements(data: dict):
 
         db.commit()
 
+        # Link statements to issues for the tag filters
+        sync_issue_tags(db)
+        db.commit()
+
         print(f"\nStatements seeded: {added}")
         print(f"Statements skipped: {skipped}")
 
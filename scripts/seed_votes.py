@@ -20,9 +20,12 @@ sys.path.insert(0, str(project_root))
 from api.models import (
     SessionLocal,
     Bill,
+    BillIssue,
+    Issue,
     Vote,
     Member,
     VoteChoice,
+    sync_issue_tags,
 )
 from scripts.utils.metadata import update_metadata
 
@@ -151,6 +154,10 @@ def seed_bills_and_votes(data: dict):
             print(f"  Position indicator: {bill_data.get('position_indicator', 0):.2f}")
             print(f"  Votes recorded: {bill_votes}")
 
+        # Link bills to issues for the tag filters
+        sync_issue_tags(db)
+        db.commit()
+
         print(f"\n{'='*60}")
         print(f"Seeding complete!")
         print(f"Bills: {bills_added} added, {bills_updated} updated")
@@ -176,8 +183,10 @@ def print_summary():
     db = SessionLocal()
     try:
         total_bills = db.query(Bill).count()
-        trade_bills = db.query(Bill).filter(
-            Bill.issue_tags.contains(["trade-policy"])
+        trade_bills = db.query(BillIssue).join(
+            Issue, Issue.id == BillIssue.issue_id
+        ).filter(
+            Issue.slug == "trade-policy"
         ).count()
         total_votes = db.query(Vote).count()
 
@@ -20,30 +20,22 @@ def update_metadata(
         source: Data source ('congress_api', 'seed_file', etc.)
         notes: Optional notes about the update
     """
-    from api.models import DataMetadata
-
-    # Check if metadata exists
-    metadata = db.query(DataMetadata).filter(
-        DataMetadata.data_type == data_type
-    ).first()
-
-    if metadata:
-        metadata.last_updated = datetime.utcnow()
-        metadata.record_count = record_count
-        metadata.source = source
-        metadata.notes = notes
-    else:
-        metadata = DataMetadata(
-            data_type=data_type,
-            last_updated=datetime.utcnow(),
-            record_count=record_count,
-            source=source,
-            notes=notes,
-        )
-        db.add(metadata)
-
+    from api.models import DataMetadata, upsert
+
+    upsert(
+        db,
+        DataMetadata,
+        [{
+            "data_type": data_type,
+            "last_updated": datetime.utcnow(),
+            "record_count": record_count,
+            "source": source,
+            "notes": notes,
+        }],
+        index_elements=["data_type"],
+    )
     db.commit()
-    return metadata
+    return get_metadata(db, data_type)
 
 
 def get_metadata(db, data_type: str):
@@ -0,0 +1,256 @@
+"""
+Shared test fixtures.
+
+The API and the scripts build their engines from DATABASE_URL when
+api.models is first imported, so it is pointed at a throwaway SQLite file
+here, before any test module imports the app. seeded_db fills that file
+with a small, reproducible dataset: a 5-member Senate and a 40-member
+House, so per-request costs can be compared across chamber sizes.
+
+Tests that take db_engine run once on a fresh SQLite file and once on
+Postgres. The Postgres run needs TEST_POSTGRES_URL, pointing at a
+database whose tables the tests may drop and recreate, e.g.
+postgresql://postgres@localhost/issue_positions_test; without it, the
+Postgres run is skipped.
+"""
+import os
+import random
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+TEST_DATA_DIR = Path(tempfile.mkdtemp(prefix="issue-positions-tests-"))
+os.environ["DATABASE_URL"] = f"sqlite:///{TEST_DATA_DIR / 'test.db'}"
+os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ["SERVE_SNAPSHOT"] = ""
+# Keep the background reference poller out of per-request SQL counts
+os.environ["REFERENCE_REFRESH_SECONDS"] = "3600"
+
+from sqlalchemy import create_engine, event, text  # noqa: E402
+from sqlalchemy.engine import make_url  # noqa: E402
+
+from api.models import (  # noqa: E402
+    Base,
+    Bill,
+    Chamber,
+    DataMetadata,
+    Evidence,
+    EvidenceType,
+    Issue,
+    Member,
+    Party,
+    Position,
+    Statement,
+    Vote,
+    VoteChoice,
+    async_engine,
+    engine,
+    init_db,
+    sync_issue_tags,
+)
+from api.models.database import SYNC_DRIVERS  # noqa: E402
+
+SENATE_SIZE = 5
+HOUSE_SIZE = 40
+STATEMENT_COUNT = 600
+SEEDED_AT = datetime(2025, 6, 1)
+ISSUES = [
+    ("Trade Policy", "trade-policy", "Free Trade", "Protectionist"),
+    ("Immigration", "immigration", "Open", "Restrictive"),
+    ("Empty Issue", "empty-issue", "Left", "Right"),
+]
+
+
+def dataset(seed: int = 7) -> dict:
+    """Rows of the test dataset, keyed by model; same rows for the same seed."""
+    rng = random.Random(seed)
+    members = []
+    for chamber, size, prefix in ((Chamber.SENATE, SENATE_SIZE, "S"), (Chamber.HOUSE, HOUSE_SIZE, "H")):
+        for i in range(size):
+            # Pairs of members share a name, so name order needs a tie-breaker
+            members.append({
+                "id": f"{prefix}{i:06d}",
+                "name": f"Member {prefix}{i // 2:03d}",
+                "first_name": "Member",
+                "last_name": f"{prefix}{i // 2:03d}",
+                "state": "CA",
+                "party": rng.choice([Party.DEMOCRAT, Party.REPUBLICAN, Party.INDEPENDENT]),
+                "chamber": chamber,
+            })
+    issues = [
+        {
+            "id": i + 1,
+            "name": name,
+            "slug": slug,
+            "description": f"Positions on {name.lower()}.",
+            "spectrum_left_label": left,
+            "spectrum_right_label": right,
+        }
+        for i, (name, slug, left, right) in enumerate(ISSUES)
+    ]
+
+    # Votes on three bills per chamber for each of the first two issues
+    bills, votes = [], []
+    for issue in issues[:2]:
+        for chamber, bill_type in ((Chamber.SENATE, "s"), (Chamber.HOUSE, "hr")):
+            for n in range(3):
+                bill_id = f"{bill_type}{issue['id']}{n}-119"
+                bills.append({
+                    "id": bill_id,
+                    "congress": 119,
+                    "bill_type": bill_type,
+                    "bill_number": issue["id"] * 10 + n,
+                    "title": f"{issue['name']} Act {n}",
+                    "issue_tags": [issue["slug"]],
+                    "position_indicator": rng.choice((-1.0, -0.5, 0.5, 1.0)),
+                })
+                for member in members:
+                    if member["chamber"] != chamber:
+                        continue
+                    votes.append({
+                        "id": len(votes) + 1,
+                        "member_id": member["id"],
+                        "bill_id": bill_id,
+                        "vote": rng.choice([VoteChoice.YES, VoteChoice.NO, VoteChoice.NOT_VOTING]),
+                        "vote_date": datetime(2025, 3, 1) + timedelta(days=len(votes) % 60),
+                        "roll_call_id": f"119-{bill_id}",
+                    })
+
+    # Positions for most member/issue pairs, some with statement evidence
+    positions, evidence = [], []
+    for member in members:
+        for issue in issues[:2]:
+            if rng.random() < 0.2:
+                continue
+            position_id = len(positions) + 1
+            positions.append({
+                "id": position_id,
+                "member_id": member["id"],
+                "issue_id": issue["id"],
+                "score": round(rng.uniform(-1.0, 1.0), 3),
+                "confidence": 0.5,
+            })
+            for k in range(rng.randrange(3)):
+                evidence.append({
+                    "position_id": position_id,
+                    "type": EvidenceType.STATEMENT,
+                    "source_url": f"https://example.org/{position_id}/{k}",
+                    "source_date": datetime(2025, 2, 1) + timedelta(days=k),
+                    "extracted_position": round(rng.uniform(-1.0, 1.0), 3),
+                    "extraction_confidence": rng.choice((None, 0.4, 0.9)),
+                })
+
+    # "steel" appears 0-3 times per statement, for search ranking
+    statements = []
+    for i in range(STATEMENT_COUNT):
+        statements.append({
+            "id": i + 1,
+            "member_id": rng.choice(members)["id"],
+            "title": f"Remarks {i + 1}",
+            "text": "tariff trade border wages " * 5 + "steel " * (i % 4),
+            "source_date": datetime(2024, 1, 1) + timedelta(hours=rng.randrange(24 * 300)),
+            "issue_tags": [rng.choice(issues[:2])["slug"]],
+            "analyzed": 1,
+        })
+    # Texts exactly at and just over the 300-character preview length
+    statements[1]["text"] = ("tariff trade " * 30)[:300]
+    statements[2]["text"] = ("tariff trade " * 30)[:301]
+
+    metadata = [
+        {"data_type": data_type, "last_updated": SEEDED_AT, "record_count": count, "source": "tests"}
+        for data_type, count in (
+            ("members", len(members)),
+            ("votes", len(votes)),
+            ("statements", len(statements)),
+            ("positions", len(positions)),
+        )
+    ]
+    return {
+        Member: members,
+        Issue: issues,
+        Bill: bills,
+        Vote: votes,
+        Position: positions,
+        Evidence: evidence,
+        Statement: statements,
+        DataMetadata: metadata,
+    }
+
+
+def load_dataset(conn, rows: dict):
+    """Insert dataset() rows and derive the issue tag tables."""
+    for model, model_rows in rows.items():
+        if not model_rows:
+            continue
+        conn.execute(model.__table__.insert(), model_rows)
+        serial = model.__table__.autoincrement_column
+        if conn.dialect.name == "postgresql" and serial is not None and serial.name in model_rows[0]:
+            # Explicit ids don't advance serial sequences
+            table = model.__tablename__
+            conn.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{table}', '{serial.name}'), "
+                f"(SELECT max({serial.name}) FROM {table}))"
+            ))
+    sync_issue_tags(conn)
+
+
+@pytest.fixture(scope="session")
+def seeded_db():
+    """The app's SQLite database, migrated and seeded once per session."""
+    init_db()
+    rows = dataset()
+    with engine.begin() as conn:
+        load_dataset(conn, rows)
+    return rows
+
+
+@pytest.fixture(scope="session")
+def client(seeded_db):
+    """TestClient with the app lifespan (reference data, warm caches) running."""
+    from fastapi.testclient import TestClient
+
+    from api.main import app
+
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def sql_log():
+    """(statement, parameters) of every SQL statement the API runs during a test."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    sync_engine = async_engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(sync_engine, "before_cursor_execute", record)
+
+
+@pytest.fixture(params=["sqlite", "postgresql"])
+def db_engine(request, tmp_path):
+    """An engine on an empty schema (Base.metadata), per backend."""
+    if request.param == "sqlite":
+        bind = create_engine(f"sqlite:///{tmp_path / 'engine.db'}")
+    else:
+        url = os.environ.get("TEST_POSTGRES_URL")
+        if not url:
+            pytest.skip("TEST_POSTGRES_URL is not set")
+        url = make_url(url)
+        bind = create_engine(url.set(drivername=SYNC_DRIVERS.get(url.drivername, url.drivername)))
+        # Throwaway database: start from whatever the last run left behind
+        Base.metadata.drop_all(bind)
+
+    Base.metadata.create_all(bind)
+    yield bind
+    if request.param != "sqlite":
+        Base.metadata.drop_all(bind)
+    bind.dispose()
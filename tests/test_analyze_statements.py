@@ -0,0 +1,33 @@
+"""Statement analysis: writing the extracted evidence."""
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from api.models import Evidence, Statement
+from conftest import dataset, load_dataset
+from scripts import analyze_statements
+
+
+def test_analyses_before_a_crash_are_stored(db_engine, monkeypatch):
+    with db_engine.begin() as conn:
+        load_dataset(conn, dataset())
+        before = conn.scalar(select(func.count(Evidence.id)))
+
+    calls = []
+
+    def analyze(client, statement, member):
+        calls.append(statement.id)
+        if len(calls) > 3:
+            raise KeyboardInterrupt
+        return {"score": 0.5, "confidence": 0.9, "reasoning": "Supports tariffs."}
+
+    monkeypatch.setattr(analyze_statements, "SessionLocal", sessionmaker(bind=db_engine, autoflush=False))
+    monkeypatch.setattr(analyze_statements, "get_anthropic_client", lambda: None)
+    monkeypatch.setattr(analyze_statements, "analyze_statement", analyze)
+    with pytest.raises(KeyboardInterrupt):
+        analyze_statements.analyze_statements(limit=10, reanalyze=True)
+
+    with Session(db_engine) as db:
+        assert db.scalar(select(func.count(Evidence.id))) == before + 3
+        dates = db.scalars(select(Statement.analysis_date).where(Statement.id.in_(calls[:3])))
+        assert all(date is not None for date in dates)
@@ -0,0 +1,66 @@
+"""Accept-Encoding negotiation and compressed responses."""
+import pytest
+
+from api.services import compression
+from api.services.compression import MIN_COMPRESS_SIZE, choose_encoding
+
+LARGE_URL = "/api/issues/trade-policy/positions"
+SMALL_URL = "/api/issues/trade-policy"
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        (None, None),
+        ("", None),
+        ("gzip", "gzip"),
+        ("br", "br"),
+        ("gzip, deflate, br", "br"),
+        ("gzip;q=1.0, br;q=0.5", "gzip"),
+        ("br;q=0.2, gzip;q=0.8", "gzip"),
+        ("GZIP; Q=0.5", "gzip"),
+        ("gzip;q=0, br;q=0", None),
+        ("deflate", None),
+        ("*", "br"),
+        ("*;q=0.5, br;q=0", "gzip"),
+        ("identity;q=0, gzip", "gzip"),
+        ("identity;q=0", None),
+        ("gzip;q=oops", None),
+    ],
+)
+def test_choose_encoding(accept_encoding, expected):
+    assert choose_encoding(accept_encoding) == expected
+
+
+def test_gzip_only_without_brotli(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", None)
+    assert choose_encoding("br, gzip") == "gzip"
+    assert choose_encoding("br") is None
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "br"])
+def test_large_bodies_are_compressed(client, encoding):
+    identity = client.get(LARGE_URL, headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in identity.headers
+    assert len(identity.content) >= MIN_COMPRESS_SIZE
+
+    response = client.get(LARGE_URL, headers={"Accept-Encoding": encoding})
+    assert response.headers["content-encoding"] == encoding
+    assert response.headers["etag"] == identity.headers["etag"][:-1] + f'-{encoding}"'
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert int(response.headers["content-length"]) < len(identity.content)
+    assert response.json() == identity.json()
+
+
+def test_small_bodies_are_sent_as_is(client):
+    response = client.get(SMALL_URL, headers={"Accept-Encoding": "gzip, br"})
+    assert len(response.content) < MIN_COMPRESS_SIZE
+    assert "content-encoding" not in response.headers
+    assert "Accept-Encoding" in response.headers["vary"]
+
+
+def test_compressed_etag_revalidates(client):
+    etag = client.get(LARGE_URL, headers={"Accept-Encoding": "gzip"}).headers["etag"]
+    response = client.get(LARGE_URL, headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
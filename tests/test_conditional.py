@@ -0,0 +1,59 @@
+"""ETag / Last-Modified validators and 304 responses."""
+import pytest
+
+from api.services.conditional import etag_cache
+
+MEMBER_URL = "/api/members/H000003"
+POSITIONS_URL = "/api/issues/trade-policy/positions"
+EARLY = "Mon, 01 Jan 2024 00:00:00 GMT"
+LATE = "Fri, 01 Jan 2100 00:00:00 GMT"
+
+
+def test_responses_carry_validators(client):
+    response = client.get(MEMBER_URL)
+    assert response.status_code == 200
+    assert response.headers["etag"].startswith('"')
+    assert response.headers["last-modified"] == "Sun, 01 Jun 2025 00:00:00 GMT"
+    assert response.headers["cache-control"] == "no-cache"
+    assert "Accept-Encoding" in response.headers["vary"]
+
+
+@pytest.mark.parametrize("url", [MEMBER_URL, POSITIONS_URL, "/api/issues"])
+def test_matching_etag_is_not_modified(client, url):
+    etag = client.get(url).headers["etag"]
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_other_etag_gets_the_body(client):
+    response = client.get(MEMBER_URL, headers={"If-None-Match": '"something-else"'})
+    assert response.status_code == 200
+    assert response.json()["id"] == "H000003"
+
+
+@pytest.mark.parametrize("url", [MEMBER_URL, POSITIONS_URL])
+def test_if_modified_since(client, url):
+    client.get(url)
+    assert client.get(url, headers={"If-Modified-Since": LATE}).status_code == 304
+    assert client.get(url, headers={"If-Modified-Since": EARLY}).status_code == 200
+
+
+def test_if_modified_since_is_only_answered_for_a_url_already_served(client):
+    etag_cache.clear()
+    response = client.get(MEMBER_URL, headers={"If-Modified-Since": LATE})
+    assert response.status_code == 200
+    assert client.get(MEMBER_URL, headers={"If-Modified-Since": LATE}).status_code == 304
+
+
+@pytest.mark.parametrize("url", ["/api/members/NOPE", "/api/issues/nope/positions"])
+def test_missing_resources_are_not_found_with_if_modified_since(client, url):
+    response = client.get(url, headers={"If-Modified-Since": LATE})
+    assert response.status_code == 404
+
+
+def test_invalid_params_are_rejected_with_if_modified_since(client):
+    client.get("/api/statements")
+    response = client.get("/api/statements?fields=bogus", headers={"If-Modified-Since": LATE})
+    assert response.status_code == 400
@@ -0,0 +1,51 @@
+"""Engine setup: the read-only API engine and SQLite pragmas."""
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from api.models import async_engine, engine
+from api.models.database import SQLITE_PRAGMAS
+
+# PRAGMA reads return numbers for these settings
+PRAGMA_VALUES = {"synchronous": {"NORMAL": 1}, "temp_store": {"MEMORY": 2}}
+
+
+def expected_pragmas() -> dict:
+    return {
+        name: PRAGMA_VALUES.get(name, {}).get(value, value)
+        for name, value in SQLITE_PRAGMAS.items()
+    }
+
+
+async def read_pragmas(conn) -> dict:
+    return {
+        name: (await conn.execute(text(f"PRAGMA {name}"))).scalar()
+        for name in (*SQLITE_PRAGMAS, "journal_mode")
+    }
+
+
+def test_api_engine_opens_the_database_read_only(client):
+    async def write():
+        async with async_engine.begin() as conn:
+            await conn.execute(text("UPDATE members SET name = name"))
+
+    assert "mode=ro" in str(async_engine.url)
+    with pytest.raises(OperationalError, match="readonly"):
+        client.portal.call(write)
+
+
+def test_api_connections_get_the_pragmas(client):
+    async def pragmas():
+        async with async_engine.connect() as conn:
+            return await read_pragmas(conn)
+
+    assert client.portal.call(pragmas) == dict(expected_pragmas(), journal_mode="wal")
+
+
+def test_writer_connections_get_the_pragmas(seeded_db):
+    with engine.connect() as conn:
+        pragmas = {
+            name: conn.execute(text(f"PRAGMA {name}")).scalar()
+            for name in (*SQLITE_PRAGMAS, "journal_mode")
+        }
+    assert pragmas == dict(expected_pragmas(), journal_mode="wal")
@@ -0,0 +1,82 @@
+"""Streaming NDJSON/CSV exports."""
+import csv
+import io
+import json
+
+import pytest
+
+from api.models import Position, Statement, Vote
+from api.services import export
+
+
+def ndjson(response) -> list:
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+@pytest.mark.parametrize("batch_size", [1000, 7, 600, 599])
+def test_ndjson_streams_every_row_once_across_partitions(client, seeded_db, monkeypatch, batch_size):
+    monkeypatch.setattr(export, "EXPORT_BATCH_SIZE", batch_size)
+    response = client.get("/api/export/statements.ndjson")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["content-disposition"] == 'attachment; filename="statements.ndjson"'
+
+    rows = ndjson(response)
+    assert [row["id"] for row in rows] == sorted(s["id"] for s in seeded_db[Statement])
+    first = next(s for s in seeded_db[Statement] if s["id"] == rows[0]["id"])
+    assert rows[0]["text"] == first["text"]
+    assert rows[0]["source_date"] == first["source_date"].isoformat()
+    assert rows[0]["issue_tags"] == first["issue_tags"]
+
+
+@pytest.mark.parametrize("batch_size", [1000, 7, 600])
+def test_csv_has_one_header_row_and_every_row(client, seeded_db, monkeypatch, batch_size):
+    monkeypatch.setattr(export, "EXPORT_BATCH_SIZE", batch_size)
+    response = client.get("/api/export/votes.csv")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/csv; charset=utf-8"
+
+    header, *rows = list(csv.reader(io.StringIO(response.text)))
+    assert header == ["id", "member_id", "bill_id", "congress", "roll_call_id", "session", "vote_date", "vote"]
+    assert [int(row[0]) for row in rows] == [vote["id"] for vote in seeded_db[Vote]]
+    assert {row[-1] for row in rows} == {"yes", "no", "not_voting"}
+
+
+def test_csv_joins_list_values(client):
+    response = client.get("/api/export/statements.csv")
+    header, *rows = list(csv.reader(io.StringIO(response.text)))
+    tags = header.index("issue_tags")
+    assert {row[tags] for row in rows} == {"trade-policy", "immigration"}
+
+
+def test_empty_exports(client):
+    ndjson_response = client.get("/api/export/positions.ndjson", params={"issue": "empty-issue"})
+    assert ndjson_response.status_code == 200
+    assert ndjson_response.content == b""
+
+    csv_response = client.get("/api/export/positions.csv", params={"issue": "empty-issue"})
+    assert csv_response.text.splitlines() == [
+        "member_id,name,party,state,chamber,issue,score,confidence,vote_score,"
+        "statement_score,evidence_count,last_updated"
+    ]
+
+
+def test_filters(client, seeded_db):
+    rows = ndjson(client.get("/api/export/positions.ndjson", params={"issue": "immigration", "chamber": "senate"}))
+    expected = [p for p in seeded_db[Position] if p["issue_id"] == 2 and p["member_id"].startswith("S")]
+    assert [(row["member_id"], row["issue"], row["chamber"]) for row in rows] == [
+        (p["member_id"], "immigration", "senate") for p in expected
+    ]
+
+    rows = ndjson(client.get("/api/export/votes.ndjson", params={"member_id": "H000003"}))
+    assert [row["id"] for row in rows] == [v["id"] for v in seeded_db[Vote] if v["member_id"] == "H000003"]
+
+
+def test_unknown_format_is_rejected(client):
+    response = client.get("/api/export/votes.xml")
+    assert response.status_code == 400
+    assert "ndjson" in response.json()["detail"]
+
+
+def test_unknown_dataset_is_not_found(client):
+    assert client.get("/api/export/members.csv").status_code == 404
@@ -0,0 +1,68 @@
+"""Sparse fieldsets and the text preview mode."""
+import pytest
+
+from api.models import Statement
+from api.services.fields import PREVIEW_CHARS, STATEMENT_FIELDS
+from test_statements import walk_pages
+
+
+def expected_preview(text: str) -> str:
+    return text[:PREVIEW_CHARS] + "..." if len(text) > PREVIEW_CHARS else text
+
+
+def test_preview_truncates_long_texts_only(client, seeded_db):
+    rows = walk_pages(client, "/api/statements", limit=200, text="preview", fields="id,text")
+    texts = {s["id"]: s["text"] for s in seeded_db[Statement]}
+    assert {len(text) for text in texts.values()} >= {PREVIEW_CHARS, PREVIEW_CHARS + 1}
+    assert {row["id"]: row["text"] for row in rows} == {
+        statement_id: expected_preview(text) for statement_id, text in texts.items()
+    }
+
+
+def test_preview_keeps_a_text_of_exactly_the_preview_length(client, seeded_db):
+    statement = next(s for s in seeded_db[Statement] if len(s["text"]) == PREVIEW_CHARS)
+    rows = walk_pages(client, f"/api/members/{statement['member_id']}/statements", limit=200, text="preview")
+    assert next(row["text"] for row in rows if row["id"] == statement["id"]) == statement["text"]
+
+
+def test_full_text_is_the_default(client, seeded_db):
+    longest = max(seeded_db[Statement], key=lambda s: len(s["text"]))
+    rows = walk_pages(client, "/api/statements", limit=200, member_id=longest["member_id"])
+    assert next(row["text"] for row in rows if row["id"] == longest["id"]) == longest["text"]
+
+
+@pytest.mark.parametrize("url", ["/api/statements", "/api/members/H000003/statements"])
+def test_unknown_text_mode_is_rejected(client, url):
+    response = client.get(url, params={"text": "bogus"})
+    assert response.status_code == 400
+
+
+def test_fields_select_statement_keys_in_order(client):
+    statements = client.get("/api/statements?fields=title,id,member_name&limit=5").json()["statements"]
+    assert [list(s) for s in statements] == [["id", "member_name", "title"]] * 5
+
+
+def test_fields_select_position_keys(client):
+    body = client.get("/api/issues/trade-policy/positions?fields=score,member_id").json()
+    assert {tuple(p) for p in body["positions"]} == {("member_id", "score")}
+    assert {tuple(m) for m in body["no_data"]} == {("member_id",)}
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/api/statements?fields=id,bogus",
+        "/api/members/H000003/statements?fields=member_name",
+        "/api/issues/trade-policy/positions?fields=score,bogus",
+    ],
+)
+def test_unknown_fields_are_rejected(client, url):
+    response = client.get(url)
+    assert response.status_code == 400
+    assert "Unknown fields" in response.json()["detail"]
+
+
+def test_every_statement_field_can_be_selected_alone(client):
+    for field in STATEMENT_FIELDS:
+        statements = client.get(f"/api/statements?fields={field}&limit=2").json()["statements"]
+        assert [list(s) for s in statements] == [[field]] * 2
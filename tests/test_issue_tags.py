@@ -0,0 +1,41 @@
+"""Issue tag junction tables."""
+from datetime import datetime
+
+from sqlalchemy import select, update
+
+from api.models import Bill, BillIssue, Issue, Member, Statement, StatementIssue, sync_issue_tags
+from conftest import dataset
+
+
+def tag_rows(conn):
+    bills = set(conn.execute(select(BillIssue.bill_id, BillIssue.issue_id)).all())
+    statements = set(conn.execute(select(StatementIssue.statement_id, StatementIssue.issue_id)).all())
+    return bills, statements
+
+
+def test_tags_match_whole_slugs_and_resync_replaces_them(db_engine):
+    rows = dataset()
+    with db_engine.begin() as conn:
+        conn.execute(Member.__table__.insert(), rows[Member][:1])
+        conn.execute(Issue.__table__.insert(), [
+            {"id": 1, "name": "Trade", "slug": "trade"},
+            {"id": 2, "name": "Trade Policy", "slug": "trade-policy"},
+            {"id": 3, "name": "Immigration", "slug": "immigration"},
+        ])
+        conn.execute(Bill.__table__.insert(), {
+            "id": "hr1-119", "congress": 119, "bill_type": "hr", "bill_number": 1,
+            "title": "Tariff Act", "issue_tags": ["trade-policy"],
+        })
+        conn.execute(Statement.__table__.insert(), {
+            "id": 1, "member_id": rows[Member][0]["id"], "text": "On tariffs",
+            "source_date": datetime(2025, 1, 2), "issue_tags": ["trade-policy", "unknown-issue"],
+        })
+
+        assert sync_issue_tags(conn) == 2
+        assert tag_rows(conn) == ({("hr1-119", 2)}, {(1, 2)})
+        assert sync_issue_tags(conn) == 0
+
+        conn.execute(update(Bill).values(issue_tags=["immigration"]))
+        conn.execute(update(Statement).values(issue_tags=["trade", "immigration"]))
+        assert sync_issue_tags(conn) == 5
+        assert tag_rows(conn) == ({("hr1-119", 3)}, {(1, 1), (1, 3)})
@@ -0,0 +1,35 @@
+"""Positions matrix endpoint and its cache."""
+from api.services.cache import ResponseCache, positions_cache
+
+
+def test_issue_order_follows_the_request_and_shares_one_cache_entry(client):
+    positions_cache.clear()
+    forward = client.get("/api/positions/matrix?issues=trade-policy,immigration").json()
+    backward = client.get("/api/positions/matrix?issues=immigration,trade-policy").json()
+
+    assert len(positions_cache) == 1
+    assert [issue["slug"] for issue in forward["issues"]] == ["trade-policy", "immigration"]
+    assert [issue["slug"] for issue in backward["issues"]] == ["immigration", "trade-policy"]
+    assert list(backward["scores"]) == ["immigration", "trade-policy"]
+    assert list(backward["confidence"]) == ["immigration", "trade-policy"]
+    assert forward["members"] == backward["members"]
+    assert forward["scores"] == backward["scores"]
+
+
+def test_unknown_issue_is_a_404(client):
+    response = client.get("/api/positions/matrix?issues=trade-policy,nope")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Issue not found: nope"
+
+
+def test_response_cache_evicts_least_recently_used():
+    cache = ResponseCache(max_entries=2)
+    cache.set("a", (1,), "A")
+    cache.set("b", (1,), "B")
+    assert cache.get("a", (1,)) == "A"
+    cache.set("c", (1,), "C")
+
+    assert len(cache) == 2
+    assert cache.get("b", (1,)) is None
+    assert cache.get("a", (1,)) == "A"
+    assert cache.get("c", (1,)) == "C"
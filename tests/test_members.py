@@ -0,0 +1,198 @@
+"""Member endpoints: SQL statements per request, and member lookups."""
+import sys
+from collections import Counter
+
+import pytest
+from sqlalchemy import delete, select
+
+from api.main import MAX_MEMBER_IDS, name_prefix, prefix_upper_bound
+from api.models import Chamber, Evidence, Member, Party, Position, Statement, Vote, engine
+
+# Data version, member, positions, votes joined to bills
+MEMBER_QUERIES = 4
+# Statement evidence and the per-issue statement scores
+EVIDENCE_QUERIES = 2
+# The first page of statements
+STATEMENTS_QUERIES = 1
+
+
+def most_and_least_active(rows) -> list:
+    """The member ids with the most and the fewest votes, statements and evidence."""
+    member_of_position = {position["id"]: position["member_id"] for position in rows[Position]}
+    activity = Counter({member_id: 0 for member_id in member_of_position.values()})
+    activity.update(vote["member_id"] for vote in rows[Vote])
+    activity.update(statement["member_id"] for statement in rows[Statement])
+    activity.update(member_of_position[ev["position_id"]] for ev in rows[Evidence])
+    ranked = activity.most_common()
+    return [ranked[0][0], ranked[-1][0]]
+
+
+@pytest.mark.parametrize(
+    "include, expected",
+    [
+        (None, MEMBER_QUERIES),
+        ("evidence", MEMBER_QUERIES + EVIDENCE_QUERIES),
+        ("statements", MEMBER_QUERIES + STATEMENTS_QUERIES),
+        ("statements,evidence", MEMBER_QUERIES + EVIDENCE_QUERIES + STATEMENTS_QUERIES),
+    ],
+)
+def test_member_query_count_does_not_grow_with_activity(client, sql_log, seeded_db, include, expected):
+    counts = {}
+    for member_id in most_and_least_active(seeded_db):
+        sql_log.clear()
+        response = client.get(f"/api/members/{member_id}", params={"include": include} if include else {})
+        assert response.status_code == 200
+        counts[member_id] = len(sql_log)
+
+    assert list(counts.values()) == [expected, expected]
+
+
+def test_member_includes_are_returned(client):
+    body = client.get("/api/members/H000003?include=statements,evidence").json()
+    assert {"votes", "statements", "statement_scores"} <= set(body["evidence"])
+    assert set(body["statements"]) == {"statements", "count", "limit", "next"}
+
+
+def test_unknown_include_is_rejected(client):
+    response = client.get("/api/members/H000003?include=votes")
+    assert response.status_code == 400
+
+
+def member_ids(response) -> list:
+    assert response.status_code == 200
+    body = response.json()
+    assert body["count"] == len(body["members"])
+    return [member["id"] for member in body["members"]]
+
+
+def by_name(members) -> list:
+    return [m["id"] for m in sorted(members, key=lambda m: (m["name"], m["id"]))]
+
+
+# Names whose search keys differ from SQLite's lower(): non-ASCII case,
+# ß folding to ss, a decomposed accent, and the last code point
+ACCENTED_MEMBERS = [
+    {"id": "X000001", "name": "Émile Dupré", "last_name": "Dupré"},
+    {"id": "X000002", "name": "Hans Großmann", "last_name": "Großmann"},
+    {"id": "X000003", "name": "Zoe\u0301 Ma\u0301rquez", "last_name": "Ma\u0301rquez"},
+    {"id": "X000004", "name": "Member \U0010ffff", "last_name": "\U0010ffff"},
+]
+
+
+@pytest.fixture
+def accented_members(seeded_db):
+    rows = [
+        {**member, "state": "ZZ", "party": Party.INDEPENDENT, "chamber": Chamber.HOUSE}
+        for member in ACCENTED_MEMBERS
+    ]
+    with engine.begin() as conn:
+        conn.execute(Member.__table__.insert(), rows)
+    yield {member["id"]: member for member in ACCENTED_MEMBERS}
+    with engine.begin() as conn:
+        conn.execute(delete(Member).where(Member.id.in_([m["id"] for m in ACCENTED_MEMBERS])))
+
+
+def test_ids_keep_missing_and_filtered_out_ids_apart(client, seeded_db):
+    senator, representative = seeded_db[Member][0], seeded_db[Member][-1]
+    ids = [representative["id"], "Z999999", senator["id"], representative["id"]]
+
+    body = client.get("/api/members", params={"ids": ",".join(ids) + ", ,"}).json()
+    assert [m["id"] for m in body["members"]] == by_name([senator, representative])
+    assert body["missing"] == ["Z999999"]
+
+    body = client.get("/api/members", params={"ids": ",".join(ids), "chamber": "senate"}).json()
+    assert [m["id"] for m in body["members"]] == [senator["id"]]
+    assert body["missing"] == [representative["id"], "Z999999"]
+
+
+def test_too_many_ids_are_rejected(client):
+    ids = ",".join(f"H{i:06d}" for i in range(MAX_MEMBER_IDS + 1))
+    assert client.get("/api/members", params={"ids": ids}).status_code == 400
+
+
+@pytest.mark.parametrize(
+    "params, keep",
+    [
+        ({"chamber": "house"}, lambda m: m["chamber"] == Chamber.HOUSE),
+        ({"chamber": "SENATE"}, lambda m: m["chamber"] == Chamber.SENATE),
+        ({"party": "d"}, lambda m: m["party"] == Party.DEMOCRAT),
+        ({"state": "ca", "party": "R"}, lambda m: m["state"] == "CA" and m["party"] == Party.REPUBLICAN),
+        ({"state": "TX"}, lambda m: False),
+        # Unknown chambers and parties don't filter
+        ({"chamber": "lords", "party": "X"}, lambda m: True),
+    ],
+)
+def test_filters(client, seeded_db, params, keep):
+    expected = by_name(m for m in seeded_db[Member] if keep(m))
+    assert member_ids(client.get("/api/members", params={**params, "limit": MAX_MEMBER_IDS})) == expected
+
+
+def test_limit_caps_the_name_ordered_list(client, seeded_db):
+    ordered = by_name(seeded_db[Member])
+    assert member_ids(client.get("/api/members", params={"limit": 3})) == ordered[:3]
+    assert member_ids(client.get("/api/members", params={"limit": 0})) == ordered[:1]
+    assert member_ids(client.get("/api/members")) == ordered[:100]
+
+
+@pytest.mark.parametrize("q", ["member h01", "MEMBER H01", "  Member H01 "])
+def test_name_prefix_is_case_insensitive(client, seeded_db, q):
+    expected = by_name(m for m in seeded_db[Member] if m["name"].lower().startswith("member h01"))
+    assert len(expected) == 20
+    assert member_ids(client.get("/api/members", params={"q": q})) == expected
+
+
+def test_name_prefix_matches_the_last_name(client, seeded_db):
+    expected = by_name(m for m in seeded_db[Member] if m["last_name"].startswith("S00"))
+    assert member_ids(client.get("/api/members", params={"q": "s00"})) == expected
+    assert member_ids(client.get("/api/members", params={"q": "nobody"})) == []
+
+
+@pytest.mark.parametrize(
+    "q, expected",
+    [
+        ("émile", ["X000001"]),
+        ("ÉMILE D", ["X000001"]),
+        ("dupré", ["X000001"]),
+        ("dupre", []),
+        ("grossm", ["X000002"]),
+        ("GROSSMANN", ["X000002"]),
+        ("großm", ["X000002"]),
+        # Composed accent against a decomposed name
+        ("zoé", ["X000003"]),
+        ("má", ["X000003"]),
+        ("\U0010ffff", ["X000004"]),
+        ("member \U0010ffff", ["X000004"]),
+        ("\U0010ffff\U0010ffff", []),
+    ],
+)
+def test_name_prefix_folds_unicode(client, accented_members, q, expected):
+    assert member_ids(client.get("/api/members", params={"q": q})) == expected
+
+
+@pytest.mark.parametrize(
+    "prefix, bound",
+    [
+        ("ab", "ac"),
+        ("a\U0010ffff", "b"),
+        ("a\U0010ffff\U0010ffff", "b"),
+        ("\U0010ffff", None),
+        ("\ud7ff", "\ue000"),
+    ],
+)
+def test_prefix_upper_bound(prefix, bound):
+    assert chr(sys.maxunicode) == "\U0010ffff"
+    assert prefix_upper_bound(prefix) == bound
+
+
+def test_name_keys_are_compared_by_code_point(db_engine):
+    # Postgres' default collation would order "émile" after "f"
+    names = ["Émile Dupré", "Emile Fontaine", "Fabien Émile", "émilie", "Zoé"]
+    with db_engine.begin() as conn:
+        conn.execute(Member.__table__.insert(), [
+            {"id": f"X{i:06d}", "name": name, "state": "ZZ", "party": Party.INDEPENDENT, "chamber": Chamber.HOUSE}
+            for i, name in enumerate(names)
+        ])
+        matched = conn.execute(
+            select(Member.name).where(name_prefix(Member.name_key, "ÉMIL")).order_by(Member.name_key)
+        ).scalars().all()
+    assert matched == ["Émile Dupré", "émilie"]
@@ -0,0 +1,79 @@
+"""Per-route request metrics."""
+import pytest
+from fastapi import Response
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.services.metrics import metrics_registry
+from api.services.snapshot import snapshot_store
+from api.settings import settings
+
+FAILING_PATH = "/api/_test/failing"
+
+
+@pytest.fixture
+def failing_route():
+    """A route that raises, like an unexpected bug in a handler."""
+    async def fail():
+        raise RuntimeError("boom")
+
+    app.add_api_route(FAILING_PATH, fail, include_in_schema=False)
+    yield FAILING_PATH
+    app.router.routes = [route for route in app.router.routes if getattr(route, "path", None) != FAILING_PATH]
+
+
+def metric_lines(client, name: str) -> list:
+    body = client.get("/api/_metrics").text
+    return [line for line in body.splitlines() if line.startswith(name)]
+
+
+def test_requests_are_recorded_per_route(client):
+    metrics_registry.clear()
+    client.get("/api/issues/trade-policy")
+    client.get("/api/issues/immigration")
+
+    assert metric_lines(client, 'api_request_duration_seconds_count{method="GET",route="/api/issues/{slug}"}') == [
+        'api_request_duration_seconds_count{method="GET",route="/api/issues/{slug}"} 2'
+    ]
+
+
+def test_unhandled_errors_count_as_5xx(failing_route):
+    metrics_registry.clear()
+    client = TestClient(app, raise_server_exceptions=False)
+    response = client.get(failing_route)
+    assert response.status_code == 500
+
+    errors = metric_lines(client, "api_request_errors_total")
+    latency = metric_lines(client, "api_request_duration_seconds_count")
+
+    assert errors == [f'api_request_errors_total{{method="GET",route="{failing_route}"}} 1']
+    assert f'api_request_duration_seconds_count{{method="GET",route="{failing_route}"}} 1' in latency
+
+
+def test_streamed_responses_count_the_queries_run_while_streaming(client):
+    metrics_registry.clear()
+    response = client.get("/api/export/statements.ndjson")
+    assert response.status_code == 200
+
+    route = 'method="GET",route="/api/export/{dataset}.{fmt}"'
+    assert metric_lines(client, f"api_sql_queries_max{{{route}}}") == [f"api_sql_queries_max{{{route}}} 1"]
+
+
+def test_server_timing_in_debug_mode(client, monkeypatch):
+    monkeypatch.setattr(settings, "debug", True)
+    response = client.get("/api/issues/trade-policy/positions")
+    assert response.headers["server-timing"].startswith("db;dur=")
+
+
+def test_snapshot_responses_are_recorded_as_snapshot(client, monkeypatch):
+    served = Response(content=b"{}", media_type="application/json")
+    monkeypatch.setattr(
+        snapshot_store, "response",
+        lambda request, version: served if request.url.path == "/api/issues" else None,
+    )
+    metrics_registry.clear()
+    assert client.get("/api/issues").content == b"{}"
+
+    assert metric_lines(client, 'api_request_duration_seconds_count{method="GET",route="snapshot"}') == [
+        'api_request_duration_seconds_count{method="GET",route="snapshot"} 1'
+    ]
@@ -0,0 +1,155 @@
+"""Schema migrations: status checks and applying them."""
+import sqlite3
+
+from datetime import datetime
+
+from sqlalchemy import create_engine, inspect, select
+
+from api.models import (
+    Bill,
+    Evidence,
+    EvidenceType,
+    Issue,
+    Member,
+    Position,
+    Vote,
+    VoteChoice,
+    pending_migrations,
+    run_migrations,
+)
+from api.models.migrations import MIGRATIONS
+from conftest import dataset
+
+ALL_MIGRATIONS = [(version, name) for version, name, _ in MIGRATIONS]
+
+
+def test_status_of_a_missing_database_creates_nothing(tmp_path):
+    path = tmp_path / "nothere.db"
+    bind = create_engine(f"sqlite:///{path}")
+
+    assert pending_migrations(bind) == ALL_MIGRATIONS
+    assert not path.exists()
+
+
+def test_status_does_not_create_the_migrations_table(tmp_path):
+    path = tmp_path / "legacy.db"
+    sqlite3.connect(path).close()
+    bind = create_engine(f"sqlite:///{path}")
+
+    assert pending_migrations(bind) == ALL_MIGRATIONS
+    assert not inspect(bind).has_table("schema_migrations")
+
+
+def test_migrations_apply_once(db_engine):
+    assert pending_migrations(db_engine) == ALL_MIGRATIONS
+    assert run_migrations(db_engine) == ALL_MIGRATIONS
+    assert pending_migrations(db_engine) == []
+    assert run_migrations(db_engine) == []
+
+
+def test_statement_evidence_key_drops_newer_duplicates(db_engine):
+    # A database from before migration 006: no unique key, duplicates
+    key = next(i for i in Evidence.__table__.indexes if i.name == "uq_evidence_position_statement")
+    rows = dataset()
+    with db_engine.begin() as conn:
+        key.drop(conn)
+        conn.execute(Member.__table__.insert(), rows[Member][:1])
+        conn.execute(Issue.__table__.insert(), rows[Issue][:1])
+        conn.execute(Position.__table__.insert(), {"member_id": rows[Member][0]["id"], "issue_id": 1, "score": 0.0})
+        position_id = conn.execute(select(Position.id)).scalar_one()
+        source = {"position_id": position_id, "source_url": "https://example.org/1", "source_date": datetime(2025, 1, 2)}
+        undated = {"position_id": position_id, "source_url": "https://example.org/2", "source_date": None}
+        conn.execute(Evidence.__table__.insert(), [
+            {"type": EvidenceType.STATEMENT, "extracted_position": 0.1, **source},
+            {"type": EvidenceType.STATEMENT, "extracted_position": 0.2, **source},
+            {"type": EvidenceType.VOTE, "extracted_position": None, **source},
+            {"type": EvidenceType.STATEMENT, "extracted_position": 0.3, **undated},
+            {"type": EvidenceType.STATEMENT, "extracted_position": 0.4, **undated},
+        ])
+
+    run_migrations(db_engine)
+
+    with db_engine.connect() as conn:
+        kept = conn.execute(
+            select(Evidence.type, Evidence.extracted_position).order_by(Evidence.id)
+        ).all()
+    assert kept == [
+        (EvidenceType.STATEMENT, 0.1),
+        (EvidenceType.VOTE, None),
+        (EvidenceType.STATEMENT, 0.3),
+        (EvidenceType.STATEMENT, 0.4),
+    ]
+    assert "uq_evidence_position_statement" in {i["name"] for i in inspect(db_engine).get_indexes("evidence")}
+
+
+def test_hot_path_keys_keep_the_newest_duplicate(db_engine):
+    # A database from before migration 001: no unique keys, duplicates
+    rows = dataset()
+    member_id = rows[Member][0]["id"]
+    with db_engine.begin() as conn:
+        for table, name in ((Vote.__table__, "uq_votes_member_bill_roll_call"),
+                            (Position.__table__, "uq_positions_member_issue")):
+            next(i for i in table.indexes if i.name == name).drop(conn)
+        conn.execute(Member.__table__.insert(), rows[Member][:1])
+        conn.execute(Issue.__table__.insert(), rows[Issue][:2])
+        conn.execute(Bill.__table__.insert(), rows[Bill][:1])
+        vote = {
+            "member_id": member_id,
+            "bill_id": rows[Bill][0]["id"],
+            "vote_date": datetime(2025, 3, 1),
+            "roll_call_id": "119-1",
+        }
+        conn.execute(Vote.__table__.insert(), [
+            {"id": 1, "vote": VoteChoice.NO, **vote},
+            {"id": 2, "vote": VoteChoice.YES, **vote},
+            {"id": 3, "vote": VoteChoice.YES, **dict(vote, roll_call_id=None)},
+            {"id": 4, "vote": VoteChoice.NO, **dict(vote, roll_call_id=None)},
+        ])
+        conn.execute(Position.__table__.insert(), [
+            {"id": 1, "member_id": member_id, "issue_id": 1, "score": 0.1},
+            {"id": 2, "member_id": member_id, "issue_id": 1, "score": 0.2},
+            {"id": 3, "member_id": member_id, "issue_id": 2, "score": 0.3},
+        ])
+        conn.execute(Evidence.__table__.insert(), [
+            {"position_id": 1, "type": EvidenceType.VOTE, "vote_id": 1},
+            {"position_id": 3, "type": EvidenceType.VOTE, "vote_id": 3},
+        ])
+
+    run_migrations(db_engine)
+
+    with db_engine.connect() as conn:
+        assert conn.execute(select(Vote.id).order_by(Vote.id)).scalars().all() == [2, 3, 4]
+        assert conn.execute(select(Position.id, Position.score).order_by(Position.id)).all() == [(2, 0.2), (3, 0.3)]
+        assert conn.execute(select(Evidence.position_id, Evidence.vote_id).order_by(Evidence.id)).all() == [
+            (2, 2),
+            (3, 3),
+        ]
+    indexes = {i["name"] for table in ("votes", "positions") for i in inspect(db_engine).get_indexes(table)}
+    assert {"uq_votes_member_bill_roll_call", "uq_positions_member_issue"} <= indexes
+
+
+def test_member_name_keys_are_backfilled(db_engine):
+    # A database from before migration 007: no key columns, lower() indexes
+    with db_engine.begin() as conn:
+        for name in ("ix_members_name_key", "ix_members_last_name_key"):
+            next(i for i in Member.__table__.indexes if i.name == name).drop(conn)
+        conn.exec_driver_sql("ALTER TABLE members DROP COLUMN name_key")
+        conn.exec_driver_sql("ALTER TABLE members DROP COLUMN last_name_key")
+        conn.exec_driver_sql(
+            "INSERT INTO members (id, name, last_name, state, party, chamber, updated_at) VALUES "
+            "('X000001', 'Émile Großmann', 'Großmann', 'ZZ', 'INDEPENDENT', 'HOUSE', '2025-01-02 00:00:00'), "
+            "('X000002', 'Cher', NULL, 'ZZ', 'INDEPENDENT', 'HOUSE', '2025-01-02 00:00:00')"
+        )
+
+    run_migrations(db_engine)
+
+    with db_engine.connect() as conn:
+        assert conn.execute(
+            select(Member.id, Member.name_key, Member.last_name_key, Member.updated_at).order_by(Member.id)
+        ).all() == [
+            ("X000001", "émile grossmann", "grossmann", datetime(2025, 1, 2)),
+            ("X000002", "cher", None, datetime(2025, 1, 2)),
+        ]
+    indexes = {i["name"] for i in inspect(db_engine).get_indexes("members")}
+    assert {"ix_members_name_key", "ix_members_last_name_key"} <= indexes
+    assert not {"ix_members_name_lower", "ix_members_last_name_lower"} & indexes
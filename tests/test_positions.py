@@ -0,0 +1,102 @@
+"""Issue positions endpoint: output and SQL statements per request."""
+import pytest
+
+from api.models import Chamber, Issue, Member, Position, SessionLocal
+from api.services.cache import positions_cache
+
+# Data version, positions joined to members, members without a position
+POSITIONS_QUERIES = 3
+
+
+@pytest.mark.parametrize("fields", [None, "member_id,party,score"])
+def test_positions_query_count_does_not_grow_with_chamber(client, sql_log, fields):
+    counts = {}
+    for chamber in ("senate", "house", None):
+        positions_cache.clear()
+        sql_log.clear()
+        params = {"chamber": chamber, "fields": fields}
+        response = client.get(
+            "/api/issues/trade-policy/positions",
+            params={key: value for key, value in params.items() if value},
+        )
+        assert response.status_code == 200
+        counts[chamber] = len(sql_log)
+
+    assert counts == {"senate": POSITIONS_QUERIES, "house": POSITIONS_QUERIES, None: POSITIONS_QUERIES}
+
+
+def test_cached_positions_skip_the_payload_queries(client, sql_log):
+    client.get("/api/issues/trade-policy/positions?chamber=house")
+    sql_log.clear()
+    response = client.get("/api/issues/trade-policy/positions?chamber=house")
+    assert response.status_code == 200
+    assert len(sql_log) == 1
+
+
+def baseline_positions(db, slug, chamber=None):
+    """The positions payload as the original per-row endpoint built it."""
+    issue = db.query(Issue).filter(Issue.slug == slug).one()
+    result = []
+    for pos in db.query(Position).filter(Position.issue_id == issue.id).order_by(Position.id):
+        member = db.get(Member, pos.member_id)
+        if chamber and member.chamber != Chamber(chamber):
+            continue
+        result.append({
+            "member_id": member.id,
+            "name": member.name,
+            "state": member.state,
+            "party": member.party.value,
+            "chamber": member.chamber.value,
+            "photo_url": member.photo_url,
+            "score": pos.score,
+            "confidence": pos.confidence,
+            "evidence_count": pos.evidence_count,
+        })
+    result.sort(key=lambda x: x["score"])
+
+    positioned_ids = {p["member_id"] for p in result}
+    member_query = db.query(Member)
+    if chamber:
+        member_query = member_query.filter(Member.chamber == Chamber(chamber))
+    no_data = [
+        {
+            "member_id": member.id,
+            "name": member.name,
+            "state": member.state,
+            "party": member.party.value,
+            "chamber": member.chamber.value,
+            "photo_url": member.photo_url,
+        }
+        for member in member_query.order_by(Member.id)
+        if member.id not in positioned_ids
+    ]
+    no_data.sort(key=lambda x: x["name"])
+
+    return {
+        "issue": {
+            "name": issue.name,
+            "slug": issue.slug,
+            "description": issue.description,
+            "spectrum_left_label": issue.spectrum_left_label,
+            "spectrum_right_label": issue.spectrum_right_label,
+            "spectrum_description": issue.spectrum_description,
+        },
+        "positions": result,
+        "no_data": no_data,
+        "stats": {
+            "total": len(result),
+            "no_data_count": len(no_data),
+            "by_party": {party: [p["party"] for p in result].count(party) for party in ("D", "R", "I")},
+        },
+    }
+
+
+@pytest.mark.parametrize("slug", ["trade-policy", "empty-issue"])
+@pytest.mark.parametrize("chamber", [None, "senate", "house"])
+def test_positions_match_the_baseline_payload(client, slug, chamber):
+    positions_cache.clear()
+    response = client.get(f"/api/issues/{slug}/positions", params={"chamber": chamber} if chamber else {})
+    assert response.status_code == 200
+
+    with SessionLocal() as db:
+        assert response.json() == baseline_positions(db, slug, chamber)
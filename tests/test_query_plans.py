@@ -0,0 +1,101 @@
+"""
+EXPLAIN QUERY PLAN checks for the hot API queries.
+
+Each test makes a real request and explains the statements the ORM
+actually sent, with their parameters, so a query that stops using its
+index fails here instead of degrading in production.
+"""
+from typing import List
+
+from sqlalchemy import event
+
+from api.models import SessionLocal, Statement, engine
+from api.services.cache import positions_cache
+
+
+def query_plan(statement: str, parameters) -> List[str]:
+    """SQLite's query plan for a statement, one detail string per step."""
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", tuple(parameters)).all()
+    return [row[-1] for row in rows]
+
+
+def plans_from(sql_log, table: str) -> List[List[str]]:
+    """Plans of the logged statements that read the given table."""
+    return [
+        query_plan(statement, parameters)
+        for statement, parameters in sql_log
+        if f"FROM {table}" in statement or f"JOIN {table}" in statement
+    ]
+
+
+def assert_no_scan(plans: List[List[str]], table: str):
+    assert plans, f"no query read {table}"
+    for plan in plans:
+        scans = [detail for detail in plan if detail.startswith(f"SCAN {table}")]
+        assert not scans, f"full scan of {table}: {plan}"
+
+
+def test_statement_cursor_seeks_the_date_index(client, sql_log):
+    first = client.get("/api/statements?limit=20").json()
+    sql_log.clear()
+    response = client.get(f"/api/statements?limit=20&cursor={first['next']}")
+    assert response.status_code == 200
+
+    plans = plans_from(sql_log, "statements")
+    assert_no_scan(plans, "statements")
+    assert any("ix_statements_date_id (source_date<?)" in detail for plan in plans for detail in plan)
+
+
+def test_member_statement_cursor_seeks_the_member_index(client, sql_log, seeded_db):
+    member_id = seeded_db[Statement][0]["member_id"]
+    first = client.get(f"/api/members/{member_id}/statements?limit=2").json()
+    sql_log.clear()
+    response = client.get(f"/api/members/{member_id}/statements?limit=2&cursor={first['next']}")
+    assert response.status_code == 200
+
+    assert_no_scan(plans_from(sql_log, "statements"), "statements")
+
+
+def test_issue_positions_use_the_issue_index(client, sql_log):
+    positions_cache.clear()
+    response = client.get("/api/issues/trade-policy/positions?chamber=house")
+    assert response.status_code == 200
+
+    assert_no_scan(plans_from(sql_log, "positions"), "positions")
+
+
+def test_member_detail_uses_member_indexes(client, sql_log):
+    response = client.get("/api/members/H000003?include=evidence,statements")
+    assert response.status_code == 200
+
+    for table in ("positions", "votes", "evidence", "statements"):
+        assert_no_scan(plans_from(sql_log, table), table)
+
+
+def test_member_name_search_uses_the_name_key_indexes(client, sql_log):
+    response = client.get("/api/members?q=member h00")
+    assert response.status_code == 200
+    assert response.json()["count"] > 0
+
+    assert_no_scan(plans_from(sql_log, "members"), "members")
+
+
+def test_scoring_reads_votes_and_evidence_by_index(seeded_db):
+    from scripts.calculate_scores import load_scoring_data
+
+    sql_log = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        sql_log.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        with SessionLocal() as db:
+            load_scoring_data(db, [1])
+            load_scoring_data(db, [1], member_ids=["H000003"])
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    for table in ("votes", "evidence", "positions"):
+        assert_no_scan(plans_from(sql_log, table), table)
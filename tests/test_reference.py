@@ -0,0 +1,97 @@
+"""In-memory reference data: startup warming and reloads on data changes."""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import delete, update
+
+from api.main import load_and_warm
+from api.models import AsyncSessionLocal, Chamber, DataMetadata, Issue, Member, Party, engine
+from api.services.reference import reference_store
+from conftest import SEEDED_AT
+
+NEW_ISSUE = {"name": "Late Issue", "slug": "late-issue", "spectrum_left_label": "Left", "spectrum_right_label": "Right"}
+NEW_MEMBER = {"id": "L000001", "name": "Late Member", "state": "ZZ", "party": Party.INDEPENDENT, "chamber": Chamber.HOUSE}
+
+
+async def refresh_if_changed() -> bool:
+    async with AsyncSessionLocal() as db:
+        return await reference_store.refresh_if_changed(db)
+
+
+async def members_by_id(member_ids):
+    async with AsyncSessionLocal() as db:
+        return await reference_store.members_by_id(db, member_ids)
+
+
+@pytest.fixture
+def late_rows(client):
+    """Remove the rows a test inserts after startup and reload the store."""
+    yield
+    with engine.begin() as conn:
+        conn.execute(delete(Issue).where(Issue.slug == NEW_ISSUE["slug"]))
+        conn.execute(delete(Member).where(Member.id == NEW_MEMBER["id"]))
+        conn.execute(update(DataMetadata).where(DataMetadata.data_type == "members").values(last_updated=SEEDED_AT))
+    client.portal.call(load_and_warm, True)
+
+
+def test_startup_loads_reference_data_and_warms_caches(client, seeded_db):
+    data = reference_store.data
+    assert [issue.slug for issue in data.issues] == [issue["slug"] for issue in seeded_db[Issue]]
+    assert set(data.members) == {member["id"] for member in seeded_db[Member]}
+    # Every issue, for all members and for each chamber
+    assert reference_store.warmed_payloads == 3 * len(seeded_db[Issue])
+
+    body = client.get("/api/_ready").json()
+    assert body["status"] == "ready"
+    assert (body["issues"], body["members"]) == (len(seeded_db[Issue]), len(seeded_db[Member]))
+    assert body["warmed_at"] == reference_store.warmed_at.isoformat()
+    assert body["warmed_payloads"] == reference_store.warmed_payloads
+
+
+def test_unchanged_data_is_not_reloaded(client):
+    data = reference_store.data
+    assert client.portal.call(refresh_if_changed) is False
+    client.portal.call(load_and_warm, True)
+    assert reference_store.data is data
+
+
+def test_issue_added_after_startup_is_found(client, late_rows):
+    with engine.begin() as conn:
+        conn.execute(Issue.__table__.insert(), NEW_ISSUE)
+    assert NEW_ISSUE["slug"] not in reference_store.data.issues_by_slug
+
+    # A slug lookup that misses reloads once the issues table has changed
+    response = client.get(f"/api/issues/{NEW_ISSUE['slug']}")
+    assert response.status_code == 200
+    assert response.json()["name"] == NEW_ISSUE["name"]
+    assert NEW_ISSUE["slug"] in [issue["slug"] for issue in client.get("/api/issues").json()]
+
+
+def test_polling_picks_up_a_new_issue(client, late_rows):
+    data = reference_store.data
+    with engine.begin() as conn:
+        conn.execute(Issue.__table__.insert(), NEW_ISSUE)
+
+    client.portal.call(load_and_warm, True)
+    assert reference_store.data is not data
+    assert NEW_ISSUE["slug"] in reference_store.data.issues_by_slug
+    assert reference_store.warmed_payloads == 3 * len(reference_store.data.issues)
+
+
+def test_member_added_after_startup_is_found_once_recorded(client, late_rows):
+    with engine.begin() as conn:
+        conn.execute(Member.__table__.insert(), NEW_MEMBER)
+
+    # Until a refresh records it in DataMetadata the version hasn't moved
+    assert client.portal.call(members_by_id, [NEW_MEMBER["id"]]) == {}
+
+    with engine.begin() as conn:
+        conn.execute(
+            update(DataMetadata)
+            .where(DataMetadata.data_type == "members")
+            .values(last_updated=datetime(2025, 7, 1))
+        )
+    found = client.portal.call(members_by_id, [NEW_MEMBER["id"], "H000003"])
+    assert set(found) == {NEW_MEMBER["id"], "H000003"}
+    assert found[NEW_MEMBER["id"]].name == NEW_MEMBER["name"]
+    assert client.portal.call(refresh_if_changed) is False
@@ -0,0 +1,21 @@
+"""Response encoding."""
+import warnings
+
+import pytest
+
+from api.services.cache import DefaultJSONResponse
+
+
+@pytest.mark.parametrize("url", ["/", "/api/_ready"])
+def test_default_responses_do_not_warn(client, url):
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        response = client.get(url)
+    assert response.status_code == 200
+    assert [str(w.message) for w in caught] == []
+
+
+def test_default_response_is_compact_json():
+    response = DefaultJSONResponse({"a": [1, None], 2: "b"})
+    assert response.body == b'{"a":[1,null],"2":"b"}'
+    assert response.headers["content-type"] == "application/json"
@@ -0,0 +1,249 @@
+"""Position scoring: the vectorized engine and storing its results."""
+from datetime import datetime
+
+import pandas as pd
+import pytest
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from api.models import Chamber, DataMetadata, Evidence, Issue, Member, Position, SessionLocal, Vote
+from conftest import dataset, load_dataset
+from scripts import calculate_scores
+from scripts.calculate_scores import (
+    calculate_all_positions,
+    calculate_member_position,
+    calculate_positions,
+    find_dirty_pairs,
+    position_records,
+    score_issues,
+    score_positions,
+    store_positions,
+)
+
+SCORE_FIELDS = ("score", "confidence", "vote_score", "statement_score", "vote_count", "statement_count")
+
+
+def test_engine_matches_the_per_member_calculation(seeded_db):
+    with SessionLocal() as db:
+        issues = db.query(Issue).all()
+        members = db.query(Member).all()
+        scored = {
+            (row["member_id"], row["issue_id"]): row
+            for row in position_records(calculate_positions(db, [issue.id for issue in issues]))
+        }
+
+        for issue in issues:
+            for member in members:
+                expected = calculate_member_position(db, member, issue.slug)
+                got = scored.get((member.id, issue.id))
+                if expected["score"] is None:
+                    assert got is None
+                else:
+                    assert {field: got[field] for field in SCORE_FIELDS} == {
+                        field: expected[field] for field in SCORE_FIELDS
+                    }, (member.id, issue.slug)
+
+
+def votes_frame(rows) -> pd.DataFrame:
+    return pd.DataFrame(rows, columns=["member_id", "issue_id", "contribution"])
+
+
+def statements_frame(rows) -> pd.DataFrame:
+    return pd.DataFrame(
+        rows, columns=["member_id", "issue_id", "statement_score", "statement_confidence", "statement_count"]
+    )
+
+
+def test_score_positions_combines_votes_and_statements():
+    votes = votes_frame([
+        ("B", 1, 1.0), ("A", 1, 0.5), ("B", 1, -0.5), ("A", 2, 1.0),
+        ("A", 2, 1.0), ("A", 2, 1.0), ("A", 2, 1.0), ("A", 2, 1.0), ("A", 2, 1.0),
+    ])
+    statements = statements_frame([("A", 1, -0.5, 0.5, 2), ("C", 2, 0.25, 0.4, 1)])
+
+    scores = score_positions(votes, statements)
+
+    assert list(scores.index) == [("A", 1), ("A", 2), ("B", 1), ("C", 2)]
+    assert scores.loc[("A", 1)].to_dict() == pytest.approx({
+        "score": (0.5 * 0.6 - 0.5 * 0.4) / 1.0,
+        "confidence": (0.2 * 0.6 + 0.5 * 0.4) / 1.0,
+        "vote_score": 0.5,
+        "statement_score": -0.5,
+        "vote_count": 1,
+        "statement_count": 2,
+    })
+    # Votes only: confidence capped at MAX_VOTES_FOR_FULL_CONFIDENCE, scaled down
+    assert scores.loc[("A", 2), ["score", "confidence", "vote_count"]].tolist() == [1.0, 0.8, 6]
+    assert scores.loc[("B", 1), ["score", "vote_score", "confidence"]].tolist() == pytest.approx([0.25, 0.25, 0.32])
+    assert pd.isna(scores.loc[("B", 1), "statement_score"])
+    # Statements only
+    assert scores.loc[("C", 2), ["score", "confidence", "vote_count"]].tolist() == pytest.approx([0.25, 0.24, 0])
+    assert pd.isna(scores.loc[("C", 2), "vote_score"])
+
+
+def test_score_positions_clamps_scores():
+    scores = score_positions(votes_frame([("A", 1, 1.5), ("A", 1, 2.5), ("B", 1, -3.0)]), statements_frame([]))
+    assert scores["vote_score"].tolist() == [1.0, -1.0]
+    assert scores["score"].tolist() == [1.0, -1.0]
+
+
+def test_score_positions_of_nothing_is_empty():
+    scores = score_positions(votes_frame([]), statements_frame([]))
+    assert scores.empty
+    assert list(scores.columns) == list(SCORE_FIELDS)
+
+
+def test_score_positions_sums_votes_in_row_order():
+    # Float addition isn't associative; the per-member loop adds in vote id order
+    contributions = [0.1, 0.7, -0.3, 0.2, 0.6, -0.9, 0.4]
+    scores = score_positions(votes_frame([("A", 1, c) for c in contributions]), statements_frame([]))
+
+    total = 0.0
+    for contribution in contributions:
+        total += contribution
+    assert scores.loc[("A", 1), "vote_score"] == total / len(contributions)
+
+
+@pytest.mark.parametrize("chamber", [Chamber.SENATE, Chamber.HOUSE])
+def test_chamber_scores_match_the_per_member_calculation(seeded_db, chamber):
+    with SessionLocal() as db:
+        issues = db.query(Issue).all()
+        members = db.query(Member).filter(Member.chamber == chamber).all()
+        scores = calculate_positions(db, [issue.id for issue in issues], chamber)
+
+        expected = {}
+        for issue in issues:
+            for member in members:
+                position = calculate_member_position(db, member, issue.slug)
+                if position["score"] is not None:
+                    expected[(member.id, issue.id)] = tuple(position[field] for field in SCORE_FIELDS)
+
+    assert {member_id for member_id, _ in scores.index} <= {member.id for member in members}
+    got = {
+        (row["member_id"], row["issue_id"]): tuple(row[field] for field in SCORE_FIELDS)
+        for row in position_records(scores)
+    }
+    assert got == expected
+
+
+def test_member_subsets_score_like_the_full_run(seeded_db):
+    member_ids = ["H000003", "S000001", "Z999999"]
+    with SessionLocal() as db:
+        full = calculate_positions(db, [1, 2])
+        subset = calculate_positions(db, [1, 2], member_ids=member_ids)
+
+    pd.testing.assert_frame_equal(subset, full[full.index.get_level_values("member_id").isin(member_ids)])
+
+
+def test_worker_processes_score_like_a_single_snapshot(scoring_db):
+    issue_ids = [1, 2, 3]
+    single = score_issues(issue_ids, workers=1)
+    pooled = score_issues(issue_ids, workers=2)
+
+    assert not single.empty
+    pd.testing.assert_frame_equal(pooled.sort_index(), single.sort_index(), check_dtype=False)
+
+
+def test_store_positions_writes_only_changes(db_engine):
+    rows = dataset()
+    with db_engine.begin() as conn:
+        conn.execute(Member.__table__.insert(), rows[Member])
+        conn.execute(Issue.__table__.insert(), rows[Issue])
+
+    positions = [
+        {
+            "member_id": member["id"],
+            "issue_id": 1,
+            "score": 0.25,
+            "confidence": 0.5,
+            "vote_score": 0.25,
+            "statement_score": None,
+            "vote_count": 3,
+            "statement_count": 0,
+        }
+        for member in rows[Member]
+    ]
+    with Session(db_engine) as db:
+        assert store_positions(db, positions) == len(positions)
+        assert store_positions(db, positions) == 0
+        positions[0]["score"] = -0.25
+        assert store_positions(db, positions) == 1
+        assert store_positions(db, positions, rescored=True) == len(positions)
+        db.commit()
+        assert db.scalar(select(func.count(Position.id))) == len(positions)
+
+
+@pytest.fixture
+def scoring_db(db_engine, monkeypatch):
+    """db_engine with the test dataset, used by calculate_scores.py in-process."""
+    with db_engine.begin() as conn:
+        load_dataset(conn, dataset())
+    monkeypatch.setattr(calculate_scores, "engine", db_engine)
+    monkeypatch.setattr(calculate_scores, "SessionLocal", sessionmaker(bind=db_engine, autoflush=False))
+    return db_engine
+
+
+def positions_metadata(bind):
+    with Session(bind) as db:
+        metadata = db.scalars(select(DataMetadata).where(DataMetadata.data_type == "positions")).one()
+        return metadata, db.scalar(select(func.count(Position.id)))
+
+
+def test_subset_runs_record_the_total_position_count(scoring_db):
+    calculate_all_positions(workers=1)
+    calculate_all_positions(issue_slugs=["empty-issue"], workers=1)
+    calculate_all_positions(issue_slugs=["trade-policy"], chamber=calculate_scores.Chamber.SENATE, workers=1)
+
+    metadata, total = positions_metadata(scoring_db)
+    assert total > 0
+    assert metadata.record_count == total
+
+
+def test_incremental_runs_with_nothing_dirty_record_the_run(scoring_db):
+    calculate_all_positions(workers=1)
+    before, _ = positions_metadata(scoring_db)
+    calculate_all_positions(incremental=True)
+
+    after, total = positions_metadata(scoring_db)
+    assert after.last_updated > before.last_updated
+    assert after.record_count == total
+
+
+def test_votes_changed_while_scoring_are_dirty_on_the_next_run(scoring_db, monkeypatch):
+    vote = dataset()[Vote][0]
+    score_issues = calculate_scores.score_issues
+
+    def score_then_change_a_vote(*args, **kwargs):
+        scores = score_issues(*args, **kwargs)
+        with scoring_db.begin() as conn:
+            conn.execute(
+                update(Vote).where(Vote.id == vote["id"]).values(updated_at=datetime.utcnow())
+            )
+        return scores
+
+    monkeypatch.setattr(calculate_scores, "score_issues", score_then_change_a_vote)
+    calculate_all_positions(workers=1)
+
+    with Session(scoring_db) as db:
+        dirty = find_dirty_pairs(db, [1, 2])
+    assert (vote["member_id"], 1) in dirty
+
+
+def test_incremental_run_scores_a_chamber_never_scored(db_engine, monkeypatch):
+    # Nothing scored yet, so every House vote predates the Senate positions
+    with db_engine.begin() as conn:
+        load_dataset(conn, {**dataset(), Position: [], Evidence: []})
+    monkeypatch.setattr(calculate_scores, "engine", db_engine)
+    monkeypatch.setattr(calculate_scores, "SessionLocal", sessionmaker(bind=db_engine, autoflush=False))
+
+    calculate_all_positions(chamber=Chamber.SENATE, workers=1)
+    calculate_all_positions(incremental=True)
+
+    with Session(db_engine) as db:
+        stored = set(db.execute(select(Position.member_id, Position.issue_id, Position.score)).all())
+        full = {
+            (row["member_id"], row["issue_id"], row["score"])
+            for row in position_records(calculate_positions(db, [1, 2, 3]))
+        }
+    assert any(member_id.startswith("H") for member_id, _, _ in full)
+    assert stored == full
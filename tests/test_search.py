@@ -0,0 +1,82 @@
+"""Full-text statement search."""
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from api.models import Statement
+from api.services.search import build_match_query, highlight, search_statements
+
+
+def search(client, **params):
+    response = client.get("/api/statements/search", params=params)
+    assert response.status_code == 200, response.text
+    return response.json()["results"]
+
+
+def steel_count(seeded_db) -> dict:
+    return {s["id"]: s["text"].split().count("steel") for s in seeded_db[Statement]}
+
+
+def test_more_matches_rank_first(client, seeded_db):
+    results = search(client, q="steel", limit=200)
+    counts = steel_count(seeded_db)
+    assert len(results) == 200
+    assert [r["rank"] for r in results] == sorted(r["rank"] for r in results)
+    matches = [counts[r["id"]] for r in results]
+    assert matches == sorted(matches, reverse=True)
+    assert matches[0] == 3
+
+
+def test_snippets_mark_the_matched_terms(client):
+    result = search(client, q="steel", limit=1)[0]
+    assert "<mark>steel</mark>" in result["snippet"]
+
+
+def test_snippets_are_escaped():
+    raw = "Tariffs on <b>\x02steel\x03</b> & aluminum"
+    assert highlight(raw) == "Tariffs on &lt;b&gt;<mark>steel</mark>&lt;/b&gt; &amp; aluminum"
+
+
+def test_issue_filter(client, seeded_db):
+    tagged = {s["id"] for s in seeded_db[Statement] if "immigration" in s["issue_tags"]}
+    results = search(client, q="tariff", issue="immigration", limit=200)
+    assert results
+    assert {r["id"] for r in results} <= tagged
+
+
+def test_unknown_issue_is_not_found(client):
+    response = client.get("/api/statements/search", params={"q": "tariff", "issue": "nope"})
+    assert response.status_code == 404
+
+
+@pytest.mark.parametrize("q", ['"steel', "steel AND (", "NEAR(steel", "steel -wages", "^steel"])
+def test_fts_syntax_in_the_query_is_taken_literally(client, q):
+    response = client.get("/api/statements/search", params={"q": q})
+    assert response.status_code == 200
+
+
+def test_prefix_terms_still_match(client):
+    assert build_match_query("tarif* steel") == '"tarif"* "steel"'
+    assert search(client, q="tarif*", limit=1)
+
+
+@pytest.mark.parametrize("q", ["", "   ", "*"])
+def test_empty_query_is_rejected(client, q):
+    response = client.get("/api/statements/search", params={"q": q})
+    assert response.status_code == 400
+
+
+def test_search_needs_sqlite():
+    async def run():
+        bind = create_async_engine("postgresql+psycopg://search@localhost/none")
+        try:
+            async with AsyncSession(bind) as db:
+                await search_statements(db, "steel", 10)
+        finally:
+            await bind.dispose()
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(run())
+    assert error.value.status_code == 501
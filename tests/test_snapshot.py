@@ -0,0 +1,119 @@
+"""Pre-rendered snapshots: export, the current symlink and serving."""
+import gzip
+import json
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import select, update
+
+from api.models import DataMetadata, engine
+from api.services import snapshot
+from api.services.snapshot import MANIFEST_NAME, snapshot_store
+from scripts import export_snapshot as exporter
+
+POSITIONS_URL = "/api/issues/trade-policy/positions"
+POSITIONS_FILE = "api/issues/trade-policy/positions.json"
+
+
+@pytest.fixture
+def processed(tmp_path, monkeypatch, client):
+    """Exports go to a temporary data/processed, served by the API."""
+    monkeypatch.setattr(exporter, "SNAPSHOTS_DIR", tmp_path / "snapshots")
+    monkeypatch.setattr(exporter, "CURRENT_LINK", tmp_path / "current")
+    monkeypatch.setattr(snapshot_store, "link", tmp_path / "current")
+    monkeypatch.setattr(snapshot_store, "enabled", True)
+    return tmp_path
+
+
+def manifest(directory) -> dict:
+    return json.loads((directory / MANIFEST_NAME).read_text())
+
+
+def test_export_publishes_every_response(processed, client):
+    final = exporter.export_snapshot()
+
+    assert (processed / "current").is_symlink()
+    assert (processed / "current").resolve() == final
+    files = manifest(final)["files"]
+    assert {
+        "api/issues.json",
+        "api/members/H000003.json",
+        "api/issues/trade-policy/positions.house.json",
+    } <= set(files)
+
+    snapshot_store.enabled = False
+    live = client.get(POSITIONS_URL, headers={"Accept-Encoding": "identity"})
+    body = (final / POSITIONS_FILE).read_bytes()
+    assert body == live.content
+    assert gzip.decompress((final / (POSITIONS_FILE + ".gz")).read_bytes()) == body
+    assert files[POSITIONS_FILE]["etag"] == live.headers["etag"]
+    assert exporter.snapshot_is_current()
+
+
+def test_a_new_export_swaps_the_link_and_prunes(processed):
+    first = exporter.export_snapshot()
+    leftover = processed / "snapshots" / "20000101T000000000000Z.tmp"
+    leftover.mkdir()
+
+    second = exporter.export_snapshot(keep=1)
+    assert (processed / "current").resolve() == second
+    assert first.exists()
+    assert not leftover.exists()
+
+    third = exporter.export_snapshot(keep=0)
+    assert (processed / "current").resolve() == third
+    assert sorted(p.name for p in (processed / "snapshots").iterdir()) == [third.name]
+
+
+def test_a_failed_export_keeps_the_current_snapshot(processed, monkeypatch):
+    first = exporter.export_snapshot()
+    monkeypatch.setattr(exporter, "snapshot_urls", lambda: ["/api/issues", "/api/members/NOPE"])
+
+    with pytest.raises(RuntimeError):
+        exporter.export_snapshot()
+    assert (processed / "current").resolve() == first
+    assert sorted(p.name for p in (processed / "snapshots").iterdir()) == [first.name]
+
+
+def test_exported_urls_are_served_from_the_snapshot(processed, client):
+    final = exporter.export_snapshot()
+    (final / POSITIONS_FILE).write_bytes(b'{"served":"snapshot"}')
+
+    response = client.get(POSITIONS_URL, headers={"Accept-Encoding": "identity"})
+    assert response.json() == {"served": "snapshot"}
+    assert response.headers["etag"] == manifest(final)["files"][POSITIONS_FILE]["etag"]
+
+    etag = response.headers["etag"]
+    assert client.get(POSITIONS_URL, headers={"If-None-Match": etag}).status_code == 304
+    compressed = client.get(POSITIONS_URL, headers={"Accept-Encoding": "gzip"})
+    assert compressed.headers["content-encoding"] == "gzip"
+
+    # Not exported: answered live
+    assert client.get(POSITIONS_URL + "?fields=score").json() != {"served": "snapshot"}
+
+
+def test_snapshots_of_older_data_are_not_served(processed, client):
+    final = exporter.export_snapshot()
+    (final / POSITIONS_FILE).write_bytes(b'{"served":"snapshot"}')
+    older = dict(manifest(final), data_version=snapshot.version_token(((), (0, None))))
+    (final / MANIFEST_NAME).write_text(json.dumps(older))
+    snapshot_store._manifests.clear()
+
+    response = client.get(POSITIONS_URL, headers={"Accept-Encoding": "identity"})
+    assert "positions" in response.json()
+    assert not exporter.snapshot_is_current()
+
+
+def test_refreshed_data_makes_the_snapshot_outdated(processed, seeded_db):
+    exporter.export_snapshot()
+    assert exporter.snapshot_is_current()
+
+    positions = DataMetadata.data_type == "positions"
+    with engine.begin() as conn:
+        stamp = conn.execute(select(DataMetadata.last_updated).where(positions)).scalar_one()
+        conn.execute(update(DataMetadata).where(positions).values(last_updated=stamp + timedelta(days=1)))
+    try:
+        assert not exporter.snapshot_is_current()
+    finally:
+        with engine.begin() as conn:
+            conn.execute(update(DataMetadata).where(positions).values(last_updated=stamp))
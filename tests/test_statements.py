@@ -0,0 +1,46 @@
+"""Statement listings: keyset pagination."""
+from api.models import Statement
+
+
+def walk_pages(client, url: str, limit: int, **filters) -> list:
+    """Follow next cursors from the first page to the last; return every row."""
+    rows, cursor = [], None
+    while True:
+        params = {"limit": limit, **filters}
+        if cursor:
+            params["cursor"] = cursor
+        page = client.get(url, params=params).json()
+        rows.extend(page["statements"])
+        cursor = page["next"]
+        if cursor is None:
+            return rows
+
+
+def newest_first(statements) -> list:
+    return [
+        s["id"] for s in sorted(statements, key=lambda s: (s["source_date"], s["id"]), reverse=True)
+    ]
+
+
+def test_cursor_pages_cover_every_statement_once(client, seeded_db):
+    rows = walk_pages(client, "/api/statements", limit=37)
+    assert [row["id"] for row in rows] == newest_first(seeded_db[Statement])
+
+
+def test_member_cursor_pages_cover_the_member_statements(client, seeded_db):
+    member_id = seeded_db[Statement][0]["member_id"]
+    rows = walk_pages(client, f"/api/members/{member_id}/statements", limit=3)
+    expected = [s for s in seeded_db[Statement] if s["member_id"] == member_id]
+    assert [row["id"] for row in rows] == newest_first(expected)
+
+
+def test_invalid_cursor_is_rejected(client):
+    response = client.get("/api/statements?cursor=not-a-cursor")
+    assert response.status_code == 400
+
+
+def test_issue_filter_matches_whole_tags(client, seeded_db):
+    rows = walk_pages(client, "/api/statements", limit=50, issue="trade-policy")
+    expected = [s for s in seeded_db[Statement] if "trade-policy" in s["issue_tags"]]
+    assert [row["id"] for row in rows] == newest_first(expected)
+    assert client.get("/api/statements?issue=trade").json()["statements"] == []
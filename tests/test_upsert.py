@@ -0,0 +1,127 @@
+"""INSERT ... ON CONFLICT upserts, on every configured backend."""
+from datetime import datetime
+
+from sqlalchemy import select
+
+from api.models import (
+    STATEMENT_EVIDENCE,
+    Chamber,
+    Evidence,
+    EvidenceType,
+    Issue,
+    Member,
+    Party,
+    Position,
+    upsert,
+)
+
+
+def member(member_id: str, **values) -> dict:
+    row = {
+        "id": member_id,
+        "name": f"Member {member_id}",
+        "state": "CA",
+        "party": Party.DEMOCRAT,
+        "chamber": Chamber.HOUSE,
+        "photo_url": None,
+    }
+    row.update(values)
+    return row
+
+
+def seed_pairs(conn, member_ids):
+    """Members and one issue to hang positions on; returns the issue id."""
+    upsert(conn, Member, [member(member_id) for member_id in member_ids], index_elements=["id"])
+    conn.execute(Issue.__table__.insert().values(name="Trade Policy", slug="trade-policy"))
+    return conn.execute(select(Issue.id)).scalar_one()
+
+
+def test_upsert_inserts_then_updates(db_engine):
+    with db_engine.begin() as conn:
+        upsert(conn, Member, [member("A000001", photo_url="a.jpg"), member("A000002")], ["id"])
+        upsert(conn, Member, [member("A000001", name="Renamed"), member("A000003")], ["id"])
+        rows = dict(conn.execute(select(Member.id, Member.name)).all())
+        photo = conn.execute(select(Member.photo_url).where(Member.id == "A000001")).scalar_one()
+
+    assert rows == {"A000001": "Renamed", "A000002": "Member A000002", "A000003": "Member A000003"}
+    assert photo is None
+
+
+def test_keep_existing_on_null(db_engine):
+    with db_engine.begin() as conn:
+        upsert(conn, Member, [member("A000001", photo_url="a.jpg")], ["id"])
+        upsert(conn, Member, [member("A000001", name="Renamed")], ["id"], keep_existing_on_null=True)
+        name, photo = conn.execute(select(Member.name, Member.photo_url)).one()
+
+    assert (name, photo) == ("Renamed", "a.jpg")
+
+
+def test_skip_unchanged_leaves_unchanged_rows_alone(db_engine):
+    stamp = datetime(2020, 1, 1)
+    with db_engine.begin() as conn:
+        issue_id = seed_pairs(conn, ["A000001", "A000002"])
+        rows = [
+            {"member_id": member_id, "issue_id": issue_id, "score": 0.5, "last_updated": stamp}
+            for member_id in ("A000001", "A000002")
+        ]
+        upsert(conn, Position, rows, ["member_id", "issue_id"], update_columns=["score"])
+
+        rows[1]["score"] = -0.5
+        written = upsert(
+            conn, Position, rows, ["member_id", "issue_id"],
+            update_columns=["score"], skip_unchanged=True,
+        )
+        stored = {
+            member_id: (score, updated)
+            for member_id, score, updated in conn.execute(
+                select(Position.member_id, Position.score, Position.last_updated)
+            )
+        }
+
+    assert written == 1
+    assert stored["A000001"] == (0.5, stamp)
+    assert stored["A000002"][0] == -0.5
+    assert stored["A000002"][1] > stamp
+
+
+def test_partial_key_upserts_statement_evidence_only(db_engine):
+    key = {"source_url": "https://example.org/1", "source_date": datetime(2025, 1, 2)}
+    with db_engine.begin() as conn:
+        issue_id = seed_pairs(conn, ["A000001"])
+        upsert(
+            conn, Position, [{"member_id": "A000001", "issue_id": issue_id, "score": 0.0}],
+            ["member_id", "issue_id"],
+        )
+        position_id = conn.execute(select(Position.id)).scalar_one()
+        conn.execute(
+            Evidence.__table__.insert().values(position_id=position_id, type=EvidenceType.VOTE, **key)
+        )
+
+        def analyze(extracted):
+            return upsert(
+                conn, Evidence,
+                [{"position_id": position_id, "type": EvidenceType.STATEMENT, "extracted_position": extracted, **key}],
+                ["position_id", "source_url", "source_date"],
+                update_columns=["extracted_position"],
+                skip_unchanged=True,
+                index_where=STATEMENT_EVIDENCE,
+            )
+
+        inserted = analyze(0.25)
+        unchanged = analyze(0.25)
+        updated = analyze(-0.75)
+        evidence = conn.execute(
+            select(Evidence.type, Evidence.extracted_position).order_by(Evidence.id)
+        ).all()
+
+    assert (inserted, unchanged, updated) == (1, 0, 1)
+    assert evidence == [(EvidenceType.VOTE, None), (EvidenceType.STATEMENT, -0.75)]
+
+
+def test_empty_update_columns_do_nothing_on_conflict(db_engine):
+    with db_engine.begin() as conn:
+        upsert(conn, Member, [member("A000001")], ["id"])
+        upsert(conn, Member, [member("A000001", name="Renamed")], ["id"], update_columns=[])
+        name = conn.execute(select(Member.name)).scalar_one()
+
+    assert name == "Member A000001"